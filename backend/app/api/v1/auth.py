@@ -2,10 +2,11 @@
 
 from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from app.models.auth import Token, User, UserLogin, UserResponse
 from app.services.auth_service import auth_service
-from app.core.auth_middleware import get_current_active_user
+from app.core.auth_middleware import get_current_active_user, get_current_token_claims
 from app.config import settings
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
@@ -25,7 +26,10 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     Raises:
         HTTPException: If authentication fails
     """
-    user = auth_service.authenticate_user(form_data.username, form_data.password)
+    # bcrypt verification is CPU-bound; keep it off the event loop
+    user = await run_in_threadpool(
+        auth_service.authenticate_user, form_data.username, form_data.password
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -55,7 +59,10 @@ async def login_json(user_login: UserLogin):
     Raises:
         HTTPException: If authentication fails
     """
-    user = auth_service.authenticate_user(user_login.username, user_login.password)
+    # bcrypt verification is CPU-bound; keep it off the event loop
+    user = await run_in_threadpool(
+        auth_service.authenticate_user, user_login.username, user_login.password
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -90,12 +97,12 @@ async def read_users_me(current_user: User = Depends(get_current_active_user)):
 
 
 @router.post("/logout")
-async def logout(current_user: User = Depends(get_current_active_user)):
+async def logout(claims: dict = Depends(get_current_token_claims)):
     """
     Logout endpoint (token invalidation would be handled client-side).
     
     Args:
-        current_user: The current authenticated user
+        claims: The validated token claims
         
     Returns:
         dict: Success message
@@ -106,18 +113,20 @@ async def logout(current_user: User = Depends(get_current_active_user)):
 
 
 @router.get("/verify")
-async def verify_token(current_user: User = Depends(get_current_active_user)):
+async def verify_token(claims: dict = Depends(get_current_token_claims)):
     """
     Verify if the current token is valid.
     
+    Only the token signature and expiry are checked; the user is not loaded.
+    
     Args:
-        current_user: The current authenticated user
+        claims: The validated token claims
         
     Returns:
         dict: Token validity status
     """
     return {
         "valid": True,
-        "username": current_user.username,
+        "username": claims["sub"],
         "message": "Token is valid"
     } 
\ No newline at end of file
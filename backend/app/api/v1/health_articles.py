@@ -1,28 +1,84 @@
 """Health articles API endpoints."""
 
 from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
 import logging
-import json
+import anyio
+import msgspec
+from cachetools import TTLCache
 from fastapi.responses import JSONResponse, StreamingResponse
-from io import StringIO
 from datetime import datetime, timezone
+from beanie import PydanticObjectId, UpdateResponse
+from beanie.operators import Set
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING, UpdateOne
 
 from app.models.health_article import (
     HealthArticle,
     HealthArticleCreate,
     HealthArticleUpdate,
     HealthArticleResponse,
+    HealthArticleResponseStruct,
+    HealthArticleProjection,
     CategoryEnum,
     ProcessingStatus
 )
 from app.services.app_database_uploader import app_uploader
 from app.core.auth_middleware import get_current_active_user
+from app.core.responses import MsgspecJSONResponse
 from app.models.auth import User
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(dependencies=[Depends(get_current_active_user)])
+# Plain dict results (delete/approve/reject/upload) are encoded with msgspec
+# rather than the stdlib json module as well
+router = APIRouter(
+    dependencies=[Depends(get_current_active_user)],
+    default_response_class=MsgspecJSONResponse
+)
+
+
+# Recent find_similar_articles results keyed by (article_id, limit). Entries
+# expire after a minute; tag and category edits are rare enough for that.
+_similar_cache: TTLCache = TTLCache(maxsize=2048, ttl=60)
+# Uncached find_similar_articles queries in flight, by the same key
+_similar_pending: Dict[Tuple[str, int], asyncio.Future] = {}
+
+# get_export_summary results keyed by source_pdf_id (None for all PDFs). The
+# dashboard polls this endpoint; writes made here clear it right away, and
+# articles created by PDF processing show up once the TTL expires.
+_summary_cache: TTLCache = TTLCache(maxsize=64, ttl=10)
+
+# Approved articles that haven't been uploaded to the app database yet.
+# Shared template: copy it before adding request-specific filters.
+_READY_TO_UPLOAD_FILTER = {
+    "processing_status": ProcessingStatus.APPROVED.value,
+    "app_article_id": None
+}
+
+# Index hints (see HealthArticle.Settings.indexes) for queries where the
+# planner may otherwise pick a single-field index and sort in memory
+_UPLOAD_QUEUE_HINT = [
+    ("processing_status", ASCENDING),
+    ("app_article_id", ASCENDING),
+    ("created_at", DESCENDING)
+]
+_BY_PDF_HINT = [("source_pdf_id", ASCENDING), ("created_at", DESCENDING)]
+
+# Maximum number of articles uploaded to the app database at once when
+# streaming progress (one upload per article)
+_APP_UPLOAD_CONCURRENCY = 16
+
+# Zero-filled export summary breakdowns; copy before filling in counts
+_EMPTY_STATUS_COUNTS = dict.fromkeys((status.value for status in ProcessingStatus), 0)
+_EMPTY_CATEGORY_COUNTS = dict.fromkeys((category.value for category in CategoryEnum), 0)
+
+
+def _check_article_id(article_id: str) -> None:
+    """Reject malformed article ids before they reach MongoDB."""
+    if not ObjectId.is_valid(article_id):
+        raise HTTPException(status_code=404, detail="Article not found")
 
 
 @router.post("/", response_model=HealthArticleResponse)
@@ -31,29 +87,13 @@ async def create_article(article_data: HealthArticleCreate):
     
     try:
         # Create new article
-        article = HealthArticle(**article_data.dict())
+        article = HealthArticle(**article_data.model_dump())
         await article.insert()
+        _summary_cache.clear()
         
         logger.info(f"Article created: {article.title}")
         
-        return HealthArticleResponse(
-            id=str(article.id),
-            title=article.title,
-            category=article.category,
-            image_url=article.image_url,
-            medical_condition_tags=article.medical_condition_tags,
-            content=article.content,
-            source_pdf_id=article.source_pdf_id,
-            chunk_id=article.chunk_id,
-            processing_status=article.processing_status,
-            app_article_id=article.app_article_id,
-            reading_level_score=article.reading_level_score,
-            similarity_scores=article.similarity_scores,
-            created_at=article.created_at,
-            updated_at=article.updated_at,
-            reviewed_at=article.reviewed_at,
-            reviewer_notes=article.reviewer_notes
-        )
+        return MsgspecJSONResponse(content=HealthArticleResponseStruct.from_article(article))
         
     except Exception as e:
         logger.error(f"Error creating article: {e}")
@@ -64,29 +104,14 @@ async def create_article(article_data: HealthArticleCreate):
 async def get_article(article_id: str):
     """Get a specific health article by ID."""
     
+    _check_article_id(article_id)
+    
     try:
         article = await HealthArticle.get(article_id)
         if not article:
             raise HTTPException(status_code=404, detail="Article not found")
         
-        return HealthArticleResponse(
-            id=str(article.id),
-            title=article.title,
-            category=article.category,
-            image_url=article.image_url,
-            medical_condition_tags=article.medical_condition_tags,
-            content=article.content,
-            source_pdf_id=article.source_pdf_id,
-            chunk_id=article.chunk_id,
-            processing_status=article.processing_status,
-            app_article_id=article.app_article_id,
-            reading_level_score=article.reading_level_score,
-            similarity_scores=article.similarity_scores,
-            created_at=article.created_at,
-            updated_at=article.updated_at,
-            reviewed_at=article.reviewed_at,
-            reviewer_notes=article.reviewer_notes
-        )
+        return MsgspecJSONResponse(content=HealthArticleResponseStruct.from_article(article))
         
     except HTTPException:
         raise
@@ -99,41 +124,24 @@ async def get_article(article_id: str):
 async def update_article(article_id: str, article_data: HealthArticleUpdate):
     """Update a health article."""
     
+    _check_article_id(article_id)
+    
     try:
-        article = await HealthArticle.get(article_id)
+        # Update only the fields that are provided, plus the timestamp
+        update_data = article_data.model_dump(exclude_unset=True)
+        update_data["updated_at"] = datetime.now(timezone.utc)
+        
+        # Atomic findAndModify: one round-trip instead of a read plus a write
+        article = await HealthArticle.find_one(
+            HealthArticle.id == PydanticObjectId(article_id)
+        ).update(Set(update_data), response_type=UpdateResponse.NEW_DOCUMENT)
         if not article:
             raise HTTPException(status_code=404, detail="Article not found")
-        
-        # Update fields that are provided
-        update_data = article_data.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(article, field, value)
-        
-        # Update timestamp
-        article.updated_at = datetime.now(timezone.utc)
-        
-        await article.save()
+        _summary_cache.clear()
         
         logger.info(f"Article updated: {article.title}")
         
-        return HealthArticleResponse(
-            id=str(article.id),
-            title=article.title,
-            category=article.category,
-            image_url=article.image_url,
-            medical_condition_tags=article.medical_condition_tags,
-            content=article.content,
-            source_pdf_id=article.source_pdf_id,
-            chunk_id=article.chunk_id,
-            processing_status=article.processing_status,
-            app_article_id=article.app_article_id,
-            reading_level_score=article.reading_level_score,
-            similarity_scores=article.similarity_scores,
-            created_at=article.created_at,
-            updated_at=article.updated_at,
-            reviewed_at=article.reviewed_at,
-            reviewer_notes=article.reviewer_notes
-        )
+        return MsgspecJSONResponse(content=HealthArticleResponseStruct.from_article(article))
         
     except HTTPException:
         raise
@@ -146,12 +154,15 @@ async def update_article(article_id: str, article_data: HealthArticleUpdate):
 async def delete_article(article_id: str):
     """Delete a health article."""
     
+    _check_article_id(article_id)
+    
     try:
         article = await HealthArticle.get(article_id)
         if not article:
             raise HTTPException(status_code=404, detail="Article not found")
         
         await article.delete()
+        _summary_cache.clear()
         
         logger.info(f"Article deleted: {article.title}")
         return {"message": "Article deleted successfully"}
@@ -170,9 +181,17 @@ async def list_articles(
     category: Optional[CategoryEnum] = None,
     status: Optional[ProcessingStatus] = None,
     search: Optional[str] = None,
-    tags: Optional[List[str]] = Query(None)
+    tags: Optional[List[str]] = Query(None),
+    cursor: Optional[str] = Query(
+        None, description="X-Next-Cursor value from the previous page; replaces page"
+    )
 ):
-    """List health articles with filtering and pagination."""
+    """List health articles with filtering and pagination.
+    
+    Pages can be fetched by number, or by passing the ``X-Next-Cursor``
+    header of the previous page as ``cursor``. Cursor pagination seeks on
+    ``_id`` instead of skipping, so deep pages cost the same as the first.
+    """
     
     try:
         # Build query
@@ -187,42 +206,50 @@ async def list_articles(
         if tags:
             query_filters["medical_condition_tags"] = {"$in": tags}
         
-        # Start query
-        query = HealthArticle.find(query_filters)
-        
-        # Add text search if provided
+        # Add text search if provided (served by the title/content text index)
+        # and rank matches by relevance, newest first among equal scores.
+        # Otherwise newest first by _id, the order cursor pages seek on:
+        # created_at only matches it for ids generated in the same process
+        # and values never edited, so sorting by it could skip or repeat
+        # articles at page boundaries
         if search:
-            query = query.find({"$text": {"$search": search}})
+            query_filters["$text"] = {"$search": search}
+            sort_order = [("score", {"$meta": "textScore"}), ("created_at", DESCENDING)]
+        else:
+            sort_order = [("_id", DESCENDING)]
         
         # Apply pagination
-        skip = (page - 1) * per_page
-        articles = await query.sort(-HealthArticle.created_at).skip(skip).limit(per_page).to_list()
+        if cursor:
+            if search:
+                raise HTTPException(
+                    status_code=400,
+                    detail="cursor pagination is not supported with search"
+                )
+            if not ObjectId.is_valid(cursor):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            
+            query_filters["_id"] = {"$lt": ObjectId(cursor)}
+            skip = 0
+        else:
+            skip = (page - 1) * per_page
+        
+        articles = await (
+            HealthArticle.find(query_filters, projection_model=HealthArticleProjection)
+            .sort(sort_order).skip(skip).limit(per_page).to_list()
+        )
         
         # Convert to response format
-        responses = [
-            HealthArticleResponse(
-                id=str(article.id),
-                title=article.title,
-                category=article.category,
-                image_url=article.image_url,
-                medical_condition_tags=article.medical_condition_tags,
-                content=article.content,
-                source_pdf_id=article.source_pdf_id,
-                chunk_id=article.chunk_id,
-                processing_status=article.processing_status,
-                app_article_id=article.app_article_id,
-                reading_level_score=article.reading_level_score,
-                similarity_scores=article.similarity_scores,
-                created_at=article.created_at,
-                updated_at=article.updated_at,
-                reviewed_at=article.reviewed_at,
-                reviewer_notes=article.reviewer_notes
-            )
-            for article in articles
-        ]
+        responses = [HealthArticleResponseStruct.from_article(article) for article in articles]
         
-        return responses
+        headers = {}
+        if not search and len(articles) == per_page:
+            headers["X-Next-Cursor"] = str(articles[-1].id)
         
+        # Full article bodies: encode off the event loop
+        return await MsgspecJSONResponse.create(responses, headers=headers)
+        
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing articles: {e}")
         raise HTTPException(status_code=500, detail="Failed to list articles")
@@ -235,44 +262,26 @@ async def find_similar_articles(
 ):
     """Find articles similar to the given article (placeholder for now)."""
     
+    _check_article_id(article_id)
+    
+    cache_key = (article_id, limit)
+    cached = _similar_cache.get(cache_key)
+    if cached is not None:
+        return MsgspecJSONResponse(content=cached)
+    
     try:
-        article = await HealthArticle.get(article_id)
-        if not article:
-            raise HTTPException(status_code=404, detail="Article not found")
-        
-        # TODO: Implement similarity search using embeddings
-        # For now, return articles with same category or overlapping tags
-        similar_articles = await HealthArticle.find({
-            "$or": [
-                {"category": article.category},
-                {"medical_condition_tags": {"$in": article.medical_condition_tags}}
-            ],
-            "_id": {"$ne": article.id}
-        }).limit(limit).to_list()
-        
-        responses = [
-            HealthArticleResponse(
-                id=str(similar.id),
-                title=similar.title,
-                category=similar.category,
-                image_url=similar.image_url,
-                medical_condition_tags=similar.medical_condition_tags,
-                content=similar.content,
-                source_pdf_id=similar.source_pdf_id,
-                chunk_id=similar.chunk_id,
-                processing_status=similar.processing_status,
-                app_article_id=similar.app_article_id,
-                reading_level_score=similar.reading_level_score,
-                similarity_scores=similar.similarity_scores,
-                created_at=similar.created_at,
-                updated_at=similar.updated_at,
-                reviewed_at=similar.reviewed_at,
-                reviewer_notes=similar.reviewer_notes
-            )
-            for similar in similar_articles
-        ]
-        
-        return responses
+        # Concurrent misses for the same key share a single query, until it
+        # completes
+        pending = _similar_pending.get(cache_key)
+        if pending is None:
+            pending = asyncio.ensure_future(_query_similar_articles(article_id, limit))
+            _similar_pending[cache_key] = pending
+            pending.add_done_callback(lambda _: _similar_pending.pop(cache_key, None))
+        # Shielded, so a cancelled caller doesn't cancel the others' query
+        cached = await asyncio.shield(pending)
+        _similar_cache[cache_key] = cached
+        
+        return MsgspecJSONResponse(content=cached)
         
     except HTTPException:
         raise
@@ -281,10 +290,47 @@ async def find_similar_articles(
         raise HTTPException(status_code=500, detail="Failed to find similar articles")
 
 
+async def _query_similar_articles(
+    article_id: str, limit: int
+) -> List[HealthArticleResponseStruct]:
+    """Query the articles similar to ``article_id`` as response structs."""
+    article = await HealthArticle.get(article_id)
+    if not article:
+        raise HTTPException(status_code=404, detail="Article not found")
+    
+    # TODO: Implement similarity search using embeddings
+    # For now, return articles with same category or overlapping tags,
+    # ranked server-side by how many tags they share
+    pipeline = [
+        {"$match": {
+            "$or": [
+                {"category": article.category},
+                {"medical_condition_tags": {"$in": article.medical_condition_tags}}
+            ],
+            "_id": {"$ne": article.id}
+        }},
+        {"$addFields": {
+            "_overlap": {"$size": {"$setIntersection": [
+                {"$ifNull": ["$medical_condition_tags", []]},
+                article.medical_condition_tags
+            ]}}
+        }},
+        {"$sort": {"_overlap": -1, "created_at": -1}},
+        {"$limit": limit}
+    ]
+    similar_articles = await HealthArticle.aggregate(
+        pipeline, projection_model=HealthArticleProjection
+    ).to_list()
+    
+    return [HealthArticleResponseStruct.from_article(similar) for similar in similar_articles]
+
+
 @router.post("/{article_id}/approve")
 async def approve_article(article_id: str):
     """Approve an article for publication and upload to app database."""
     
+    _check_article_id(article_id)
+    
     try:
         article = await HealthArticle.get(article_id)
         if not article:
@@ -306,12 +352,14 @@ async def approve_article(article_id: str):
             )
         
         # Update article status and app database reference
-        article.processing_status = ProcessingStatus.UPLOADED  # Changed from APPROVED to UPLOADED
-        article.app_article_id = app_article_id
-        article.reviewed_at = datetime.now(timezone.utc)
-        article.updated_at = datetime.now(timezone.utc)
-        
-        await article.save()
+        now = datetime.now(timezone.utc)
+        await article.set({
+            HealthArticle.processing_status: ProcessingStatus.UPLOADED,  # Changed from APPROVED to UPLOADED
+            HealthArticle.app_article_id: app_article_id,
+            HealthArticle.reviewed_at: now,
+            HealthArticle.updated_at: now
+        })
+        _summary_cache.clear()
         
         logger.info(f"Article approved and uploaded to app database: {article.title} (App ID: {app_article_id})")
         return {
@@ -330,19 +378,25 @@ async def approve_article(article_id: str):
 async def reject_article(article_id: str, reason: str = ""):
     """Reject an article."""
     
+    _check_article_id(article_id)
+    
     try:
-        article = await HealthArticle.get(article_id)
-        if not article:
-            raise HTTPException(status_code=404, detail="Article not found")
-        
-        article.processing_status = ProcessingStatus.REJECTED
+        now = datetime.now(timezone.utc)
+        update_fields = {
+            HealthArticle.processing_status: ProcessingStatus.REJECTED,
+            HealthArticle.reviewed_at: now,
+            HealthArticle.updated_at: now
+        }
         if reason:
-            article.reviewer_notes = reason
-        
-        article.reviewed_at = datetime.now(timezone.utc)
-        article.updated_at = datetime.now(timezone.utc)
+            update_fields[HealthArticle.reviewer_notes] = reason
         
-        await article.save()
+        # Atomic findAndModify: one round-trip instead of a read plus a write
+        article = await HealthArticle.find_one(
+            HealthArticle.id == PydanticObjectId(article_id)
+        ).update(Set(update_fields), response_type=UpdateResponse.NEW_DOCUMENT)
+        if not article:
+            raise HTTPException(status_code=404, detail="Article not found")
+        _summary_cache.clear()
         
         logger.info(f"Article rejected: {article.title}")
         return {"message": "Article rejected successfully"}
@@ -358,16 +412,14 @@ async def reject_article(article_id: str, reason: str = ""):
 async def upload_articles_to_app_database(
     category: Optional[CategoryEnum] = None,
     tags: Optional[List[str]] = Query(None),
-    source_pdf_id: Optional[str] = Query(None, description="Filter by source PDF ID")
+    source_pdf_id: Optional[str] = Query(None, description="Filter by source PDF ID"),
+    stream: bool = Query(False, description="Stream NDJSON progress events instead of a single summary")
 ):
     """Upload approved articles directly to the app database (educational_content collection)."""
     
     try:
         # Build query filters - only get approved articles that haven't been uploaded
-        query_filters = {
-            "processing_status": ProcessingStatus.APPROVED,  # Only approved articles
-            "app_article_id": None  # That haven't been uploaded yet
-        }
+        query_filters = _READY_TO_UPLOAD_FILTER.copy()
         
         if category:
             query_filters["category"] = category
@@ -378,8 +430,17 @@ async def upload_articles_to_app_database(
         if source_pdf_id:
             query_filters["source_pdf_id"] = source_pdf_id
         
+        filters_applied = {
+            "category": category.value if category else None,
+            "tags": tags,
+            "source_pdf_id": source_pdf_id
+        }
+        
         # Get the filtered articles
-        articles = await HealthArticle.find(query_filters).sort(-HealthArticle.created_at).to_list()
+        articles = await (
+            HealthArticle.find(query_filters, hint=_UPLOAD_QUEUE_HINT)
+            .sort(-HealthArticle.created_at).to_list()
+        )
         
         if not articles:
             return {
@@ -387,69 +448,47 @@ async def upload_articles_to_app_database(
                 "total_articles": 0,
                 "uploaded_articles": 0,
                 "failed_articles": 0,
-                "filters_applied": {
-                    "category": category.value if category else None,
-                    "tags": tags,
-                    "source_pdf_id": source_pdf_id
-                }
+                "filters_applied": filters_applied
             }
         
-        # Upload articles to app database
-        uploaded_count = 0
-        failed_count = 0
-        failed_articles = []
+        if stream:
+            return StreamingResponse(
+                _stream_upload_progress(articles, filters_applied),
+                media_type="application/x-ndjson"
+            )
         
+        # Upload every article that has an image in one batch
+        failed_articles = []
+        ready = []
         for article in articles:
-            try:
-                # Check if article has required fields
-                if not article.image_url:
-                    logger.warning(f"Skipping article without image URL: {article.title}")
-                    failed_count += 1
-                    failed_articles.append({
-                        "title": article.title,
-                        "reason": "Missing image URL"
-                    })
-                    continue
-                
-                # Upload to app database
-                app_article_id = await app_uploader.upload_article(article)
-                
-                if app_article_id:
-                    # Update the health article with app database reference and status
-                    article.app_article_id = app_article_id
-                    article.processing_status = ProcessingStatus.UPLOADED  # Mark as uploaded
-                    article.updated_at = datetime.now(timezone.utc)
-                    await article.save()
-                    
-                    uploaded_count += 1
-                    logger.info(f"Exported article to app database: {article.title} (App ID: {app_article_id})")
-                else:
-                    failed_count += 1
-                    failed_articles.append({
-                        "title": article.title,
-                        "reason": "Upload failed"
-                    })
-                    
-            except Exception as e:
-                failed_count += 1
-                failed_articles.append({
-                    "title": article.title,
-                    "reason": str(e)
-                })
-                logger.error(f"Failed to export article {article.title}: {e}")
+            if article.image_url:
+                ready.append(article)
+            else:
+                logger.warning(f"Skipping article without image URL: {article.title}")
+                failed_articles.append({"title": article.title, "reason": "Missing image URL"})
+        
+        uploads = []
+        app_article_ids = await app_uploader.upload_articles(ready)
+        for article, app_article_id in zip(ready, app_article_ids):
+            if app_article_id:
+                uploads.append((article, app_article_id))
+            else:
+                failed_articles.append({"title": article.title, "reason": "Upload failed"})
+        
+        now = datetime.now(timezone.utc)
+        await _mark_articles_uploaded(uploads, now)
+        
+        failed_count = len(failed_articles)
+        uploaded_count = len(uploads)
         
         # Return summary
         result = {
             "message": f"Upload completed: {uploaded_count} articles uploaded, {failed_count} failed",
-            "uploaded_at": datetime.now(timezone.utc).isoformat(),
+            "uploaded_at": now.isoformat(),
             "total_articles": len(articles),
             "uploaded_articles": uploaded_count,
             "failed_articles": failed_count,
-            "filters_applied": {
-                "category": category.value if category else None,
-                "tags": tags,
-                "source_pdf_id": source_pdf_id
-            }
+            "filters_applied": filters_applied
         }
         
         if failed_articles:
@@ -462,6 +501,118 @@ async def upload_articles_to_app_database(
         raise HTTPException(status_code=500, detail="Failed to upload articles to app database")
 
 
+async def _upload_article_to_app(
+    article: HealthArticle, semaphore: asyncio.Semaphore
+) -> Tuple[Optional[str], Optional[str]]:
+    """Upload one approved article to the app database.
+    
+    Returns:
+        Tuple of (app_article_id, failure_reason); exactly one is set
+    """
+    # Check if article has required fields
+    if not article.image_url:
+        logger.warning(f"Skipping article without image URL: {article.title}")
+        return None, "Missing image URL"
+    
+    try:
+        async with semaphore:
+            # Upload to app database
+            app_article_id = await app_uploader.upload_article(article)
+        
+        if not app_article_id:
+            return None, "Upload failed"
+        
+        logger.info(f"Exported article to app database: {article.title} (App ID: {app_article_id})")
+        return app_article_id, None
+        
+    except Exception as e:
+        logger.error(f"Failed to export article {article.title}: {e}")
+        return None, str(e)
+
+
+async def _mark_articles_uploaded(
+    uploads: List[Tuple[HealthArticle, str]], now: datetime
+) -> None:
+    """Record app database references and status in one batched write.
+    
+    Every article gets the same ``updated_at``, the time of the batch.
+    """
+    if not uploads:
+        return
+    
+    bulk_ops = [
+        UpdateOne(
+            {"_id": article.id},
+            {"$set": {
+                "app_article_id": app_article_id,
+                "processing_status": ProcessingStatus.UPLOADED.value,  # Mark as uploaded
+                "updated_at": now
+            }}
+        )
+        for article, app_article_id in uploads
+    ]
+    await HealthArticle.get_motor_collection().bulk_write(bulk_ops, ordered=False)
+    _summary_cache.clear()
+
+
+async def _stream_upload_progress(
+    articles: List[HealthArticle], filters_applied: dict
+) -> AsyncIterator[bytes]:
+    """Upload articles to the app database, yielding NDJSON progress events.
+    
+    Emits a ``start`` event, one ``progress`` event per article as its upload
+    finishes, and a final ``done`` event with the totals. Failures are
+    reported as they happen rather than collected into one response body.
+    """
+    semaphore = asyncio.Semaphore(_APP_UPLOAD_CONCURRENCY)
+    
+    async def upload(article: HealthArticle):
+        return article, await _upload_article_to_app(article, semaphore)
+    
+    yield msgspec.json.encode({"event": "start", "total": len(articles)}) + b"\n"
+    
+    tasks = [asyncio.create_task(upload(article)) for article in articles]
+    failed_count = 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            article, (app_article_id, reason) = await next_done
+            if reason is not None:
+                failed_count += 1
+            
+            yield msgspec.json.encode({
+                "event": "progress",
+                "title": article.title,
+                "ok": reason is None,
+                "reason": reason
+            }) + b"\n"
+    finally:
+        # If the client went away, stop uploads that are still pending but
+        # record every one that already made it to the app database
+        for task in tasks:
+            task.cancel()
+        uploads = [
+            (article, app_article_id)
+            for task in tasks
+            if task.done() and not task.cancelled()
+            for article, (app_article_id, _) in (task.result(),)
+            if app_article_id
+        ]
+        now = datetime.now(timezone.utc)
+        # Shielded: on a disconnect Starlette has already cancelled this
+        # scope, which would cancel the write (and the cache clear) too
+        with anyio.CancelScope(shield=True):
+            await _mark_articles_uploaded(uploads, now)
+    
+    yield msgspec.json.encode({
+        "event": "done",
+        "message": f"Upload completed: {len(uploads)} articles uploaded, {failed_count} failed",
+        "uploaded_at": now.isoformat(),
+        "total_articles": len(articles),
+        "uploaded_articles": len(uploads),
+        "failed_articles": failed_count,
+        "filters_applied": filters_applied
+    }) + b"\n"
+
 
 @router.get("/by-pdf/{pdf_id}")
 async def get_articles_by_pdf(
@@ -478,34 +629,21 @@ async def get_articles_by_pdf(
         # Build query
         query_filters = {"source_pdf_id": pdf_id}
         
-        # Get articles and count
-        articles = await HealthArticle.find(query_filters).sort(-HealthArticle.created_at).skip(skip).limit(per_page).to_list()
-        total_count = await HealthArticle.find(query_filters).count()
+        # Get articles and count concurrently
+        articles, total_count = await asyncio.gather(
+            HealthArticle.find(
+                query_filters,
+                projection_model=HealthArticleProjection,
+                hint=_BY_PDF_HINT
+            ).sort(-HealthArticle.created_at).skip(skip).limit(per_page).to_list(),
+            HealthArticle.find(query_filters).count()
+        )
         
         # Convert to response format
-        article_responses = []
-        for article in articles:
-            article_response = HealthArticleResponse(
-                id=str(article.id),
-                title=article.title,
-                category=article.category,
-                image_url=article.image_url,
-                medical_condition_tags=article.medical_condition_tags,
-                content=article.content,
-                source_pdf_id=article.source_pdf_id,
-                chunk_id=article.chunk_id,
-                processing_status=article.processing_status,
-                app_article_id=article.app_article_id,
-                reading_level_score=article.reading_level_score,
-                similarity_scores=article.similarity_scores,
-                created_at=article.created_at,
-                updated_at=article.updated_at,
-                reviewed_at=article.reviewed_at,
-                reviewer_notes=article.reviewer_notes
-            )
-            article_responses.append(article_response)
+        article_responses = [HealthArticleResponseStruct.from_article(article) for article in articles]
         
-        return {
+        # Full article bodies: encode off the event loop
+        return await MsgspecJSONResponse.create({
             "articles": article_responses,
             "pagination": {
                 "page": page,
@@ -514,7 +652,7 @@ async def get_articles_by_pdf(
                 "pages": (total_count + per_page - 1) // per_page
             },
             "pdf_id": pdf_id
-        }
+        })
         
     except Exception as e:
         logger.error(f"Error getting articles by PDF {pdf_id}: {e}")
@@ -527,38 +665,61 @@ async def get_export_summary(
 ):
     """Get summary statistics for export."""
     
+    cached = _summary_cache.get(source_pdf_id)
+    if cached is not None:
+        return MsgspecJSONResponse(content=cached)
+    
     try:
         # Base query filter
         base_filter = {}
         if source_pdf_id:
             base_filter["source_pdf_id"] = source_pdf_id
         
+        # Gather every count and the recent articles in a single round-trip
+        pipeline = [
+            {"$facet": {
+                "by_status": [
+                    {"$group": {"_id": "$processing_status", "count": {"$sum": 1}}}
+                ],
+                "by_category": [
+                    {"$group": {"_id": "$category", "count": {"$sum": 1}}}
+                ],
+                "total": [{"$count": "count"}],
+                "ready_to_upload": [
+                    {"$match": _READY_TO_UPLOAD_FILTER},
+                    {"$count": "count"}
+                ],
+                "recent": [
+                    {"$sort": {"created_at": -1}},
+                    {"$limit": 5},
+                    {"$project": {
+                        "title": 1,
+                        "category": 1,
+                        "processing_status": 1,
+                        "source_pdf_id": 1,
+                        "created_at": 1
+                    }}
+                ]
+            }}
+        ]
+        results = await HealthArticle.find(base_filter).aggregate(pipeline).to_list()
+        facets = results[0]
+        
         # Get counts by status
-        status_counts = {}
-        for status in ProcessingStatus:
-            query_filter = {**base_filter, "processing_status": status}
-            count = await HealthArticle.find(query_filter).count()
-            status_counts[status.value] = count
+        status_counts = _EMPTY_STATUS_COUNTS.copy()
+        for group in facets["by_status"]:
+            if group["_id"] in status_counts:
+                status_counts[group["_id"]] = group["count"]
         
         # Get counts by category
-        category_counts = {}
-        for category in CategoryEnum:
-            query_filter = {**base_filter, "category": category}
-            count = await HealthArticle.find(query_filter).count()
-            category_counts[category.value] = count
+        category_counts = _EMPTY_CATEGORY_COUNTS.copy()
+        for group in facets["by_category"]:
+            if group["_id"] in category_counts:
+                category_counts[group["_id"]] = group["count"]
         
-        # Get total articles
-        total_articles = await HealthArticle.find(base_filter).count()
-        
-        # Get count of articles ready to upload (approved but not uploaded)
-        ready_to_upload = await HealthArticle.find({
-            **base_filter,
-            "processing_status": ProcessingStatus.APPROVED,
-            "app_article_id": None
-        }).count()
-        
-        # Get recent articles
-        recent_articles = await HealthArticle.find(base_filter).sort(-HealthArticle.created_at).limit(5).to_list()
+        total_articles = facets["total"][0]["count"] if facets["total"] else 0
+        ready_to_upload = facets["ready_to_upload"][0]["count"] if facets["ready_to_upload"] else 0
+        recent_articles = facets["recent"]
         
         summary = {
             "total_articles": total_articles,
@@ -568,18 +729,21 @@ async def get_export_summary(
             "source_pdf_id": source_pdf_id,
             "recent_articles": [
                 {
-                    "id": str(article.id),
-                    "title": article.title,
-                    "category": article.category,
-                    "status": article.processing_status,
-                    "source_pdf_id": article.source_pdf_id,
-                    "created_at": article.created_at.isoformat()
+                    "id": str(article["_id"]),
+                    "title": article["title"],
+                    "category": article["category"],
+                    "status": article["processing_status"],
+                    "source_pdf_id": article.get("source_pdf_id"),
+                    "created_at": article["created_at"]
                 }
                 for article in recent_articles
             ]
         }
         
-        return summary
+        _summary_cache[source_pdf_id] = summary
+        
+        # msgspec serializes the datetimes natively, no per-item isoformat()
+        return MsgspecJSONResponse(content=summary)
         
     except Exception as e:
         logger.error(f"Error getting export summary: {e}")
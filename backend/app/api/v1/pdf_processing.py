@@ -1,13 +1,14 @@
 """PDF processing API endpoints."""
 
+import asyncio
 import os
+import shutil
 import uuid
-import aiofiles
 from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Query, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
-from typing import List, Optional
+from typing import BinaryIO, Optional
 import logging
-from datetime import datetime, timezone
 
 from app.config import settings
 from app.models.pdf_document import (
@@ -15,14 +16,54 @@ from app.models.pdf_document import (
     PDFUploadResponse, 
     PDFProcessingResponse,
     PDFListResponse,
+    PDFListProjection,
     PDFProcessingStatus
 )
+from app.models.health_article import HealthArticle
 from app.core.auth_middleware import get_current_active_user
+from app.core.responses import MsgspecJSONResponse
+from app.services.pdf_pipeline import process_pdf_background
+from app.tasks.pdf import process_pdf_task
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(dependencies=[Depends(get_current_active_user)])
 
+# Starlette keeps uploads up to this size in memory and spools larger ones
+# to a temporary file on disk
+_UPLOAD_SPOOL_SIZE = 1024 * 1024
+
+
+def _pdf_to_dict(pdf_doc: PDFDocument) -> dict:
+    """Build the API representation of a PDF document's processing status.
+
+    Returned through ``MsgspecJSONResponse`` so FastAPI skips
+    ``jsonable_encoder`` and the ``response_model`` validation pass.
+    """
+    return {
+        "id": str(pdf_doc.id),
+        "filename": pdf_doc.original_filename,
+        "processing_status": pdf_doc.processing_status,
+        "total_pages": pdf_doc.total_pages,
+        "total_chunks": pdf_doc.total_chunks,
+        "total_articles_generated": pdf_doc.total_articles_generated,
+        "uploaded_at": pdf_doc.uploaded_at,
+        "processing_started_at": pdf_doc.processing_started_at,
+        "processing_completed_at": pdf_doc.processing_completed_at,
+        "error_message": pdf_doc.error_message
+    }
+
+
+def _pdf_to_list_item(pdf_doc: PDFListProjection) -> dict:
+    """Build the PDF list representation of a PDF document."""
+    return {
+        "id": str(pdf_doc.id),
+        "filename": pdf_doc.original_filename,
+        "processing_status": pdf_doc.processing_status,
+        "total_articles_generated": pdf_doc.total_articles_generated,
+        "uploaded_at": pdf_doc.uploaded_at
+    }
+
 
 @router.post("/upload", response_model=PDFUploadResponse)
 async def upload_pdf(
@@ -38,10 +79,15 @@ async def upload_pdf(
             detail="Only PDF files are supported"
         )
     
-    # Validate file size
-    file_size = 0
-    content = await file.read()
-    file_size = len(content)
+    # Generate unique filename
+    file_id = str(uuid.uuid4())
+    filename = f"{file_id}.pdf"
+    file_path = os.path.join("data/uploads", filename)
+    
+    # Validate file size. The body has already been received into
+    # file.file, so its size is known without reading it
+    file.file.seek(0, os.SEEK_END)
+    file_size = file.file.tell()
     
     max_size_bytes = settings.max_file_size_mb * 1024 * 1024
     if file_size > max_size_bytes:
@@ -51,19 +97,14 @@ async def upload_pdf(
         )
     
     try:
-        # Generate unique filename
-        file_id = str(uuid.uuid4())
-        filename = f"{file_id}.pdf"
-        file_path = os.path.join("data/uploads", filename)
-        
         # Ensure upload directory exists
         os.makedirs("data/uploads", exist_ok=True)
         
-        # Save file
-        async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(content)
+        # Save file (blocking copy, so off the event loop)
+        await run_in_threadpool(_save_upload, file.file, file_path, file_size)
         
-        # Create database record
+        # Create database record before responding, so the returned id
+        # resolves (and can record a failure) as soon as the client has it
         pdf_doc = PDFDocument(
             filename=filename,
             original_filename=file.filename or "unknown.pdf",
@@ -71,15 +112,15 @@ async def upload_pdf(
             file_size_bytes=file_size,
             content_type=file.content_type or "application/pdf"
         )
-        
         await pdf_doc.insert()
         
-        # Queue background processing
-        background_tasks.add_task(process_pdf_background, str(pdf_doc.id))
+        # Processing runs once the response has been sent
+        background_tasks.add_task(_process_upload, str(pdf_doc.id))
         
         logger.info(f"PDF uploaded successfully: {filename}")
         
-        return PDFUploadResponse(
+        # Fields come from the document we just built; skip re-validation
+        return PDFUploadResponse.model_construct(
             id=str(pdf_doc.id),
             filename=pdf_doc.original_filename,
             file_size_bytes=pdf_doc.file_size_bytes,
@@ -87,11 +128,70 @@ async def upload_pdf(
             uploaded_at=pdf_doc.uploaded_at
         )
         
+    except HTTPException:
+        _remove_upload(file_path)
+        raise
     except Exception as e:
         logger.error(f"Error uploading PDF: {e}")
+        _remove_upload(file_path)
         raise HTTPException(status_code=500, detail="Failed to upload PDF")
 
 
+async def _process_upload(pdf_id: str) -> None:
+    """Process an uploaded PDF whose record has been inserted."""
+    # On the Celery workers when a broker is configured, otherwise here
+    if settings.redis_url:
+        try:
+            # Publishing blocks (and retries) while the broker is slow or
+            # down, so it runs off the event loop
+            await run_in_threadpool(process_pdf_task.delay, pdf_id)
+            return
+        except Exception as e:
+            # Process it here instead of leaving it pending forever
+            logger.error(f"Error queueing PDF {pdf_id}, processing it in this process: {e}")
+    
+    await process_pdf_background(pdf_id)
+
+
+def _save_upload(src: BinaryIO, file_path: str, size: int) -> None:
+    """Copy a received upload to ``file_path``.
+    
+    Uploads Starlette spooled to disk are copied with ``os.sendfile``, which
+    moves the bytes inside the kernel instead of through Python buffers.
+    Small in-memory uploads, and platforms whose sendfile can't write to a
+    file (macOS only sends to sockets), use a plain buffered copy.
+    """
+    src.seek(0)
+    with open(file_path, 'wb') as dst:
+        if size > _UPLOAD_SPOOL_SIZE and hasattr(os, "sendfile"):
+            src_fd, dst_fd = src.fileno(), dst.fileno()
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+            except OSError:
+                # Start over with the buffered copy
+                src.seek(0)
+                dst.seek(0)
+                dst.truncate()
+        
+        shutil.copyfileobj(src, dst)
+
+
+def _remove_upload(file_path: str) -> None:
+    """Delete a stored upload, ignoring files that are already gone."""
+    try:
+        os.remove(file_path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove partial upload {file_path}: {e}")
+
+
 @router.get("/status/{pdf_id}", response_model=PDFProcessingResponse)
 async def get_pdf_status(pdf_id: str):
     """Get processing status of a PDF document."""
@@ -101,18 +201,7 @@ async def get_pdf_status(pdf_id: str):
         if not pdf_doc:
             raise HTTPException(status_code=404, detail="PDF not found")
         
-        return PDFProcessingResponse(
-            id=str(pdf_doc.id),
-            filename=pdf_doc.original_filename,
-            processing_status=pdf_doc.processing_status,
-            total_pages=pdf_doc.total_pages,
-            total_chunks=pdf_doc.total_chunks,
-            total_articles_generated=pdf_doc.total_articles_generated,
-            uploaded_at=pdf_doc.uploaded_at,
-            processing_started_at=pdf_doc.processing_started_at,
-            processing_completed_at=pdf_doc.processing_completed_at,
-            error_message=pdf_doc.error_message
-        )
+        return MsgspecJSONResponse(content=_pdf_to_dict(pdf_doc))
         
     except HTTPException:
         raise
@@ -135,36 +224,29 @@ async def list_pdfs(
         if status:
             query["processing_status"] = status
         
-        # Get total count
-        total = await PDFDocument.find(query).count()
+        # Unfiltered totals come from collection metadata instead of a scan
+        if query:
+            count = PDFDocument.find(query).count()
+        else:
+            count = PDFDocument.get_motor_collection().estimated_document_count()
         
-        # Get paginated results
+        # Get total count and paginated results concurrently
         skip = (page - 1) * per_page
-        documents = await PDFDocument.find(query).sort(-PDFDocument.uploaded_at).skip(skip).limit(per_page).to_list()
+        total, documents = await asyncio.gather(
+            count,
+            PDFDocument.find(query, projection_model=PDFListProjection)
+            .sort(-PDFDocument.uploaded_at).skip(skip).limit(per_page).to_list()
+        )
         
         # Convert to response format
-        doc_responses = [
-            PDFProcessingResponse(
-                id=str(doc.id),
-                filename=doc.original_filename,
-                processing_status=doc.processing_status,
-                total_pages=doc.total_pages,
-                total_chunks=doc.total_chunks,
-                total_articles_generated=doc.total_articles_generated,
-                uploaded_at=doc.uploaded_at,
-                processing_started_at=doc.processing_started_at,
-                processing_completed_at=doc.processing_completed_at,
-                error_message=doc.error_message
-            )
-            for doc in documents
-        ]
+        doc_responses = [_pdf_to_list_item(doc) for doc in documents]
         
-        return PDFListResponse(
-            documents=doc_responses,
-            total=total,
-            page=page,
-            per_page=per_page
-        )
+        return MsgspecJSONResponse(content={
+            "documents": doc_responses,
+            "total": total,
+            "page": page,
+            "per_page": per_page
+        })
         
     except Exception as e:
         logger.error(f"Error listing PDFs: {e}")
@@ -180,15 +262,13 @@ async def delete_pdf(pdf_id: str):
         if not pdf_doc:
             raise HTTPException(status_code=404, detail="PDF not found")
         
-        # Delete associated articles (will be implemented later)
-        # TODO: Delete health articles associated with this PDF
-        
-        # Delete file from disk
-        if os.path.exists(pdf_doc.file_path):
-            os.remove(pdf_doc.file_path)
-        
-        # Delete database record
-        await pdf_doc.delete()
+        # Delete associated articles, the file on disk (blocking, so in the
+        # threadpool) and the database record concurrently
+        await asyncio.gather(
+            HealthArticle.find(HealthArticle.source_pdf_id == pdf_id).delete(),
+            run_in_threadpool(_remove_upload, pdf_doc.file_path),
+            pdf_doc.delete()
+        )
         
         logger.info(f"PDF deleted: {pdf_doc.filename}")
         return JSONResponse(content={"message": "PDF deleted successfully"})
@@ -198,160 +278,3 @@ async def delete_pdf(pdf_id: str):
     except Exception as e:
         logger.error(f"Error deleting PDF: {e}")
         raise HTTPException(status_code=500, detail="Failed to delete PDF")
-
-
-async def process_pdf_background(pdf_id: str):
-    """Background task to process PDF and generate articles."""
-    
-    logger.info(f"Starting background processing for PDF: {pdf_id}")
-    
-    try:
-        pdf_doc = await PDFDocument.get(pdf_id)
-        if not pdf_doc:
-            logger.error(f"PDF not found: {pdf_id}")
-            return
-        
-        # Initialize processing services
-        from app.services.pdf_parser import PDFParser
-        from app.services.content_chunker import ContentChunker
-        from app.services.gemini_summarizer import GeminiSummarizer
-        from app.services.image_matcher import UnsplashImageMatcher
-        from app.services.duplicate_detector import DuplicateDetector
-        from app.models.health_article import HealthArticle, HealthArticleCreate
-        
-        pdf_parser = PDFParser()
-        chunker = ContentChunker()
-        summarizer = GeminiSummarizer()
-        image_matcher = UnsplashImageMatcher()
-        duplicate_detector = DuplicateDetector()
-        
-        # Update status to parsing
-        pdf_doc.processing_status = PDFProcessingStatus.PARSING
-        pdf_doc.processing_started_at = datetime.now(timezone.utc)
-        await pdf_doc.save()
-        
-        # Step 1: Parse PDF content
-        logger.info(f"Step 1: Parsing PDF content for {pdf_id}")
-        pdf_content = await pdf_parser.parse_pdf(pdf_doc.file_path)
-        pdf_doc.total_pages = pdf_content.total_pages
-        await pdf_doc.save()
-        
-        # Step 2: Chunk content
-        logger.info(f"Step 2: Chunking content for {pdf_id}")
-        pdf_doc.processing_status = PDFProcessingStatus.CHUNKING
-        await pdf_doc.save()
-        
-        chunks = chunker.chunk_content(pdf_content, pdf_id)
-        pdf_doc.total_chunks = len(chunks)
-        pdf_doc.chunk_ids = [chunk.chunk_id for chunk in chunks]
-        await pdf_doc.save()
-        
-        if not chunks:
-            logger.warning(f"No relevant chunks found for PDF {pdf_id}")
-            pdf_doc.processing_status = PDFProcessingStatus.COMPLETED
-            pdf_doc.processing_completed_at = datetime.now(timezone.utc)
-            await pdf_doc.save()
-            return
-        
-        # Step 3: Generate articles with LLM
-        logger.info(f"Step 3: Generating articles for {pdf_id} ({len(chunks)} chunks)")
-        pdf_doc.processing_status = PDFProcessingStatus.PROCESSING
-        await pdf_doc.save()
-        
-        summarized_contents = await summarizer.batch_summarize_chunks(chunks)
-        
-        if not summarized_contents:
-            logger.warning(f"No articles generated for PDF {pdf_id}")
-            pdf_doc.processing_status = PDFProcessingStatus.COMPLETED
-            pdf_doc.processing_completed_at = datetime.now(timezone.utc)
-            await pdf_doc.save()
-            return
-        
-        # Step 4: Process each summarized content
-        created_articles = []
-        
-        for i, summarized_content in enumerate(summarized_contents):
-            try:
-                logger.info(f"Processing article {i+1}/{len(summarized_contents)}: {summarized_content.title}")
-                
-                # Check for duplicates
-                duplicates = await duplicate_detector.check_for_duplicates(summarized_content)
-                if duplicates:
-                    logger.warning(f"Skipping duplicate article: {summarized_content.title}")
-                    continue
-                
-                # Find matching image
-                image_result = await image_matcher.find_image_for_article(
-                    summarized_content.title,
-                    summarized_content.category,
-                    summarized_content.medical_condition_tags
-                )
-                
-                image_url = image_result.url if image_result else None
-                
-                # Create health article
-                article_data = HealthArticleCreate(
-                    title=summarized_content.title,
-                    category=summarized_content.category,
-                    image_url=image_url,
-                    medical_condition_tags=summarized_content.medical_condition_tags,
-                    content=summarized_content.content,
-                    source_pdf_id=pdf_id,
-                    chunk_id=summarized_content.source_chunk_id
-                )
-                
-                # Create and save article
-                article = HealthArticle(**article_data.dict())
-                article.reading_level_score = summarized_content.reading_level_score
-                await article.insert()
-                
-                created_articles.append(str(article.id))
-                logger.info(f"Created article: {article.title} (ID: {article.id})")
-                
-            except Exception as e:
-                logger.error(f"Error processing article {i+1}: {e}")
-                continue
-        
-        # Update PDF document with results
-        pdf_doc.article_ids = created_articles
-        pdf_doc.total_articles_generated = len(created_articles)
-        pdf_doc.processing_status = PDFProcessingStatus.COMPLETED
-        pdf_doc.processing_completed_at = datetime.now(timezone.utc)
-        
-        # Add processing statistics
-        processing_time_seconds = 0
-        if pdf_doc.processing_started_at:
-            # Ensure both datetimes are timezone-aware for subtraction
-            started_at = pdf_doc.processing_started_at
-            if started_at.tzinfo is None:
-                started_at = started_at.replace(tzinfo=timezone.utc)
-            processing_time_seconds = (datetime.now(timezone.utc) - started_at).total_seconds()
-        
-        pdf_doc.processing_stats = {
-            "total_chunks": len(chunks),
-            "articles_generated": len(created_articles),
-            "articles_skipped_duplicates": len(summarized_contents) - len(created_articles),
-            "processing_time_seconds": processing_time_seconds
-        }
-        
-        await pdf_doc.save()
-        
-        logger.info(f"PDF processing completed: {pdf_id} - Generated {len(created_articles)} articles")
-        
-    except Exception as e:
-        logger.error(f"Error processing PDF {pdf_id}: {e}")
-        
-        # Update PDF status to failed
-        try:
-            pdf_doc = await PDFDocument.get(pdf_id)
-            if pdf_doc:
-                pdf_doc.processing_status = PDFProcessingStatus.FAILED
-                pdf_doc.error_message = str(e)
-                pdf_doc.processing_completed_at = datetime.now(timezone.utc)
-                await pdf_doc.save()
-        except Exception as save_error:
-            logger.error(f"Error updating PDF status: {save_error}")
-
-
-# Import datetime for background task
-from datetime import datetime 
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Application configuration settings."""
 
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 
@@ -10,10 +11,17 @@ class Settings(BaseSettings):
     # Database Configuration
     mongodb_url: str = "mongodb://localhost:27017"
     mongodb_db_name: str = "health_education_extractor"
+    mongodb_max_pool_size: int = 100
+    mongodb_min_pool_size: int = 10  # Connections opened at startup and kept warm
+    # Wire compression, in order of preference; the server picks the first
+    # one it also supports (article bodies are text and compress well)
+    mongodb_compressors: str = "zstd,zlib"
 
     # App Database Configuration (for published articles)
     # Uses same connection as main database but different database name
     app_mongodb_db_name: str = "test"
+    app_mongodb_max_pool_size: int = 64
+    app_mongodb_min_pool_size: int = 8
 
     @property
     def app_mongodb_url(self) -> str:
@@ -23,6 +31,11 @@ class Settings(BaseSettings):
     # Google AI (Gemini) API
     gemini_api_key: str
     
+    # Budgets are per process: with several Gunicorn workers or Celery worker
+    # processes summarizing, set them to the API quota divided between those
+    gemini_requests_per_minute: int = 300  # Request budget shared by all summarizations in a process
+    gemini_tokens_per_minute: int = 1000000  # Input token budget, estimated at 4 characters per token
+    
     # Image APIs
     unsplash_access_key: str
     unsplash_secret_key: str
@@ -37,10 +50,18 @@ class Settings(BaseSettings):
     similarity_threshold: float = 0.85
     max_images_per_article: int = 1
     reading_level_target: int = 6
+    chunking_processes: Optional[int] = None  # Processes PDFs are parsed and chunked in (None = the container's CPUs split between the web workers, 0 = a thread)
+    duplicate_cache_dir: Optional[str] = "data/cache"  # Where fitted duplicate detection vectors are kept across restarts (None = memory only)
     
     # Server Configuration
     host: str = "0.0.0.0"
     port: int = 8000
+    thread_pool_size: int = 100  # Worker threads for sync work offloaded from async routes
+    
+    # Task Queue (optional)
+    # When set, PDF processing is queued to Celery workers instead of running
+    # in the API process
+    redis_url: Optional[str] = None
     
     # Authentication Settings
     secret_key: str  # Required - must be set via environment variable
@@ -51,9 +72,15 @@ class Settings(BaseSettings):
     admin_username: str = "admin"
     admin_password: str  # Required - must be set via environment variable
     
-    class Config:
-        env_file = ".env"
+    # Read once per process and never mutated afterwards
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load the settings from the environment (and .env) once per process."""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings() 
\ No newline at end of file
+settings = get_settings() 
\ No newline at end of file
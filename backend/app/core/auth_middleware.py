@@ -2,7 +2,7 @@
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Optional
+from typing import Any, Dict, Optional
 from app.services.auth_service import auth_service
 from app.models.auth import User
 
@@ -57,6 +57,33 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
     return current_user
 
 
+async def get_current_token_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Dict[str, Any]:
+    """
+    Dependency that only validates the token itself, without loading the user.
+    
+    Use it for endpoints that just need proof of a valid, unexpired token.
+    
+    Args:
+        credentials: HTTP Bearer token credentials
+        
+    Returns:
+        Dict[str, Any]: The decoded token claims
+        
+    Raises:
+        HTTPException: If the token is invalid or has no subject
+    """
+    claims = auth_service.decode_token(credentials.credentials)
+    if claims is None or claims.get("sub") is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return claims
+
+
 # Optional authentication dependency (doesn't raise exception if no token)
 async def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False))
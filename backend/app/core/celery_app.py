@@ -0,0 +1,34 @@
+"""Celery application for out-of-process PDF processing."""
+
+from celery import Celery
+
+from app.config import settings
+
+# Only used when settings.redis_url is set; otherwise the API runs PDF
+# processing in-process with FastAPI BackgroundTasks.
+celery_app = Celery(
+    "health_education_extractor",
+    broker=settings.redis_url,
+    backend=settings.redis_url,
+    include=["app.tasks.pdf"]
+)
+
+# Long-running PDF jobs get their own queue so workers sized for them
+# (`celery -A app.core.celery_app worker -Q pdf`) don't also pick up
+# short tasks, and short tasks never wait behind a PDF.
+celery_app.conf.task_default_queue = "default"
+celery_app.conf.task_routes = {
+    "app.tasks.pdf.*": {"queue": "pdf"}
+}
+
+# PDF tasks run for minutes and vary a lot in size: each worker process
+# reserves one task at a time and acknowledges it only once it's done, so
+# queued PDFs go to whichever process frees up first (and are redelivered
+# if a worker dies mid-task) instead of waiting behind a busy one.
+celery_app.conf.task_acks_late = True
+celery_app.conf.worker_prefetch_multiplier = 1
+
+# A stuck PDF gets SoftTimeLimitExceeded (and is marked failed) after 25
+# minutes; the process is killed if it still hasn't finished at 30.
+celery_app.conf.task_soft_time_limit = 1500
+celery_app.conf.task_time_limit = 1800
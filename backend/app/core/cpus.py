@@ -0,0 +1,48 @@
+"""CPU count available to this process (no app imports: gunicorn.conf.py uses it)."""
+
+import math
+import os
+from typing import Optional
+
+
+def _cgroup_cpu_limit() -> Optional[float]:
+    """CPUs allowed by the container's cgroup CPU quota, or None when unlimited."""
+    try:
+        # cgroup v2: "<quota> <period>", quota "max" when unlimited
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota == "max":
+            return None
+        return int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+
+    try:
+        # cgroup v1: quota -1 when unlimited
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+            quota = int(f.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+            period = int(f.read())
+        if quota <= 0:
+            return None
+        return quota / period
+    except (OSError, ValueError):
+        return None
+
+
+def available_cpus() -> int:
+    """CPUs this process may actually use.
+
+    os.cpu_count() reports the host's cores; in a container the CPU
+    affinity mask and cgroup quota are what bound the work that can run
+    in parallel.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        cpus = os.cpu_count() or 1
+
+    limit = _cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, math.ceil(limit))
+    return max(1, cpus)
@@ -1,5 +1,6 @@
 """Database configuration and connection management."""
 
+import asyncio
 import logging
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
@@ -8,6 +9,7 @@ from typing import Optional
 from app.config import settings
 from app.models.health_article import HealthArticle
 from app.models.pdf_document import PDFDocument
+from app.models.summary_cache import SummaryCacheEntry
 
 logger = logging.getLogger(__name__)
 
@@ -24,14 +26,23 @@ async def init_database():
         db_client = AsyncIOMotorClient(
             settings.mongodb_url,
             tls=True,
-            tlsAllowInvalidCertificates=True,  # For development - allows self-signed certificates
+            tlsAllowInvalidCertificates=settings.debug,  # Development only - allows self-signed certificates
+            maxPoolSize=settings.mongodb_max_pool_size,
+            minPoolSize=settings.mongodb_min_pool_size,
+            waitQueueTimeoutMS=10000,  # Fail fast instead of queueing forever when the pool is exhausted
+            retryWrites=True,
+            compressors=settings.mongodb_compressors,
             serverSelectionTimeoutMS=30000,
             connectTimeoutMS=30000,
             socketTimeoutMS=30000
         )
         
-        # Test connection
-        await db_client.admin.command('ping')
+        # Test connection, opening the minimum pool up front so the first
+        # requests don't pay for TCP/TLS handshakes
+        await asyncio.gather(*(
+            db_client.admin.command('ping')
+            for _ in range(max(1, settings.mongodb_min_pool_size))
+        ))
         logger.info(f"Connected to MongoDB at {settings.mongodb_url}")
         
         # Get database
@@ -40,7 +51,7 @@ async def init_database():
         # Initialize Beanie with document models
         await init_beanie(
             database=database,
-            document_models=[HealthArticle, PDFDocument]
+            document_models=[HealthArticle, PDFDocument, SummaryCacheEntry]
         )
         
         logger.info("Beanie ODM initialized successfully")
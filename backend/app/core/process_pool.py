@@ -0,0 +1,36 @@
+"""Process pool for CPU-bound PDF work (parsing and chunking)."""
+
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional
+
+from app.config import settings
+from app.core.cpus import available_cpus
+
+
+@lru_cache(maxsize=1)
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """Process pool shared by all PDF parsing and chunking in this process, or None.
+
+    None means the work runs in a thread instead: when disabled in the
+    settings, when the web workers already take up every CPU, and in
+    Celery's prefork workers, whose daemonic processes can't start children
+    (there the workers already spread PDFs over the cores).
+    """
+    workers = settings.chunking_processes
+    if workers is None:
+        # The CPUs available to the container, split between the Gunicorn
+        # workers (each builds its own pool); 0 leaves the work in a thread
+        web_workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+        workers = available_cpus() // max(1, web_workers)
+    if not workers or multiprocessing.current_process().daemon:
+        return None
+
+    # Spawned rather than forked: the parent runs an event loop and
+    # driver threads whose state a fork would copy mid-use
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn")
+    )
@@ -0,0 +1,36 @@
+"""Custom response classes."""
+
+from typing import Any, Mapping, Optional
+
+import msgspec
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+
+# Encoders are reusable and thread-safe; build one per process
+_json_encoder = msgspec.json.Encoder()
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """JSON response encoded with msgspec.
+
+    Accepts ``msgspec.Struct`` instances as well as plain dicts and lists
+    (datetimes and enums included) and encodes them without going through
+    ``jsonable_encoder``. ``bytes`` content is taken as already-encoded JSON.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return _json_encoder.encode(content)
+
+    @classmethod
+    async def create(
+        cls, content: Any, headers: Optional[Mapping[str, str]] = None
+    ) -> "MsgspecJSONResponse":
+        """Build a response, encoding ``content`` in the threadpool.
+
+        Use for large bodies (full article lists) so encoding doesn't hold
+        up the event loop.
+        """
+        body = await run_in_threadpool(_json_encoder.encode, content)
+        return cls(content=body, headers=headers)
@@ -5,11 +5,14 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import logging
 from contextlib import asynccontextmanager
+from anyio import to_thread
 
 from app.config import settings
 from app.api.v1 import pdf_processing, health_articles, auth
 from app.core.database import init_database, close_database
+from app.core.responses import MsgspecJSONResponse
 from app.services.app_database_uploader import app_uploader
+from app.services.pdf_pipeline import get_pipeline_services
 
 
 # Configure logging
@@ -22,13 +25,21 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
     logger.info("Starting Health Education Extractor API...")
+    # Default limiter allows 40 threads; concurrent logins need more headroom
+    to_thread.current_default_thread_limiter().total_tokens = settings.thread_pool_size
     await init_database()
     await app_uploader.init_app_database()
+    if not settings.redis_url:
+        # PDFs are processed in this process; set the services up now
+        # rather than on the first upload
+        get_pipeline_services()
     yield
     # Shutdown
     logger.info("Shutting down Health Education Extractor API...")
     await close_database()
     await app_uploader.close_app_database()
+    if not settings.redis_url:
+        await get_pipeline_services().image_matcher.close()
 
 
 # Create FastAPI app
@@ -36,7 +47,10 @@ app = FastAPI(
     title="Health Education Extractor API",
     description="Extract and process health education content from PDFs",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Routes without their own response class are encoded with msgspec
+    # rather than the stdlib json module
+    default_response_class=MsgspecJSONResponse
 )
 
 # Add CORS middleware
@@ -49,8 +63,10 @@ app.add_middleware(
         "https://*.vercel.app",
     ],
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH", "HEAD"],
-    allow_headers=["*"],
+    # Only what the API routes and the frontend actually use
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -95,5 +111,7 @@ if __name__ == "__main__":
         "main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug
+        reload=settings.debug,
+        loop="uvloop",
+        http="httptools"
     ) 
\ No newline at end of file
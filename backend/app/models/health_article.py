@@ -1,8 +1,10 @@
 """Health Article data model."""
 
-from beanie import Document
+import msgspec
+from beanie import Document, PydanticObjectId
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from typing import List, Optional, Union
 from datetime import datetime, timezone
 from enum import Enum
 
@@ -60,12 +62,21 @@ class HealthArticle(Document):
         name = "health_articles"
         indexes = [
             [("title", "text"), ("content", "text")],  # Text search
-            "category",
             "medical_condition_tags",
-            "processing_status",
             "created_at",
-            "source_pdf_id",
-            "app_article_id"  # Add index for app article ID
+            "app_article_id",  # Add index for app article ID
+            # Equality filter + newest-first sort, so listings are served by
+            # an index range scan instead of an in-memory sort. These also
+            # cover plain lookups on their leading field.
+            IndexModel([("source_pdf_id", ASCENDING), ("created_at", DESCENDING)]),
+            IndexModel([("processing_status", ASCENDING), ("created_at", DESCENDING)]),
+            IndexModel([("category", ASCENDING), ("created_at", DESCENDING)]),
+            # Approved articles still waiting for the app database upload
+            IndexModel([
+                ("processing_status", ASCENDING),
+                ("app_article_id", ASCENDING),
+                ("created_at", DESCENDING)
+            ])
         ]
     
     def __str__(self) -> str:
@@ -111,4 +122,85 @@ class HealthArticleResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     reviewed_at: Optional[datetime]
-    reviewer_notes: Optional[str] 
\ No newline at end of file
+    reviewer_notes: Optional[str]
+
+
+class HealthArticleResponseStruct(msgspec.Struct):
+    """msgspec mirror of ``HealthArticleResponse`` used to encode responses.
+
+    ``HealthArticleResponse`` stays the documented schema; this struct is
+    what the handlers actually serialize.
+    """
+    id: str
+    title: str
+    category: CategoryEnum
+    image_url: Optional[str]
+    medical_condition_tags: List[str]
+    content: str
+    source_pdf_id: Optional[str]
+    chunk_id: Optional[str]
+    processing_status: ProcessingStatus
+    app_article_id: Optional[str]
+    reading_level_score: Optional[float]
+    similarity_scores: Optional[List[float]]
+    created_at: datetime
+    updated_at: datetime
+    reviewed_at: Optional[datetime]
+    reviewer_notes: Optional[str]
+
+    @classmethod
+    def from_article(
+        cls, article: Union[HealthArticle, "HealthArticleProjection"]
+    ) -> "HealthArticleResponseStruct":
+        """Build the API representation of an article or list projection."""
+        # A single model_dump runs in pydantic-core instead of one
+        # Python-level getattr per field
+        data = article.model_dump(include=_STRUCT_DATA_FIELDS)
+        return cls(id=str(article.id), **data)
+
+
+# Struct fields copied straight off the document (everything but the id)
+_STRUCT_DATA_FIELDS = frozenset(HealthArticleResponseStruct.__struct_fields__) - {"id"}
+
+
+class HealthArticleProjection(BaseModel):
+    """Projection of the fields served by the article list endpoints.
+
+    Loading list pages through this model skips Beanie document
+    construction and only asks MongoDB for the fields the API returns.
+    """
+    id: PydanticObjectId = Field(alias="_id")
+    title: str
+    category: CategoryEnum
+    image_url: Optional[str] = None
+    medical_condition_tags: List[str] = Field(default_factory=list)
+    content: str
+    source_pdf_id: Optional[str] = None
+    chunk_id: Optional[str] = None
+    processing_status: ProcessingStatus = ProcessingStatus.DRAFT
+    app_article_id: Optional[str] = None
+    reading_level_score: Optional[float] = None
+    similarity_scores: Optional[List[float]] = None
+    created_at: datetime
+    updated_at: datetime
+    reviewed_at: Optional[datetime] = None
+    reviewer_notes: Optional[str] = None
+
+
+class DuplicateCheckProjection(BaseModel):
+    """Projection of the fields the duplicate detector compares.
+
+    Existing articles are loaded through this model on every duplicate
+    check, so MongoDB doesn't send the rest of each document.
+    """
+    id: PydanticObjectId = Field(alias="_id")
+    title: str
+    content: str
+    medical_condition_tags: List[str] = Field(default_factory=list)
+
+
+class DuplicateScanProjection(DuplicateCheckProjection):
+    """Projection of the fields needed to check stored articles themselves
+    for duplicates: the compared fields plus the category.
+    """
+    category: CategoryEnum
@@ -1,7 +1,8 @@
 """PDF Document data model."""
 
-from beanie import Document
+from beanie import Document, PydanticObjectId
 from pydantic import BaseModel, Field
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
 from enum import Enum
@@ -54,16 +55,30 @@ class PDFDocument(Document):
     class Settings:
         name = "pdf_documents"
         indexes = [
-            "filename",
-            "processing_status",
-            "uploaded_at",
-            "original_filename"
+            "uploaded_at",  # Newest-first sort of the unfiltered PDF list
+            "original_filename",
+            # Status filter + newest-first sort used by the PDF list; also
+            # covers plain status lookups
+            IndexModel([("processing_status", ASCENDING), ("uploaded_at", DESCENDING)])
         ]
     
     def __str__(self) -> str:
         return f"PDFDocument(filename='{self.filename}', status='{self.processing_status}')"
 
 
+class PDFListProjection(BaseModel):
+    """Projection of the fields served by the PDF list endpoint.
+
+    MongoDB only sends these fields, leaving out the chunk/article id lists
+    and processing logs, which can be large.
+    """
+    id: PydanticObjectId = Field(alias="_id")
+    original_filename: str
+    processing_status: PDFProcessingStatus = PDFProcessingStatus.UPLOADED
+    total_articles_generated: Optional[int] = None
+    uploaded_at: datetime
+
+
 class PDFChunk(BaseModel):
     """Model for PDF content chunks."""
     chunk_id: str
@@ -100,9 +115,21 @@ class PDFProcessingResponse(BaseModel):
     error_message: Optional[str]
 
 
+class PDFListItem(BaseModel):
+    """Response schema for a PDF in the PDF list.
+
+    The full processing details are served by the status endpoint.
+    """
+    id: str
+    filename: str
+    processing_status: PDFProcessingStatus
+    total_articles_generated: Optional[int]
+    uploaded_at: datetime
+
+
 class PDFListResponse(BaseModel):
     """Response schema for listing PDFs."""
-    documents: List[PDFProcessingResponse]
+    documents: List[PDFListItem]
     total: int
     page: int
     per_page: int 
\ No newline at end of file
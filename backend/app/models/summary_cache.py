@@ -0,0 +1,25 @@
+"""Cached Gemini summaries."""
+
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+from typing import Any, Dict
+from datetime import datetime, timezone
+
+# How long a cached summary is kept before MongoDB expires it
+SUMMARY_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+
+class SummaryCacheEntry(Document):
+    """A parsed Gemini summary of a chunk, keyed by a hash of the request."""
+    
+    key: str = Field(..., description="Hash of prompt version, model and chunk content")
+    summary: Dict[str, Any]
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    
+    class Settings:
+        name = "summary_cache"
+        indexes = [
+            IndexModel([("key", ASCENDING)], unique=True),
+            IndexModel([("created_at", ASCENDING)], expireAfterSeconds=SUMMARY_CACHE_TTL_SECONDS)
+        ]
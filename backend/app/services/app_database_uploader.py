@@ -1,10 +1,13 @@
 """Service for uploading approved articles to the app database."""
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Union
 from motor.motor_asyncio import AsyncIOMotorClient
-from beanie import init_beanie
+from beanie import PydanticObjectId, init_beanie
 from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
 
 from app.config import settings
 from app.models.health_article import HealthArticle
@@ -12,6 +15,10 @@ from app.models.app_article import AppArticle, AppArticleCreate
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of single-article uploads in flight from upload_many; well
+# under the app client's connection pool size
+_MAX_CONCURRENT_UPLOADS = 16
+
 
 class AppDatabaseUploader:
     """Service for uploading articles to the app database."""
@@ -20,18 +27,37 @@ class AppDatabaseUploader:
         self.app_client: Optional[AsyncIOMotorClient] = None
         self.app_database = None
         self._initialized = False
+        # Created on first use so it belongs to the running event loop
+        self._init_lock: Optional[asyncio.Lock] = None
     
     async def init_app_database(self):
-        """Initialize connection to the app database."""
+        """Initialize connection to the app database.
+        
+        Safe to call concurrently: the first caller connects and the others
+        wait for it rather than creating clients of their own.
+        """
         if self._initialized:
             return
-            
+        
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        
+        async with self._init_lock:
+            if self._initialized:
+                return
+            await self._connect()
+    
+    async def _connect(self):
+        """Create the app database client and initialize Beanie on it."""
         try:
             # Create motor client for app database
             self.app_client = AsyncIOMotorClient(
                 settings.app_mongodb_url,
                 tls=True,
                 tlsAllowInvalidCertificates=True,
+                maxPoolSize=settings.app_mongodb_max_pool_size,
+                minPoolSize=settings.app_mongodb_min_pool_size,
+                compressors=settings.mongodb_compressors,
                 serverSelectionTimeoutMS=30000,
                 connectTimeoutMS=30000,
                 socketTimeoutMS=30000
@@ -77,32 +103,161 @@ class AppDatabaseUploader:
             await self.init_app_database()
         
         try:
-            # Check if article already exists in app database
-            existing_article = await AppArticle.find_one({"title": health_article.title})
-            if existing_article:
-                logger.warning(f"Article already exists in app database: {health_article.title}")
-                return str(existing_article.id)
-            
-            # Convert HealthArticle to AppArticle format
-            app_article_data = AppArticleCreate(
-                title=health_article.title,
-                category=health_article.category.value,  # Convert enum to string
-                imageUrl=health_article.image_url or "",  # Ensure not None
-                medicalConditionTags=health_article.medical_condition_tags,  # Map medical condition tags
-                content=health_article.content
+            # Insert the article unless one with the same title already
+            # exists, and get the id of whichever it is, in one round-trip.
+            # Only a unique title index (which the app owns; see
+            # scripts/create_app_title_index.py) also rules out two
+            # concurrent uploads of one title both inserting.
+            app_article = self._to_app_article(health_article)
+            app_article.id = PydanticObjectId()
+            doc = await AppArticle.get_motor_collection().find_one_and_update(
+                {"title": app_article.title},
+                {"$setOnInsert": self._to_document(app_article)},
+                projection={"_id": 1},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
             )
             
-            # Create and save AppArticle
-            app_article = AppArticle(**app_article_data.dict())
-            await app_article.insert()
-            
-            logger.info(f"Successfully uploaded article to app database: {app_article.title} (ID: {app_article.id})")
-            return str(app_article.id)
+            if doc["_id"] != app_article.id:
+                logger.warning(f"Article already exists in app database: {health_article.title}")
+            else:
+                logger.info(f"Successfully uploaded article to app database: {app_article.title} (ID: {app_article.id})")
+            return str(doc["_id"])
             
         except Exception as e:
             logger.error(f"Failed to upload article to app database: {e}")
             return None
     
+    async def upload_articles(self, health_articles: List[HealthArticle]) -> List[Optional[str]]:
+        """
+        Upload several health articles to the app database at once.
+        
+        Existing titles are looked up with a single query and the new
+        articles are written with one unordered insert_many, instead of a
+        lookup and an insert per article.
+        
+        Args:
+            health_articles: The approved HealthArticles to upload
+            
+        Returns:
+            The AppArticle ID for each input article, in order (None where
+            the upload failed)
+        """
+        if not self._initialized:
+            await self.init_app_database()
+        
+        if not health_articles:
+            return []
+        
+        titles = list({article.title for article in health_articles})
+        try:
+            # Titles already in the app database
+            app_ids: Dict[str, Optional[str]] = {
+                doc["title"]: str(doc["_id"])
+                async for doc in AppArticle.get_motor_collection().find(
+                    {"title": {"$in": titles}}, {"title": 1}
+                )
+            }
+        except Exception as e:
+            logger.error(f"Failed to look up articles in app database: {e}")
+            return [None] * len(health_articles)
+        
+        for title in app_ids:
+            logger.warning(f"Article already exists in app database: {title}")
+        
+        # One new AppArticle per missing title; ids are assigned up front so
+        # they're known without reading the documents back
+        new_articles: List[AppArticle] = []
+        for health_article in health_articles:
+            if health_article.title in app_ids:
+                continue
+            try:
+                app_article = self._to_app_article(health_article)
+            except Exception as e:
+                logger.error(f"Failed to convert article for app database: {health_article.title}: {e}")
+                app_ids[health_article.title] = None
+                continue
+            app_article.id = PydanticObjectId()
+            app_ids[app_article.title] = str(app_article.id)
+            new_articles.append(app_article)
+        
+        if new_articles:
+            try:
+                # With the collection's default write concern and validation:
+                # the returned ids are recorded on the articles as uploaded,
+                # so the inserts must not be rolled back
+                await AppArticle.get_motor_collection().insert_many(
+                    [self._to_document(app_article) for app_article in new_articles],
+                    ordered=False
+                )
+            except BulkWriteError as e:
+                logger.error(f"Failed to upload some articles to app database: {e}")
+                # Retry the failed ones one by one; the upsert also resolves
+                # titles another upload inserted in the meantime
+                failed_titles = {
+                    new_articles[error["index"]].title
+                    for error in e.details.get("writeErrors", [])
+                }
+                retries = [
+                    article for article in health_articles
+                    if article.title in failed_titles
+                ]
+                for article, result in zip(retries, await self.upload_many(retries)):
+                    app_ids[article.title] = result if isinstance(result, str) else None
+            except Exception as e:
+                for app_article in new_articles:
+                    app_ids[app_article.title] = None
+                logger.error(f"Failed to upload articles to app database: {e}")
+            else:
+                logger.info(f"Successfully uploaded {len(new_articles)} articles to app database")
+        
+        return [app_ids.get(article.title) for article in health_articles]
+    
+    async def upload_many(
+        self, health_articles: List[HealthArticle]
+    ) -> List[Union[Optional[str], BaseException]]:
+        """
+        Upload health articles concurrently, one upload_article call each.
+        
+        For callers that need per-article upserts rather than the batched
+        insert of upload_articles. At most _MAX_CONCURRENT_UPLOADS run at
+        once.
+        
+        Args:
+            health_articles: The approved HealthArticles to upload
+            
+        Returns:
+            upload_article's result for each input article, in order; an
+            exception is returned in place rather than cancelling the rest
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_UPLOADS)
+        
+        async def upload_one(health_article: HealthArticle) -> Optional[str]:
+            async with semaphore:
+                return await self.upload_article(health_article)
+        
+        return await asyncio.gather(
+            *(upload_one(article) for article in health_articles),
+            return_exceptions=True
+        )
+    
+    @staticmethod
+    def _to_app_article(health_article: HealthArticle) -> AppArticle:
+        """Convert a HealthArticle to the app database's AppArticle format."""
+        app_article_data = AppArticleCreate(
+            title=health_article.title,
+            category=health_article.category.value,  # Convert enum to string
+            imageUrl=health_article.image_url or "",  # Ensure not None
+            medicalConditionTags=health_article.medical_condition_tags,  # Map medical condition tags
+            content=health_article.content
+        )
+        return AppArticle(**app_article_data.dict())
+    
+    @staticmethod
+    def _to_document(app_article: AppArticle) -> dict:
+        """MongoDB document for an AppArticle."""
+        return app_article.model_dump(by_alias=True, exclude={"revision_id"})
+    
     async def update_article(self, app_article_id: str, health_article: HealthArticle) -> bool:
         """
         Update an existing article in the app database.
@@ -1,8 +1,13 @@
 """Authentication service."""
 
+import hashlib
+import os
+import threading
 from datetime import datetime, timedelta
-from typing import Optional
-from jose import JWTError, jwt
+from functools import lru_cache
+from typing import Optional, Tuple
+from cachetools import TTLCache
+import jwt
 from passlib.context import CryptContext
 from app.config import settings
 from app.models.auth import User, UserInDB, TokenData
@@ -10,6 +15,15 @@ from app.models.auth import User, UserInDB, TokenData
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# How long a successful bcrypt verification is reused for repeat logins
+_VERIFY_CACHE_TTL_SECONDS = 60
+
+
+@lru_cache(maxsize=1)
+def _get_jwt_key() -> Tuple[str, str]:
+    """Load the JWT signing key and algorithm once per process."""
+    return settings.secret_key, settings.algorithm
+
 
 class AuthService:
     """Authentication service for user management and JWT tokens."""
@@ -22,14 +36,42 @@ class AuthService:
             settings.admin_username: UserInDB(
                 username=settings.admin_username,
                 hashed_password=self.get_password_hash(settings.admin_password),
-                is_active=True,
-                created_at=datetime.utcnow()
+                is_active=True
             )
         }
+        
+        # Short-lived cache of public user objects keyed by username
+        self._user_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+        
+        # Digests of recently verified (password, hash) pairs. Keyed on the
+        # hash too, so a changed password never matches an old entry; only
+        # successes are cached. The digests are keyed with a per-process
+        # secret so they can't be brute-forced offline like a plain fast
+        # hash. verify_password runs in the threadpool, hence the lock.
+        self._verify_cache: TTLCache = TTLCache(maxsize=256, ttl=_VERIFY_CACHE_TTL_SECONDS)
+        self._verify_cache_secret = os.urandom(32)
+        self._verify_cache_lock = threading.Lock()
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        """Verify a password against its hash."""
-        return pwd_context.verify(plain_password, hashed_password)
+        """Verify a password against its hash.
+        
+        bcrypt is deliberately slow (~100 ms); a pair that verified within
+        the last minute is accepted from the cache instead.
+        """
+        cache_key = hashlib.blake2b(
+            f"{hashed_password}\0{plain_password}".encode(),
+            key=self._verify_cache_secret
+        ).digest()
+        with self._verify_cache_lock:
+            if cache_key in self._verify_cache:
+                return True
+        
+        if not pwd_context.verify(plain_password, hashed_password):
+            return False
+        
+        with self._verify_cache_lock:
+            self._verify_cache[cache_key] = True
+        return True
     
     def get_password_hash(self, password: str) -> str:
         """Hash a password."""
@@ -57,20 +99,30 @@ class AuthService:
             expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
         
         to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+        key, algorithm = _get_jwt_key()
+        encoded_jwt = jwt.encode(to_encode, key, algorithm=algorithm)
         return encoded_jwt
     
+    def decode_token(self, token: str) -> Optional[dict]:
+        """Check a JWT's signature and expiry and return its claims."""
+        try:
+            key, algorithm = _get_jwt_key()
+            return jwt.decode(
+                token, key, algorithms=[algorithm], options={"verify_aud": False}
+            )
+        except jwt.InvalidTokenError:
+            return None
+    
     def verify_token(self, token: str) -> Optional[TokenData]:
         """Verify and decode a JWT token."""
-        try:
-            payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-            username: str = payload.get("sub")
-            if username is None:
-                return None
-            token_data = TokenData(username=username)
-            return token_data
-        except JWTError:
+        payload = self.decode_token(token)
+        if payload is None:
+            return None
+        username: str = payload.get("sub")
+        if username is None:
             return None
+        token_data = TokenData(username=username)
+        return token_data
     
     def get_current_user(self, token: str) -> Optional[User]:
         """Get current user from token."""
@@ -78,15 +130,21 @@ class AuthService:
         if token_data is None:
             return None
         
-        user = self.get_user(username=token_data.username)
-        if user is None:
+        user = self._user_cache.get(token_data.username)
+        if user is not None:
+            return user
+        
+        user_in_db = self.get_user(username=token_data.username)
+        if user_in_db is None:
             return None
         
-        return User(
-            username=user.username,
-            is_active=user.is_active,
-            created_at=user.created_at
+        user = User(
+            username=user_in_db.username,
+            is_active=user_in_db.is_active,
+            created_at=user_in_db.created_at
         )
+        self._user_cache[token_data.username] = user
+        return user
 
 
 # Global auth service instance
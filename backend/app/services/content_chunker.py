@@ -1,13 +1,29 @@
 """Content chunking service for breaking down PDF content into manageable pieces."""
 
 import re
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from functools import lru_cache, partial
+from typing import AsyncIterator, List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass
+
+import ahocorasick
+
 from app.config import settings
+from app.core.process_pool import get_process_pool
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every page/chunk, compiled once
+_WHITESPACE_RE = re.compile(r'\s+')
+_PAGE_NUMBER_RE = re.compile(r'^\d+\s*$')
+_HEADER_FOOTER_RE = re.compile(r'^(page|chapter|\d+)\s*\d*\s*$', re.IGNORECASE)
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+_SENTENCE_END_RE = re.compile(r'[.!?]+\s+')
+_LIST_ITEM_RE = re.compile(r'^\s*[•\-\*\d+\.\)]\s+', re.MULTILINE)
+_TABLE_SPACING_RE = re.compile(r'\s{3,}')
+
 
 @dataclass
 class ContentChunk:
@@ -22,15 +38,38 @@ class ContentChunk:
     relevance_score: Optional[float] = None
     chunk_type: str = "text"  # text, header, list, table
     medical_keywords: List[str] = None
+    category_scores: Dict[str, float] = None  # Share of each keyword category present
     
     def __post_init__(self):
         if self.medical_keywords is None:
             self.medical_keywords = []
+        if self.category_scores is None:
+            self.category_scores = {}
+
+
+@lru_cache(maxsize=None)
+def _get_worker_chunker(target_chunk_size: int) -> "ContentChunker":
+    """Chunker reused by every page a pool process handles."""
+    return ContentChunker(target_chunk_size)
+
+
+def _chunk_and_score_page_in_worker(target_chunk_size: int, *args) -> Tuple[int, List[ContentChunk]]:
+    """Process pool entry point for ContentChunker._chunk_and_score_page."""
+    return _get_worker_chunker(target_chunk_size)._chunk_and_score_page(*args)
 
 
 class ContentChunker:
     """Service for chunking PDF content into logical units."""
     
+    # Relevance weight of each keyword category
+    _CATEGORY_WEIGHTS = (
+        ('conditions', 0.3),
+        ('treatments', 0.25),
+        ('symptoms', 0.2),
+        ('lifestyle', 0.15),
+        ('care', 0.1)
+    )
+    
     def __init__(self, target_chunk_size: int = None):
         """Initialize content chunker.
         
@@ -76,10 +115,38 @@ class ContentChunker:
             ]
         }
         
+        # Freeze the keyword groups; they're read on every chunk
+        self.health_keywords = {
+            category: tuple(keywords)
+            for category, keywords in self.health_keywords.items()
+        }
+        
         # Flatten keywords for easy searching
-        self.all_health_keywords = []
-        for category in self.health_keywords.values():
-            self.all_health_keywords.extend(category)
+        self.all_health_keywords = tuple(
+            keyword
+            for keywords in self.health_keywords.values()
+            for keyword in keywords
+        )
+        
+        # 1 / number of keywords per category, for the coverage scores
+        self._inverse_category_sizes = {
+            category: 1.0 / len(keywords)
+            for category, keywords in self.health_keywords.items()
+        }
+        
+        # Categories each keyword belongs to (a few are in more than one)
+        self._keyword_categories: Dict[str, List[str]] = {}
+        for category, keywords in self.health_keywords.items():
+            for keyword in keywords:
+                self._keyword_categories.setdefault(keyword, []).append(category)
+        
+        # Aho-Corasick automaton over all keywords: one pass over the content
+        # finds every keyword (overlapping ones included) instead of one
+        # substring search per keyword
+        self._keyword_automaton = ahocorasick.Automaton()
+        for keyword in self._keyword_categories:
+            self._keyword_automaton.add_word(keyword, keyword)
+        self._keyword_automaton.make_automaton()
     
     def chunk_content(self, pdf_content, pdf_document_id: str) -> List[ContentChunk]:
         """Chunk PDF content into logical units.
@@ -92,20 +159,19 @@ class ContentChunker:
             List of ContentChunk objects
         """
         chunks = []
-        chunk_counter = 0
         
         logger.info(f"Starting content chunking for PDF {pdf_document_id}")
         
         for page in pdf_content.pages:
+            # Chunk indexes continue from the previous pages'
             page_chunks = self._chunk_page_content(
                 page.text, 
                 page.page_number, 
                 pdf_document_id,
-                chunk_counter
+                start_chunk_index=len(chunks)
             )
             
-            chunks.extend(page_chunks)
-            chunk_counter += len(page_chunks)
+            chunks += page_chunks
             
             logger.debug(f"Page {page.page_number}: Created {len(page_chunks)} chunks")
         
@@ -115,6 +181,80 @@ class ContentChunker:
         logger.info(f"Chunking completed: {len(chunks)} total chunks, {len(relevant_chunks)} relevant")
         return relevant_chunks
     
+    async def stream_chunks(self, pdf_content, pdf_document_id: str) -> AsyncIterator[List[ContentChunk]]:
+        """Chunk PDF content page by page without blocking the event loop.
+        
+        A producer task chunks and scores each page in a worker process (or
+        the default thread executor, see get_process_pool) and queues the
+        page's relevant chunks, so the consumer can work on one page's
+        chunks while the following pages are being chunked. Concurrent
+        PDFs are chunked on separate cores.
+        
+        Args:
+            pdf_content: PDFContent object from PDF parser
+            pdf_document_id: ID of the source PDF document
+            
+        Yields:
+            The relevant ContentChunk objects of each page that has any
+        """
+        loop = asyncio.get_running_loop()
+        pool = get_process_pool()
+        if pool is None:
+            chunk_page = self._chunk_and_score_page
+        else:
+            # The worker processes build their own chunker once instead of
+            # receiving this one (keyword automaton included) with each page
+            chunk_page = partial(_chunk_and_score_page_in_worker, self.target_chunk_size)
+        queue: asyncio.Queue = asyncio.Queue()
+        totals = {"chunks": 0, "relevant": 0}
+        
+        async def produce():
+            try:
+                for page in pdf_content.pages:
+                    created, relevant_chunks = await loop.run_in_executor(
+                        pool,
+                        chunk_page,
+                        page.text,
+                        page.page_number,
+                        pdf_document_id,
+                        totals["chunks"]
+                    )
+                    totals["chunks"] += created
+                    totals["relevant"] += len(relevant_chunks)
+                    if relevant_chunks:
+                        queue.put_nowait(relevant_chunks)
+            finally:
+                # End of stream, also when chunking failed
+                queue.put_nowait(None)
+        
+        logger.info(f"Starting content chunking for PDF {pdf_document_id}")
+        
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                page_chunks = await queue.get()
+                if page_chunks is None:
+                    break
+                yield page_chunks
+            
+            # Re-raise a chunking error
+            await producer
+        finally:
+            producer.cancel()
+        
+        logger.info(f"Chunking completed: {totals['chunks']} total chunks, {totals['relevant']} relevant")
+    
+    def _chunk_and_score_page(self, text: str, page_number: int,
+                              pdf_document_id: str, start_chunk_index: int) -> Tuple[int, List[ContentChunk]]:
+        """Chunk a single page and keep its relevant chunks.
+        
+        Returns:
+            Tuple of (number of chunks created, relevant chunks)
+        """
+        page_chunks = self._chunk_page_content(text, page_number, pdf_document_id, start_chunk_index)
+        logger.debug(f"Page {page_number}: Created {len(page_chunks)} chunks")
+        return len(page_chunks), self._filter_and_score_chunks(page_chunks)
+    
     def _chunk_page_content(self, text: str, page_number: int, 
                            pdf_document_id: str, start_chunk_index: int) -> List[ContentChunk]:
         """Chunk content from a single page."""
@@ -178,7 +318,7 @@ class ContentChunker:
             return ""
         
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Remove page numbers and headers/footers (simple heuristics)
         lines = text.split('\n')
@@ -192,11 +332,11 @@ class ContentChunker:
                 continue
             
             # Skip lines that are mostly numbers (page numbers, etc.)
-            if re.match(r'^\d+\s*$', line):
+            if _PAGE_NUMBER_RE.match(line):
                 continue
             
             # Skip lines that look like headers/footers
-            if re.match(r'^(page|chapter|\d+)\s*\d*\s*$', line, re.IGNORECASE):
+            if _HEADER_FOOTER_RE.match(line):
                 continue
             
             cleaned_lines.append(line)
@@ -206,7 +346,7 @@ class ContentChunker:
     def _split_into_paragraphs(self, text: str) -> List[str]:
         """Split text into logical paragraphs."""
         # Split on double newlines first
-        paragraphs = re.split(r'\n\s*\n', text)
+        paragraphs = _PARAGRAPH_BREAK_RE.split(text)
         
         # Further split very long paragraphs
         final_paragraphs = []
@@ -218,7 +358,7 @@ class ContentChunker:
             # If paragraph is very long, try to split on sentence boundaries
             words = para.split()
             if len(words) > self.target_chunk_size:
-                sentences = re.split(r'[.!?]+\s+', para)
+                sentences = _SENTENCE_END_RE.split(para)
                 current_para = ""
                 current_words = 0
                 
@@ -247,16 +387,11 @@ class ContentChunker:
     def _create_chunk(self, content: str, chunk_index: int, 
                      page_number: int, pdf_document_id: str) -> ContentChunk:
         """Create a ContentChunk object."""
-        import uuid
-        
         chunk_id = f"{pdf_document_id}_chunk_{chunk_index}"
         word_count = len(content.split())
         
-        # Detect chunk type
-        chunk_type = self._detect_chunk_type(content)
-        
-        # Extract medical keywords
-        medical_keywords = self._extract_medical_keywords(content)
+        # Detect chunk type, extract medical keywords and score categories
+        chunk_type, medical_keywords, category_scores = self._analyze(content)
         
         return ContentChunk(
             chunk_id=chunk_id,
@@ -266,9 +401,33 @@ class ContentChunker:
             content=content,
             word_count=word_count,
             chunk_type=chunk_type,
-            medical_keywords=medical_keywords
+            medical_keywords=medical_keywords,
+            category_scores=category_scores
         )
     
+    def _analyze(self, content: str) -> Tuple[str, List[str], Dict[str, float]]:
+        """Analyze chunk content in a single keyword pass.
+        
+        Returns:
+            Tuple of (chunk_type, medical_keywords, category_scores), where
+            category_scores is the fraction of each category's keywords
+            found in the content
+        """
+        medical_keywords = self._scan_keywords(content.lower())
+        
+        # Count keywords by category
+        category_hits = Counter(
+            category
+            for keyword in medical_keywords
+            for category in self._keyword_categories[keyword]
+        )
+        category_scores = {
+            category: category_hits[category] * inverse_size
+            for category, inverse_size in self._inverse_category_sizes.items()
+        }
+        
+        return self._detect_chunk_type(content), list(medical_keywords), category_scores
+    
     def _detect_chunk_type(self, content: str) -> str:
         """Detect the type of content chunk."""
         # Check if it's a header (short, title-case, no ending punctuation)
@@ -278,29 +437,24 @@ class ContentChunker:
             return "header"
         
         # Check if it's a list (contains bullet points or numbered items)
-        if re.search(r'^\s*[•\-\*\d+\.\)]\s+', content, re.MULTILINE):
+        if _LIST_ITEM_RE.search(content):
             return "list"
         
         # Check if it contains tabular data
-        if '\t' in content or re.search(r'\s{3,}', content):
+        if '\t' in content or _TABLE_SPACING_RE.search(content):
             return "table"
         
         return "text"
     
-    def _extract_medical_keywords(self, content: str) -> List[str]:
-        """Extract medical keywords from content."""
-        content_lower = content.lower()
-        found_keywords = []
-        
-        for keyword in self.all_health_keywords:
-            if keyword.lower() in content_lower:
-                found_keywords.append(keyword)
-        
-        return list(set(found_keywords))  # Remove duplicates
+    def _scan_keywords(self, content_lower: str) -> Set[str]:
+        """Find every health keyword occurring in lowercased content."""
+        return {keyword for _, keyword in self._keyword_automaton.iter(content_lower)}
     
     def _filter_and_score_chunks(self, chunks: List[ContentChunk]) -> List[ContentChunk]:
         """Filter chunks for relevance and assign relevance scores."""
         relevant_chunks = []
+        # Checked once: the per-chunk message is only formatted when it's logged
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         for chunk in chunks:
             relevance_score = self._calculate_relevance_score(chunk)
@@ -311,8 +465,9 @@ class ContentChunker:
                 chunk.is_relevant = True
                 relevant_chunks.append(chunk)
             
-            logger.debug(f"Chunk {chunk.chunk_id}: relevance={relevance_score:.2f}, "
-                        f"keywords={len(chunk.medical_keywords)}")
+            if debug_enabled:
+                logger.debug(f"Chunk {chunk.chunk_id}: relevance={relevance_score:.2f}, "
+                            f"keywords={len(chunk.medical_keywords)}")
         
         return relevant_chunks
     
@@ -321,31 +476,23 @@ class ContentChunker:
         if not chunk.content:
             return 0.0
         
-        content_lower = chunk.content.lower()
         total_words = chunk.word_count
         
         if total_words == 0:
             return 0.0
         
-        # Count keyword occurrences by category
-        category_scores = {}
-        for category, keywords in self.health_keywords.items():
-            keyword_count = sum(1 for keyword in keywords if keyword in content_lower)
-            category_scores[category] = keyword_count / len(keywords)
-        
-        # Weight different categories
-        weights = {
-            'conditions': 0.3,
-            'treatments': 0.25,
-            'symptoms': 0.2,
-            'lifestyle': 0.15,
-            'care': 0.1
-        }
+        # Off-topic chunks (copyright notices, tables of contents, ...)
+        # have no health keywords at all and would score 0 anyway
+        if not chunk.medical_keywords:
+            return 0.0
+        
+        # Keyword coverage by category, computed when the chunk was created
+        category_scores = chunk.category_scores
         
         # Calculate weighted score
         weighted_score = sum(
             category_scores.get(category, 0) * weight 
-            for category, weight in weights.items()
+            for category, weight in self._CATEGORY_WEIGHTS
         )
         
         # Bonus for having multiple categories represented
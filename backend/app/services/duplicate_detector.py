@@ -1,18 +1,52 @@
 """Duplicate detection service for preventing duplicate health articles."""
 
+import asyncio
+import hashlib
 import logging
-from typing import List, Optional, Tuple
+import os
+import re
+import tempfile
+from typing import Dict, List, Optional, Set, Tuple, Union
+import joblib
 import numpy as np
+import scipy.sparse
+import sklearn
+from rapidfuzz import fuzz
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import difflib
 
 from app.config import settings
-from app.models.health_article import HealthArticle
+from app.models.health_article import DuplicateCheckProjection, HealthArticle
 from app.services.gemini_summarizer import SummarizedContent
 
 logger = logging.getLogger(__name__)
 
+# File in settings.duplicate_cache_dir holding the fitted vector cache
+_CACHE_FILENAME = "duplicate_detector.joblib"
+
+# Stored articles are loaded as projections; pending ones are full documents
+ComparedArticle = Union[HealthArticle, DuplicateCheckProjection]
+
+# Patterns used by _clean_text, compiled once
+_ABBREVIATION_RE = re.compile(r'\b(dash|hbp|bp)\b')
+_ABBREVIATIONS = {
+    'dash': 'dietary approaches to stop hypertension',
+    'hbp': 'high blood pressure',
+    'bp': 'blood pressure',
+}
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\.\!\?]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Largest share of a new text's distinct words the vectorizer's fit may not
+# have seen before scoring refits with the text included. Terms outside the
+# vocabulary are dropped from the new vector before it's normalized, which
+# inflates its scores against the articles it does share terms with; a fit
+# on a corpus that covers the text's words would drop them too.
+_MAX_UNSEEN_WORD_SHARE = 0.1
+
+# Everything but letters, digits and whitespace (\w also matches "_")
+_TITLE_PUNCTUATION_RE = re.compile(r'[^\w\s]|_')
+
 
 class DuplicateDetector:
     """Service for detecting duplicate health articles using text similarity."""
@@ -37,21 +71,43 @@ class DuplicateDetector:
             ngram_range=(1, 3),  # Use unigrams, bigrams, and trigrams
             min_df=1,  # Minimum document frequency
             max_df=0.9,  # Maximum document frequency
-            token_pattern=r'\b\w+\b'  # Better tokenization
+            token_pattern=r'\b\w+\b',  # Better tokenization
+            dtype=np.float32  # Halves the cached matrix; ample precision for scores
         )
+        self._tokenize = self.vectorizer.build_tokenizer()
         
-        # Cache for existing articles and their vectors
-        self._article_cache = {}
+        # Cache for existing articles and their vectors. The vectorizer is
+        # fitted on the cached articles once; _vector_cache holds their
+        # TF-IDF rows, in _cached_article_ids order. _article_cache maps
+        # article id -> (content hash, cleaned comparison text).
+        self._article_cache: Dict[str, Tuple[str, str]] = {}
         self._vector_cache = None
+        self._term_index = None  # Transpose of _vector_cache, built on demand
+        self._cached_article_ids: List[str] = []
+        self._cached_positions: Dict[str, int] = {}
+        self._fitted_rows = 0  # Articles the vectorizer was fitted on
+        self._fitted_words: Set[str] = set()  # Words of the texts it was fitted on
         self._cache_dirty = True
         
+        # article id -> (title, normalized title, cleaned title)
+        self._title_cache: Dict[str, Tuple[str, str, str]] = {}
+        
+        # Start from the vectors fitted by a previous process, if any
+        self._load_persisted_cache()
+        
         logger.info(f"DuplicateDetector initialized with threshold: {self.similarity_threshold:.2f}")
     
-    async def check_for_duplicates(self, new_content: SummarizedContent) -> List[Tuple[str, float]]:
+    async def check_for_duplicates(
+        self,
+        new_content: SummarizedContent,
+        pending_articles: Optional[List[HealthArticle]] = None
+    ) -> List[Tuple[str, float]]:
         """Check if new content is similar to existing articles.
         
         Args:
             new_content: SummarizedContent object to check
+            pending_articles: Articles accepted but not yet saved (with ids
+                assigned), checked alongside the stored ones
             
         Returns:
             List of tuples (article_id, similarity_score) for potential duplicates
@@ -59,33 +115,31 @@ class DuplicateDetector:
         try:
             logger.info(f"Checking for duplicates: '{new_content.title}'")
             
-            # Get existing articles from database
-            existing_articles = await self._get_existing_articles()
+            # Get existing articles from database, preparing the new text
+            # while the query is in flight
+            articles_fetch = asyncio.create_task(self._get_existing_articles())
+            await asyncio.sleep(0)  # Let the fetch send its query
+            new_text = self._prepare_text_for_comparison(new_content)
+            existing_articles = await articles_fetch
+            if pending_articles:
+                existing_articles = existing_articles + pending_articles
             
             if not existing_articles:
                 logger.info("No existing articles found - no duplicates possible")
                 return []
             
-            # First check for title-based duplicates (faster)
+            # First check for title-based duplicates (faster); any match
+            # skips the content check
             title_duplicates = self._check_title_similarity(new_content, existing_articles)
             if title_duplicates:
                 logger.warning(f"Found title-based duplicates for '{new_content.title}'")
                 return title_duplicates
             
-            # Then check for content-based duplicates
-            content_duplicates = await self._check_content_similarity(new_content, existing_articles)
-            
-            # Combine and deduplicate results
-            all_duplicates = {}
-            for article_id, score in content_duplicates:
-                all_duplicates[article_id] = max(all_duplicates.get(article_id, 0), score)
-            
-            # Filter by threshold and sort
-            final_duplicates = [
-                (article_id, score) for article_id, score in all_duplicates.items()
-                if score >= self.similarity_threshold
-            ]
-            final_duplicates.sort(key=lambda x: x[1], reverse=True)
+            # Then check for content-based duplicates (already filtered by
+            # threshold and sorted)
+            final_duplicates = await self._check_content_similarity(
+                new_content, existing_articles, new_text=new_text
+            )
             
             if final_duplicates:
                 logger.warning(f"Found {len(final_duplicates)} potential duplicates for '{new_content.title}'")
@@ -101,7 +155,7 @@ class DuplicateDetector:
             return []
     
     def _check_title_similarity(self, new_content: SummarizedContent, 
-                               existing_articles: List[HealthArticle]) -> List[Tuple[str, float]]:
+                               existing_articles: List[ComparedArticle]) -> List[Tuple[str, float]]:
         """Check for title-based duplicates using string similarity.
         
         Args:
@@ -112,61 +166,104 @@ class DuplicateDetector:
             List of tuples (article_id, similarity_score) for title duplicates
         """
         title_duplicates = []
+        threshold = self.title_similarity_threshold
         new_title = new_content.title.lower().strip()
+        clean_new = self._clean_title(new_title)
         
         for article in existing_articles:
-            existing_title = article.title.lower().strip()
-            
-            # Calculate string similarity using difflib
-            similarity = difflib.SequenceMatcher(None, new_title, existing_title).ratio()
-            
-            # Also check if one title is contained in the other (for variations)
-            if len(new_title) > 10 and len(existing_title) > 10:
-                if new_title in existing_title or existing_title in new_title:
-                    similarity = max(similarity, 0.85)
+            existing_title, clean_existing = self._get_article_titles(article)
             
             # Check for very similar titles with different punctuation/formatting
-            clean_new = ''.join(c.lower() for c in new_title if c.isalnum() or c.isspace()).strip()
-            clean_existing = ''.join(c.lower() for c in existing_title if c.isalnum() or c.isspace()).strip()
-            
             if clean_new == clean_existing:
                 similarity = 1.0
-            elif clean_new and clean_existing:
-                clean_similarity = difflib.SequenceMatcher(None, clean_new, clean_existing).ratio()
-                similarity = max(similarity, clean_similarity)
+            else:
+                similarity = 0.0
+                
+                # Check if one title is contained in the other (for variations)
+                if len(new_title) > 10 and len(existing_title) > 10:
+                    if new_title in existing_title or existing_title in new_title:
+                        similarity = 0.85
+                
+                # String similarity using difflib, skipped for pairs that
+                # can't reach the threshold
+                similarity = max(similarity, self._title_ratio(new_title, existing_title, threshold))
+                if clean_new and clean_existing:
+                    similarity = max(similarity, self._title_ratio(clean_new, clean_existing, threshold))
             
-            if similarity >= self.title_similarity_threshold:
+            if similarity >= threshold:
                 title_duplicates.append((str(article.id), similarity))
                 logger.info(f"Title similarity found: '{new_title}' vs '{existing_title}' = {similarity:.3f}")
         
+        if len(self._title_cache) > 2 * len(existing_articles):
+            # Drop titles of articles that are gone
+            current_ids = {str(article.id) for article in existing_articles}
+            self._title_cache = {
+                article_id: titles for article_id, titles in self._title_cache.items()
+                if article_id in current_ids
+            }
+        
         return sorted(title_duplicates, key=lambda x: x[1], reverse=True)
     
+    def _get_article_titles(self, article: ComparedArticle) -> Tuple[str, str]:
+        """Normalized and cleaned title of an existing article, cached by id."""
+        article_id = str(article.id)
+        cached = self._title_cache.get(article_id)
+        if cached is None or cached[0] != article.title:
+            existing_title = article.title.lower().strip()
+            cached = (article.title, existing_title, self._clean_title(existing_title))
+            self._title_cache[article_id] = cached
+        return cached[1], cached[2]
+    
+    @staticmethod
+    def _clean_title(title: str) -> str:
+        """Title without punctuation (expects an already lowercased title)."""
+        return _TITLE_PUNCTUATION_RE.sub('', title).strip()
+    
+    @staticmethod
+    def _title_ratio(a: str, b: str, threshold: float) -> float:
+        """difflib similarity ratio of two titles, or 0.0 below the threshold.
+        
+        RapidFuzz's ratio is based on the longest common subsequence, which
+        is never below difflib's matching blocks, so it rejects pairs that
+        can't reach the threshold in native code (length bound included)
+        before the pure-Python ratio() is computed.
+        """
+        # Small margin so float rounding can't reject a pair at the threshold
+        if not fuzz.ratio(a, b, score_cutoff=threshold * 100 - 1e-6):
+            return 0.0
+        return difflib.SequenceMatcher(None, a, b).ratio()
+    
     async def _check_content_similarity(self, new_content: SummarizedContent,
-                                      existing_articles: List[HealthArticle]) -> List[Tuple[str, float]]:
+                                      existing_articles: List[ComparedArticle],
+                                      new_text: Optional[str] = None) -> List[Tuple[str, float]]:
         """Check for content-based duplicates using TF-IDF similarity.
         
         Args:
             new_content: New content to check
             existing_articles: List of existing articles
+            new_text: The content's prepared comparison text, if already built
             
         Returns:
-            List of tuples (article_id, similarity_score) for content duplicates
+            List of tuples (article_id, similarity_score) for content
+            duplicates, highest score first
         """
         # Prepare text for comparison
-        new_text = self._prepare_text_for_comparison(new_content)
+        if new_text is None:
+            new_text = self._prepare_text_for_comparison(new_content)
         
         # Get similarity scores
         similar_articles = await self._find_similar_articles(new_text, existing_articles)
         
         return similar_articles
     
-    async def _get_existing_articles(self) -> List[HealthArticle]:
-        """Get all existing articles from the database."""
+    async def _get_existing_articles(self) -> List[DuplicateCheckProjection]:
+        """Get all existing articles from the database (compared fields only)."""
         try:
             # Get all articles except rejected ones
-            articles = await HealthArticle.find({
-                "processing_status": {"$ne": "rejected"}
-            }).to_list()
+            articles = await HealthArticle.find(
+                {"processing_status": {"$ne": "rejected"}},
+                projection_model=DuplicateCheckProjection
+            ).to_list()
             
             logger.debug(f"Retrieved {len(articles)} existing articles for duplicate checking")
             return articles
@@ -198,11 +295,11 @@ class DuplicateDetector:
         cleaned_text = self._clean_text(combined_text)
         return cleaned_text
     
-    def _prepare_article_text(self, article: HealthArticle) -> str:
+    def _prepare_article_text(self, article: ComparedArticle) -> str:
         """Prepare existing article text for comparison.
         
         Args:
-            article: HealthArticle object
+            article: Stored or pending article
             
         Returns:
             Prepared text string
@@ -217,6 +314,31 @@ class DuplicateDetector:
         cleaned_text = self._clean_text(combined_text)
         return cleaned_text
     
+    @staticmethod
+    def _article_hash(article: ComparedArticle) -> str:
+        """Hash of the article fields that go into its comparison text."""
+        key = "\0".join([article.title, article.content, *article.medical_condition_tags])
+        return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    
+    def _get_article_text(self, article: ComparedArticle) -> str:
+        """Comparison text for an existing article, cleaned once per version.
+        
+        Args:
+            article: Stored or pending article
+            
+        Returns:
+            Prepared text string
+        """
+        article_id = str(article.id)
+        content_hash = self._article_hash(article)
+        cached = self._article_cache.get(article_id)
+        if cached is not None and cached[0] == content_hash:
+            return cached[1]
+        
+        article_text = self._prepare_article_text(article)
+        self._article_cache[article_id] = (content_hash, article_text)
+        return article_text
+    
     def _clean_text(self, text: str) -> str:
         """Clean text for better comparison.
         
@@ -229,29 +351,17 @@ class DuplicateDetector:
         if not text:
             return ""
         
-        import re
-        
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Normalize common health terms and abbreviations
-        text = re.sub(r'\bdash\b', 'dietary approaches to stop hypertension', text)
-        text = re.sub(r'\bhbp\b', 'high blood pressure', text)
-        text = re.sub(r'\bbp\b', 'blood pressure', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        # Lowercase and normalize common health terms and abbreviations
+        text = _ABBREVIATION_RE.sub(lambda m: _ABBREVIATIONS[m.group(1)], text.lower())
         
         # Remove special characters but keep spaces and basic punctuation
-        text = re.sub(r'[^\w\s\.\!\?]', ' ', text)
-        
-        # Remove extra spaces again
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _SPECIAL_CHARS_RE.sub(' ', text)
         
-        return text
+        # Collapse whitespace once, after everything that introduces spaces
+        return _WHITESPACE_RE.sub(' ', text).strip()
     
     async def _find_similar_articles(self, new_text: str, 
-                                   existing_articles: List[HealthArticle]) -> List[Tuple[str, float]]:
+                                   existing_articles: List[ComparedArticle]) -> List[Tuple[str, float]]:
         """Find articles similar to the new text.
         
         Args:
@@ -259,57 +369,291 @@ class DuplicateDetector:
             existing_articles: List of existing articles
             
         Returns:
-            List of tuples (article_id, similarity_score)
+            List of tuples (article_id, similarity_score) for the articles at
+            or above the similarity threshold, highest score first
         """
         if not existing_articles:
             return []
         
         try:
-            # Prepare existing article texts
-            existing_texts = []
-            article_ids = []
-            
-            for article in existing_articles:
-                article_text = self._prepare_article_text(article)
-                if article_text:  # Only include non-empty texts
-                    existing_texts.append(article_text)
-                    article_ids.append(str(article.id))
-            
-            if not existing_texts:
+            article_ids, scores = self._score_content([new_text], existing_articles)
+            if scores is None:
                 return []
             
-            # Combine all texts for vectorization
-            all_texts = existing_texts + [new_text]
-            
-            # Vectorize texts
-            tfidf_matrix = self.vectorizer.fit_transform(all_texts)
-            
-            # Calculate similarities between new text and existing texts
-            new_vector = tfidf_matrix[-1]  # Last vector is the new text
-            existing_vectors = tfidf_matrix[:-1]  # All but the last vector
-            
-            # Calculate cosine similarities
-            similarities = cosine_similarity(new_vector, existing_vectors).flatten()
-            
-            # Create result list
-            similar_articles = []
-            for i, similarity in enumerate(similarities):
-                if i < len(article_ids):  # Safety check
-                    similar_articles.append((article_ids[i], float(similarity)))
-            
-            # Sort by similarity score (highest first)
-            similar_articles.sort(key=lambda x: x[1], reverse=True)
-            
             # Log top similarities for debugging
-            if similar_articles:
-                logger.debug(f"Top similarities: {similar_articles[:3]}")
+            if logger.isEnabledFor(logging.DEBUG) and article_ids:
+                # Partial selection of the top 3 instead of sorting every score
+                k = min(3, len(article_ids))
+                top = np.argpartition(-scores[0], k - 1)[:k]
+                top = top[np.argsort(-scores[0, top], kind="stable")]
+                logger.debug(f"Top similarities: {[(article_ids[j], float(scores[0, j])) for j in top]}")
             
-            return similar_articles
+            return self._matches_above_threshold(article_ids, scores[0])
             
         except Exception as e:
             logger.error(f"Error calculating similarities: {e}")
             return []
     
+    def _matches_above_threshold(self, article_ids: List[str],
+                                 scores: np.ndarray) -> List[Tuple[str, float]]:
+        """Articles whose score reaches the similarity threshold, highest first.
+        
+        Args:
+            article_ids: Ids of the scored articles
+            scores: Similarity score for each article
+        """
+        matches = np.flatnonzero(scores >= self.similarity_threshold)
+        matches = matches[np.argsort(-scores[matches], kind="stable")]
+        return [(article_ids[j], float(scores[j])) for j in matches]
+    
+    def _score_content(self, new_texts: List[str],
+                       existing_articles: List[ComparedArticle]) -> Tuple[List[str], Optional[np.ndarray]]:
+        """TF-IDF cosine similarity of new texts against the existing articles.
+        
+        Args:
+            new_texts: Prepared texts of the new articles
+            existing_articles: List of existing articles
+            
+        Returns:
+            Ids of the scored articles and a len(new_texts) x len(ids) score
+            matrix, or None if there is nothing to compare against
+        """
+        # Vectorize only what isn't cached yet, then just the new texts
+        self._update_vector_cache(existing_articles)
+        if self._vector_cache is None or not new_texts:
+            return [], None
+        
+        # New texts the vocabulary doesn't cover are scored as a fit that
+        # includes them would score them
+        if not self._vocabulary_covers(new_texts):
+            self._rebuild_vector_cache(existing_articles, new_texts)
+            if self._vector_cache is None:
+                return [], None
+        
+        # The vectorizer L2-normalizes its rows, so cosine similarity is a
+        # plain sparse product
+        new_vectors = self.vectorizer.transform(new_texts)
+        scores = (new_vectors @ self._get_term_index()).toarray()
+        
+        # Leave out cached articles that are no longer current
+        current_ids = {str(article.id) for article in existing_articles}
+        columns = [
+            i for i, article_id in enumerate(self._cached_article_ids)
+            if article_id in current_ids
+        ]
+        if len(columns) < len(self._cached_article_ids):
+            scores = scores[:, columns]
+        
+        return [self._cached_article_ids[i] for i in columns], scores
+    
+    def _update_vector_cache(self, existing_articles: List[ComparedArticle]):
+        """Bring the TF-IDF vector cache up to date with the existing articles.
+        
+        Reuses the cache when the articles are all cached already (articles
+        that are no longer current are skipped when scoring), appends rows
+        for articles added since, and refits the vectorizer only when the
+        cache is dirty or has doubled since the last fit.
+        
+        Args:
+            existing_articles: The articles duplicates are checked against
+        """
+        new_articles = []
+        for article in existing_articles:
+            article_id = str(article.id)
+            if article_id not in self._cached_positions:
+                new_articles.append(article)
+            elif self._article_cache[article_id][0] != self._article_hash(article):
+                # Edited since it was vectorized
+                self._cache_dirty = True
+        
+        if not self._cache_dirty and self._vector_cache is not None:
+            if not new_articles:
+                return
+            if len(self._cached_article_ids) + len(new_articles) <= 2 * self._fitted_rows:
+                self.add_articles(new_articles)
+                return
+        
+        self._rebuild_vector_cache(existing_articles)
+    
+    def _vocabulary_covers(self, texts: List[str]) -> bool:
+        """Whether the current fit scores texts about as a fit including them would.
+        
+        True when at most _MAX_UNSEEN_WORD_SHARE of the texts' distinct
+        words are missing from the texts the vectorizer was fitted on.
+        """
+        words = self._words(texts)
+        if not words:
+            return True
+        unseen = len(words - self._fitted_words)
+        return unseen <= _MAX_UNSEEN_WORD_SHARE * len(words)
+    
+    def _words(self, texts: List[str]) -> Set[str]:
+        """Distinct words of texts, as the vectorizer tokenizes them."""
+        return {word for text in texts for word in self._tokenize(text.lower())}
+    
+    def _rebuild_vector_cache(self, articles: List[ComparedArticle],
+                              extra_texts: Optional[List[str]] = None):
+        """Fit the vectorizer on the given articles and cache their vectors.
+        
+        Args:
+            articles: The articles to cache
+            extra_texts: Texts to include in the fit without caching them
+                (new texts being checked)
+        """
+        # Keep cleaned texts for these articles only
+        previous_texts = self._article_cache
+        self._article_cache = {}
+        
+        texts = []
+        article_ids = []
+        for article in articles:
+            article_id = str(article.id)
+            if article_id in previous_texts:
+                self._article_cache[article_id] = previous_texts[article_id]
+            article_text = self._get_article_text(article)
+            if article_text:  # Only include non-empty texts
+                texts.append(article_text)
+                article_ids.append(article_id)
+        
+        self._vector_cache = None
+        self._term_index = None
+        self._cached_article_ids = []
+        self._cached_positions = {}
+        self._fitted_rows = 0
+        
+        if not texts:
+            return
+        
+        try:
+            fit_texts = texts + (extra_texts or [])
+            vectors = self.vectorizer.fit_transform(fit_texts)
+            self._vector_cache = vectors[:len(texts)].tocsr()
+        except ValueError as e:
+            # e.g. every term pruned by max_df with very few articles
+            logger.debug(f"Could not fit duplicate detection vocabulary: {e}")
+            return
+        
+        self._fitted_words = self._words(fit_texts)
+        self._cached_article_ids = article_ids
+        self._cached_positions = {article_id: i for i, article_id in enumerate(article_ids)}
+        self._fitted_rows = len(article_ids)
+        self._cache_dirty = False
+        logger.debug(f"Rebuilt duplicate detection vectors for {len(article_ids)} articles")
+        self._persist_cache()
+    
+    def _cache_path(self) -> Optional[str]:
+        """Path of the persisted vector cache, or None if persistence is off."""
+        if not settings.duplicate_cache_dir:
+            return None
+        return os.path.join(settings.duplicate_cache_dir, _CACHE_FILENAME)
+    
+    def _persist_cache(self):
+        """Write the fitted vectorizer and vector cache to disk.
+        
+        Written to a temporary file and renamed into place, so other
+        processes never load a partial file. Rows appended since the fit
+        aren't persisted; they are cheap to recompute.
+        """
+        path = self._cache_path()
+        if not path:
+            return
+        
+        state = {
+            "sklearn_version": sklearn.__version__,
+            "vectorizer": self.vectorizer,
+            "vectors": self._vector_cache,
+            "article_ids": self._cached_article_ids,
+            "article_texts": {
+                article_id: self._article_cache[article_id]
+                for article_id in self._cached_article_ids
+            },
+        }
+        try:
+            os.makedirs(settings.duplicate_cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=settings.duplicate_cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    joblib.dump(state, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Could not persist duplicate detection cache: {e}")
+    
+    def _load_persisted_cache(self):
+        """Load the vector cache persisted by a previous process, if usable.
+        
+        Ignored when written by another scikit-learn version or with other
+        vectorizer settings. Articles added or edited since are picked up
+        by the normal cache update on the next check.
+        """
+        path = self._cache_path()
+        if not path or not os.path.exists(path):
+            return
+        
+        try:
+            state = joblib.load(path)
+            if state["sklearn_version"] != sklearn.__version__:
+                return
+            if state["vectorizer"].get_params() != self.vectorizer.get_params():
+                return
+        except Exception as e:
+            logger.warning(f"Could not load duplicate detection cache: {e}")
+            return
+        
+        self.vectorizer = state["vectorizer"]
+        self._vector_cache = state["vectors"]
+        self._cached_article_ids = list(state["article_ids"])
+        self._cached_positions = {
+            article_id: i for i, article_id in enumerate(self._cached_article_ids)
+        }
+        self._article_cache = dict(state["article_texts"])
+        self._fitted_rows = len(self._cached_article_ids)
+        self._fitted_words = self._words([text for _, text in self._article_cache.values()])
+        self._cache_dirty = False
+        logger.info(f"Loaded duplicate detection vectors for {self._fitted_rows} articles")
+    
+    def add_articles(self, articles: List[ComparedArticle]):
+        """Add newly created articles to the vector cache without refitting.
+        
+        Their rows are computed with the current vocabulary. Does nothing
+        until the cache has been built by a duplicate check.
+        
+        Args:
+            articles: Articles that aren't cached yet
+        """
+        if self._cache_dirty or self._vector_cache is None:
+            return
+        
+        texts = []
+        for article in articles:
+            article_id = str(article.id)
+            if article_id in self._cached_positions:
+                continue
+            article_text = self._get_article_text(article)
+            if article_text:
+                self._cached_positions[article_id] = len(self._cached_article_ids)
+                self._cached_article_ids.append(article_id)
+                texts.append(article_text)
+        
+        if texts:
+            self._vector_cache = scipy.sparse.vstack(
+                [self._vector_cache, self.vectorizer.transform(texts)], format="csr"
+            )
+            self._term_index = None
+    
+    def _get_term_index(self):
+        """The cached vectors as a term -> article inverted index.
+        
+        A CSR matrix of the transposed cache: multiplying a new vector by it
+        only visits the articles that share a term with it, and scipy
+        doesn't have to convert the transpose on every query.
+        """
+        if self._term_index is None:
+            self._term_index = self._vector_cache.T.tocsr()
+        return self._term_index
+    
     async def is_duplicate(self, new_content: SummarizedContent) -> bool:
         """Check if new content is a duplicate of existing articles.
         
@@ -381,20 +725,38 @@ class DuplicateDetector:
         Returns:
             List of duplicate lists for each content
         """
-        results = []
-        
         logger.info(f"Batch checking {len(contents)} articles for duplicates")
         
+        # Each content is checked against the existing articles only, which
+        # are fetched once for the whole batch
+        existing_articles = await self._get_existing_articles()
+        results: List[List[Tuple[str, float]]] = [[] for _ in contents]
+        if not existing_articles:
+            return results
+        
+        # Title duplicates take precedence, as in check_for_duplicates
+        content_checks = []
         for i, content in enumerate(contents):
             try:
-                duplicates = await self.check_for_duplicates(content)
-                results.append(duplicates)
-                
-                logger.debug(f"Article {i+1}/{len(contents)}: {len(duplicates)} duplicates found")
-                
+                results[i] = self._check_title_similarity(content, existing_articles)
+                if not results[i]:
+                    content_checks.append(i)
             except Exception as e:
                 logger.error(f"Error checking duplicates for article {i+1}: {e}")
-                results.append([])  # Empty list for failed checks
+        
+        # Score the rest with one sparse matrix product
+        if content_checks:
+            try:
+                new_texts = [self._prepare_text_for_comparison(contents[i]) for i in content_checks]
+                article_ids, scores = self._score_content(new_texts, existing_articles)
+                if scores is not None:
+                    for i, row in zip(content_checks, scores):
+                        results[i] = self._matches_above_threshold(article_ids, row)
+            except Exception as e:
+                logger.error(f"Error calculating batch similarities: {e}")
+        
+        for i, duplicates in enumerate(results):
+            logger.debug(f"Article {i+1}/{len(contents)}: {len(duplicates)} duplicates found")
         
         logger.info(f"Batch duplicate check completed")
         return results
@@ -415,5 +777,20 @@ class DuplicateDetector:
         """Clear the internal cache of articles and vectors."""
         self._article_cache.clear()
         self._vector_cache = None
+        self._term_index = None
+        self._cached_article_ids = []
+        self._cached_positions = {}
+        self._fitted_rows = 0
         self._cache_dirty = True
+        self._title_cache.clear()
+        
+        path = self._cache_path()
+        if path:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not remove persisted duplicate detection cache: {e}")
+        
         logger.info("Duplicate detector cache cleared") 
\ No newline at end of file
@@ -1,20 +1,60 @@
 """Gemini LLM integration for summarizing health content."""
 
-import json
+import hashlib
 import logging
 import asyncio
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+import re
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, Any, Optional, List, Tuple
+from dataclasses import asdict, dataclass, replace
 
 import google.generativeai as genai
+import msgspec
 from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
 from app.config import settings
 from app.models.health_article import CategoryEnum
+from app.models.summary_cache import SummaryCacheEntry
 from app.services.content_chunker import ContentChunk
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of Gemini requests in flight per batch
+_MAX_CONCURRENT_REQUESTS = 20
+
+# Output token limit for one summary; grouped requests get this per chunk
+_MAX_SUMMARY_TOKENS = 1000
+
+# Batches pack several chunks into one request, up to this many chunks and
+# this many estimated input tokens (about 4 characters per token)
+_MAX_CHUNKS_PER_REQUEST = 6
+_MAX_TOKENS_PER_REQUEST = 6000
+
+# Part of the summary cache key. Bump it whenever the prompt, model settings,
+# response parsing or key normalization change, so summaries made the old
+# way aren't reused.
+_PROMPT_VERSION = 3
+
+# Runs of vowels; each run is counted as one syllable
+_VOWEL_GROUP_RE = re.compile(r'[aeiouy]+')
+
+
+# Cached: word frequencies are heavily skewed, so after the first few
+# articles nearly every word is a lookup. Words are lowercased before the
+# lookup so capitalized forms share an entry.
+@lru_cache(maxsize=20000)
+def _count_word_syllables(word: str) -> int:
+    """Estimate syllable count in a lowercase word."""
+    syllable_count = len(_VOWEL_GROUP_RE.findall(word))
+    
+    # Handle silent e
+    if word.endswith('e') and syllable_count > 1:
+        syllable_count -= 1
+    
+    return max(1, syllable_count)  # Every word has at least 1 syllable
+
 
 @dataclass
 class SummarizedContent:
@@ -33,6 +73,11 @@ class GeminiSummarizer:
     
     def __init__(self):
         """Initialize Gemini summarizer."""
+        # Start times and estimated input tokens of the requests made in
+        # the last minute, for the per-minute request and token budgets
+        self._recent_requests: Deque[Tuple[float, int]] = deque()
+        self._recent_tokens = 0
+        
         # Configure Gemini API
         genai.configure(api_key=settings.gemini_api_key)
         
@@ -43,7 +88,7 @@ class GeminiSummarizer:
                 "temperature": 0.3,  # Lower temperature for more consistent output
                 "top_p": 0.8,
                 "top_k": 40,
-                "max_output_tokens": 1000,
+                "max_output_tokens": _MAX_SUMMARY_TOKENS,
             },
             safety_settings={
                 HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_MEDIUM_AND_ABOVE,
@@ -53,30 +98,45 @@ class GeminiSummarizer:
             }
         )
         
-        # Category mapping for health conditions
-        self.category_keywords = {
-            CategoryEnum.HYPERTENSION: [
-                'blood pressure', 'hypertension', 'high blood pressure', 
-                'systolic', 'diastolic', 'bp'
-            ],
-            CategoryEnum.DIABETES: [
-                'diabetes', 'blood sugar', 'glucose', 'insulin', 
-                'diabetic', 'type 1', 'type 2'
-            ],
-            CategoryEnum.NUTRITION: [
-                'nutrition', 'diet', 'food', 'eating', 'meal',
-                'calories', 'vitamins', 'minerals', 'healthy eating'
-            ],
-            CategoryEnum.PHYSICAL_ACTIVITY: [
-                'exercise', 'physical activity', 'workout', 'fitness',
-                'walking', 'running', 'gym', 'cardio', 'strength training'
-            ],
-            CategoryEnum.OBESITY: [
-                'obesity', 'overweight', 'weight loss', 'weight management',
-                'bmi', 'body mass index', 'excess weight', 'healthy weight',
-                'portion control', 'calorie counting'
-            ]
-        }
+        # Instructions, response format and example shared by every prompt.
+        # They come before the content, so all requests start with the same
+        # text and the per-request part is only the content at the end.
+        self._prompt_prefix = f"""
+You are a health education expert who creates simple, easy-to-understand health articles for people with low literacy levels. Your goal is to transform medical content into clear, actionable information at a 6th-grade reading level.
+
+INSTRUCTIONS:
+1. Create a clear, engaging title (maximum 8 words)
+2. Categorize the content using one of these categories: {', '.join([cat.value for cat in CategoryEnum])}
+3. Write the main content in simple language:
+   - Use short sentences (maximum 15 words each)
+   - Use common words instead of medical jargon
+   - Include practical tips when relevant
+   - Use bullet points or numbered lists for clarity
+   - Keep paragraphs short (2-3 sentences max)
+   - Target 6th-grade reading level
+4. Identify relevant medical condition tags
+5. Make sure the content is medically accurate but simplified
+
+RESPONSE FORMAT (JSON):
+{{
+    "title": "Clear, simple title here",
+    "category": "One of the valid categories",
+    "content": "Easy-to-read article content with practical advice. Use simple words. Include what people can do to help themselves.",
+    "medical_condition_tags": ["tag1", "tag2", "tag3"],
+    "confidence_score": 0.85
+}}
+
+EXAMPLE OUTPUT:
+{{
+    "title": "Lower Your Blood Pressure Naturally",
+    "category": "Hypertension",
+    "content": "High blood pressure means your blood pushes too hard on your blood vessels. This can hurt your heart and other organs.\\n\\nWhy it matters:\\n• It usually has no symptoms\\n• It can cause heart attacks and strokes\\n• It can damage your kidneys\\n\\nWhat you can do:\\n• Eat less salt\\n• Walk 30 minutes most days\\n• Maintain a healthy weight\\n• Take your medicine as prescribed\\n• Check your blood pressure regularly\\n\\nTalk to your doctor about the best plan for you.",
+    "medical_condition_tags": ["Hypertension", "Blood pressure"],
+    "confidence_score": 0.92
+}}
+
+Remember: Keep it simple, practical, and encouraging. Focus on what people can do to improve their health.
+"""
     
     async def summarize_chunk(self, chunk: ContentChunk) -> Optional[SummarizedContent]:
         """Summarize a content chunk into a health article.
@@ -87,9 +147,20 @@ class GeminiSummarizer:
         Returns:
             SummarizedContent object or None if summarization fails
         """
+        logger.info(f"Starting summarization for chunk {chunk.chunk_id}")
+        
+        # Reuse the summary of identical content from an earlier run
+        cache_key = self._summary_cache_key(chunk)
+        cached = await self._get_cached_summary(cache_key, chunk)
+        if cached:
+            logger.info(f"Using cached summary for chunk {chunk.chunk_id}")
+            return cached
+        
+        return await self._summarize_uncached(chunk, cache_key)
+    
+    async def _summarize_uncached(self, chunk: ContentChunk, cache_key: str) -> Optional[SummarizedContent]:
+        """Summarize a chunk with its own Gemini request and cache the result."""
         try:
-            logger.info(f"Starting summarization for chunk {chunk.chunk_id}")
-            
             # Create the prompt
             prompt = self._create_summarization_prompt(chunk)
             
@@ -105,6 +176,7 @@ class GeminiSummarizer:
             
             if summarized_content:
                 logger.info(f"Successfully summarized chunk {chunk.chunk_id}")
+                await self._cache_summary(cache_key, summarized_content)
                 return summarized_content
             else:
                 logger.error(f"Failed to parse Gemini response for chunk {chunk.chunk_id}")
@@ -114,62 +186,95 @@ class GeminiSummarizer:
             logger.error(f"Error summarizing chunk {chunk.chunk_id}: {e}")
             return None
     
+    def _summary_cache_key(self, chunk: ContentChunk) -> str:
+        """Cache key for a chunk's summary: prompt version, model and content.
+        
+        Only case and whitespace (line breaks included) are normalized, so
+        the same passage extracted with a different layout shares a summary.
+        Punctuation and symbols are kept: "A1C <7%" and "A1C >7%", or
+        "1.5 mg" and "1,5 mg", are different passages.
+        """
+        content = ' '.join(chunk.content.lower().split())
+        key = f"{_PROMPT_VERSION}|{self.model.model_name}|{content}"
+        return hashlib.sha256(key.encode()).hexdigest()
+    
+    async def _get_cached_summary(self, cache_key: str, chunk: ContentChunk) -> Optional[SummarizedContent]:
+        """Look up a cached summary, attributed to this chunk."""
+        try:
+            entry = await SummaryCacheEntry.find_one(SummaryCacheEntry.key == cache_key)
+            if entry:
+                return SummarizedContent(**entry.summary, source_chunk_id=chunk.chunk_id)
+        except Exception as e:
+            logger.warning(f"Error reading summary cache: {e}")
+        return None
+    
+    async def _cache_summary(self, cache_key: str, summarized_content: SummarizedContent):
+        """Store a new summary; a failure only costs a later cache miss."""
+        summary = asdict(summarized_content)
+        del summary['source_chunk_id']
+        entry = SummaryCacheEntry(key=cache_key, summary=summary)
+        try:
+            # Upsert, so a concurrent run caching the same content can't fail
+            await SummaryCacheEntry.get_motor_collection().update_one(
+                {"key": cache_key},
+                {"$setOnInsert": entry.model_dump(exclude={"id", "revision_id"})},
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"Error writing summary cache: {e}")
+    
     def _create_summarization_prompt(self, chunk: ContentChunk) -> str:
         """Create a prompt for Gemini to summarize health content."""
+        prompt = f"""{self._prompt_prefix}
+CONTENT TO SUMMARIZE:
+{chunk.content}
+"""
         
-        # Get suggested category based on keywords
-        suggested_category = self._suggest_category(chunk)
+        return prompt
+    
+    def _create_group_summarization_prompt(self, chunks: List[ContentChunk]) -> str:
+        """Create a prompt for Gemini to summarize several chunks at once.
         
-        prompt = f"""
-You are a health education expert who creates simple, easy-to-understand health articles for people with low literacy levels. Your goal is to transform medical content into clear, actionable information at a 6th-grade reading level.
-
+        Each chunk becomes its own article; the response is a JSON object
+        whose "items" array holds one summary per chunk, in chunk order.
+        """
+        sections = "\n\n".join(
+            f"<<CHUNK {index}>>\n{chunk.content}" for index, chunk in enumerate(chunks)
+        )
+        
+        prompt = f"""{self._prompt_prefix}
 CONTENT TO SUMMARIZE:
-{chunk.content}
-
-INSTRUCTIONS:
-1. Create a clear, engaging title (maximum 8 words)
-2. Categorize the content using one of these categories: {', '.join([cat.value for cat in CategoryEnum])}
-3. Write the main content in simple language:
-   - Use short sentences (maximum 15 words each)
-   - Use common words instead of medical jargon
-   - Include practical tips when relevant
-   - Use bullet points or numbered lists for clarity
-   - Keep paragraphs short (2-3 sentences max)
-   - Target 6th-grade reading level
-4. Identify relevant medical condition tags
-5. Make sure the content is medically accurate but simplified
+This content has {len(chunks)} separate parts, marked <<CHUNK 0>> to <<CHUNK {len(chunks) - 1}>>. Summarize each part on its own, as a separate article.
 
-RESPONSE FORMAT (JSON):
-{{
-    "title": "Clear, simple title here",
-    "category": "One of the valid categories",
-    "content": "Easy-to-read article content with practical advice. Use simple words. Include what people can do to help themselves.",
-    "medical_condition_tags": ["tag1", "tag2", "tag3"],
-    "confidence_score": 0.85
-}}
+{sections}
 
-EXAMPLE OUTPUT:
+RESPONSE FORMAT FOR THIS CONTENT (JSON):
+An object whose "items" array holds exactly {len(chunks)} articles in the format above, the first for CHUNK 0 and so on:
 {{
-    "title": "Lower Your Blood Pressure Naturally",
-    "category": "Hypertension",
-    "content": "High blood pressure means your blood pushes too hard on your blood vessels. This can hurt your heart and other organs.\\n\\nWhy it matters:\\n• It usually has no symptoms\\n• It can cause heart attacks and strokes\\n• It can damage your kidneys\\n\\nWhat you can do:\\n• Eat less salt\\n• Walk 30 minutes most days\\n• Maintain a healthy weight\\n• Take your medicine as prescribed\\n• Check your blood pressure regularly\\n\\nTalk to your doctor about the best plan for you.",
-    "medical_condition_tags": ["Hypertension", "Blood pressure"],
-    "confidence_score": 0.92
+    "items": [
+        {{"title": "...", "category": "...", "content": "...", "medical_condition_tags": ["..."], "confidence_score": 0.85}}
+    ]
 }}
-
-Remember: Keep it simple, practical, and encouraging. Focus on what people can do to improve their health.
 """
         
         return prompt
     
-    async def _generate_content_async(self, prompt: str) -> Optional[str]:
-        """Generate content using Gemini API asynchronously."""
+    async def _generate_content_async(self, prompt: str, max_output_tokens: Optional[int] = None) -> Optional[str]:
+        """Generate content using Gemini API asynchronously.
+        
+        max_output_tokens overrides the model's limit for this request.
+        """
         try:
-            # Run the synchronous API call in a thread pool
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, 
-                lambda: self.model.generate_content(prompt)
+            # Cache hits never get here, so they don't use up the budget
+            await self._wait_for_request_slot(len(prompt) // 4)
+            
+            generation_config = None
+            if max_output_tokens:
+                generation_config = {"max_output_tokens": max_output_tokens}
+            
+            # Native async call (gRPC asyncio); no thread per in-flight request
+            response = await self.model.generate_content_async(
+                prompt, generation_config=generation_config
             )
             
             if response and response.text:
@@ -193,64 +298,82 @@ Remember: Keep it simple, practical, and encouraging. Focus on what people can d
                 logger.error("No JSON found in Gemini response")
                 return None
             
-            json_str = response[json_start:json_end]
-            data = json.loads(json_str)
+            # msgspec decodes the str slice directly, much faster than json
+            data = msgspec.json.decode(response[json_start:json_end])
             
-            # Validate required fields
-            required_fields = ['title', 'category', 'content', 'medical_condition_tags']
-            for field in required_fields:
-                if field not in data:
-                    logger.error(f"Missing required field '{field}' in Gemini response")
-                    return None
+            return self._summary_from_data(data, chunk)
             
-            # Validate category
-            try:
-                category = CategoryEnum(data['category'])
-            except ValueError:
-                logger.warning(f"Invalid category '{data['category']}', defaulting to GENERAL")
-                category = CategoryEnum.GENERAL
+        except msgspec.DecodeError as e:
+            logger.error(f"Failed to parse JSON from Gemini response: {e}")
+            logger.debug(f"Response text: {response}")
+            return None
+        except Exception as e:
+            logger.error(f"Error parsing Gemini response: {e}")
+            return None
+    
+    def _parse_group_response(self, response: str, chunks: List[ContentChunk]) -> List[Optional[SummarizedContent]]:
+        """Parse Gemini's JSON response for a group of chunks.
+        
+        Returns one entry per chunk, None where its summary is missing or
+        invalid. All entries are None if the items don't match the chunks.
+        """
+        summaries: List[Optional[SummarizedContent]] = [None] * len(chunks)
+        try:
+            json_start = response.find('{')
+            json_end = response.rfind('}') + 1
             
-            # Create SummarizedContent object
-            summarized_content = SummarizedContent(
-                title=data['title'][:200],  # Limit title length
-                category=category.value,
-                content=data['content'],
-                medical_condition_tags=data['medical_condition_tags'][:10],  # Limit tags
-                confidence_score=data.get('confidence_score', 0.8),
-                source_chunk_id=chunk.chunk_id
-            )
+            if json_start == -1 or json_end == 0:
+                logger.error("No JSON found in Gemini response")
+                return summaries
             
-            # Calculate reading level score (simplified estimation)
-            reading_level = self._estimate_reading_level(summarized_content.content)
-            summarized_content.reading_level_score = reading_level
+            items = msgspec.json.decode(response[json_start:json_end]).get('items')
+            if not isinstance(items, list) or len(items) != len(chunks):
+                logger.warning(f"Expected {len(chunks)} items in grouped Gemini response")
+                return summaries
             
-            return summarized_content
+            for index, (item, chunk) in enumerate(zip(items, chunks)):
+                if isinstance(item, dict):
+                    summaries[index] = self._summary_from_data(item, chunk)
             
-        except json.JSONDecodeError as e:
+        except msgspec.DecodeError as e:
             logger.error(f"Failed to parse JSON from Gemini response: {e}")
             logger.debug(f"Response text: {response}")
-            return None
         except Exception as e:
             logger.error(f"Error parsing Gemini response: {e}")
-            return None
+        
+        return summaries
     
-    def _suggest_category(self, chunk: ContentChunk) -> str:
-        """Suggest a category based on chunk keywords."""
-        content_lower = chunk.content.lower()
-        
-        # Count matches for each category
-        category_scores = {}
-        for category, keywords in self.category_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in content_lower)
-            if score > 0:
-                category_scores[category] = score
-        
-        # Return the category with the highest score
-        if category_scores:
-            best_category = max(category_scores, key=category_scores.get)
-            return best_category.value
-        
-        return CategoryEnum.GENERAL.value
+    def _summary_from_data(self, data: Dict[str, Any], chunk: ContentChunk) -> Optional[SummarizedContent]:
+        """Validate one parsed summary and build its SummarizedContent."""
+        # Validate required fields
+        required_fields = ['title', 'category', 'content', 'medical_condition_tags']
+        for field in required_fields:
+            if field not in data:
+                logger.error(f"Missing required field '{field}' in Gemini response")
+                return None
+        
+        # Validate category
+        try:
+            category = CategoryEnum(data['category'])
+        except ValueError:
+            logger.warning(f"Invalid category '{data['category']}', defaulting to GENERAL_HEALTH")
+            category = CategoryEnum.GENERAL_HEALTH
+        
+        # Create SummarizedContent object
+        summarized_content = SummarizedContent(
+            title=data['title'][:200],  # Limit title length
+            category=category.value,
+            content=data['content'],
+            medical_condition_tags=data['medical_condition_tags'][:10],  # Limit tags
+            confidence_score=data.get('confidence_score', 0.8),
+            source_chunk_id=chunk.chunk_id
+        )
+        
+        # Calculate reading level score (simplified estimation)
+        reading_level = self._estimate_reading_level(summarized_content.content)
+        summarized_content.reading_level_score = reading_level
+        
+        return summarized_content
     
     def _estimate_reading_level(self, text: str) -> float:
         """Estimate reading level using simplified metrics."""
@@ -264,8 +387,8 @@ Remember: Keep it simple, practical, and encouraging. Focus on what people can d
             return 12.0
         
         # Calculate average sentence length
-        total_words = len(text.split())
-        avg_sentence_length = total_words / len(sentences)
+        words = text.split()
+        avg_sentence_length = len(words) / len(sentences)
         
         # Simple heuristic: shorter sentences = lower reading level
         if avg_sentence_length <= 10:
@@ -278,7 +401,6 @@ Remember: Keep it simple, practical, and encouraging. Focus on what people can d
             reading_level = 10.0
         
         # Adjust based on complex words (words with 3+ syllables)
-        words = text.split()
         complex_words = sum(1 for word in words if self._count_syllables(word) >= 3)
         complex_ratio = complex_words / len(words) if words else 0
         
@@ -287,54 +409,151 @@ Remember: Keep it simple, practical, and encouraging. Focus on what people can d
         
         return min(reading_level, 12.0)  # Cap at 12th grade
     
-    def _count_syllables(self, word: str) -> int:
+    @staticmethod
+    def _count_syllables(word: str) -> int:
         """Estimate syllable count in a word."""
-        word = word.lower()
-        vowels = 'aeiouy'
-        syllable_count = 0
-        prev_was_vowel = False
-        
-        for char in word:
-            if char in vowels:
-                if not prev_was_vowel:
-                    syllable_count += 1
-                prev_was_vowel = True
-            else:
-                prev_was_vowel = False
-        
-        # Handle silent e
-        if word.endswith('e') and syllable_count > 1:
-            syllable_count -= 1
-        
-        return max(1, syllable_count)  # Every word has at least 1 syllable
+        return _count_word_syllables(word.lower())
     
     async def batch_summarize_chunks(self, chunks: List[ContentChunk]) -> List[SummarizedContent]:
         """Summarize multiple chunks in batch with rate limiting.
         
+        Chunks without a cached summary are packed into grouped requests
+        (see _group_chunks), which run concurrently, at most
+        _MAX_CONCURRENT_REQUESTS at a time and within
+        settings.gemini_requests_per_minute.
+        
         Args:
             chunks: List of ContentChunk objects to summarize
             
         Returns:
-            List of SummarizedContent objects
+            List of SummarizedContent objects, in chunk order
         """
-        summarized_contents = []
-        
         logger.info(f"Starting batch summarization of {len(chunks)} chunks")
         
-        # Process chunks with rate limiting (to avoid API limits)
-        for i, chunk in enumerate(chunks):
-            try:
-                summarized = await self.summarize_chunk(chunk)
-                if summarized:
-                    summarized_contents.append(summarized)
-                
-                # Rate limiting: wait between requests
-                if i < len(chunks) - 1:  # Don't wait after the last chunk
-                    await asyncio.sleep(1)  # 1 second between requests
-                    
-            except Exception as e:
-                logger.error(f"Error in batch summarization for chunk {chunk.chunk_id}: {e}")
-                continue
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        
+        async def summarize(group: List[ContentChunk]) -> List[Optional[SummarizedContent]]:
+            async with semaphore:
+                return await self._summarize_chunk_group(group)
+        
+        # Chunks with the same (normalized) content are summarized once; the
+        # concurrent requests would otherwise all miss the cache
+        first_chunks: Dict[str, ContentChunk] = {}
+        for chunk in chunks:
+            first_chunks.setdefault(self._summary_cache_key(chunk), chunk)
+        
+        keys = list(first_chunks)
+        cached = await asyncio.gather(
+            *(self._get_cached_summary(key, first_chunks[key]) for key in keys)
+        )
+        results_by_key: Dict[str, Any] = {
+            key: summary for key, summary in zip(keys, cached) if summary
+        }
+        logger.info(f"Using cached summaries for {len(results_by_key)} chunks")
+        
+        groups = self._group_chunks(
+            [first_chunks[key] for key in keys if key not in results_by_key]
+        )
+        group_results = await asyncio.gather(
+            *(summarize(group) for group in groups), return_exceptions=True
+        )
+        for group, result in zip(groups, group_results):
+            summaries = [result] * len(group) if isinstance(result, Exception) else result
+            for chunk, summary in zip(group, summaries):
+                results_by_key[self._summary_cache_key(chunk)] = summary
+        
+        summarized_contents = []
+        for chunk in chunks:
+            result = results_by_key[self._summary_cache_key(chunk)]
+            if isinstance(result, Exception):
+                logger.error(f"Error in batch summarization for chunk {chunk.chunk_id}: {result}")
+            elif result:
+                if result.source_chunk_id != chunk.chunk_id:
+                    result = replace(result, source_chunk_id=chunk.chunk_id)
+                summarized_contents.append(result)
         
         logger.info(f"Batch summarization completed: {len(summarized_contents)} successful")
-        return summarized_contents 
\ No newline at end of file
+        return summarized_contents
+    
+    def _group_chunks(self, chunks: List[ContentChunk]) -> List[List[ContentChunk]]:
+        """Pack chunks, in order, into groups that fit one Gemini request."""
+        groups: List[List[ContentChunk]] = []
+        group_tokens = 0
+        for chunk in chunks:
+            tokens = len(chunk.content) // 4
+            if (
+                not groups
+                or len(groups[-1]) >= _MAX_CHUNKS_PER_REQUEST
+                or group_tokens + tokens > _MAX_TOKENS_PER_REQUEST
+            ):
+                groups.append([])
+                group_tokens = 0
+            groups[-1].append(chunk)
+            group_tokens += tokens
+        return groups
+    
+    async def _summarize_chunk_group(self, chunks: List[ContentChunk]) -> List[Optional[SummarizedContent]]:
+        """Summarize a group of uncached chunks with one Gemini request.
+        
+        Chunks whose summary is missing from the response, or invalid, are
+        retried with a request of their own.
+        
+        Returns:
+            One SummarizedContent (or None) per chunk, in chunk order
+        """
+        if len(chunks) == 1:
+            return [await self._summarize_uncached(chunks[0], self._summary_cache_key(chunks[0]))]
+        
+        prompt = self._create_group_summarization_prompt(chunks)
+        response = await self._generate_content_async(
+            prompt, max_output_tokens=_MAX_SUMMARY_TOKENS * len(chunks)
+        )
+        if response:
+            summaries = self._parse_group_response(response, chunks)
+        else:
+            logger.error(f"No response from Gemini for a group of {len(chunks)} chunks")
+            summaries = [None] * len(chunks)
+        
+        for chunk, summary in zip(chunks, summaries):
+            if summary:
+                await self._cache_summary(self._summary_cache_key(chunk), summary)
+        
+        retry = [index for index, summary in enumerate(summaries) if not summary]
+        if retry:
+            logger.info(f"Summarizing {len(retry)} chunks of a group individually")
+            retried = await asyncio.gather(
+                *(self._summarize_uncached(chunks[index], self._summary_cache_key(chunks[index]))
+                  for index in retry)
+            )
+            for index, summary in zip(retry, retried):
+                summaries[index] = summary
+        
+        logger.info(f"Summarized a group of {len(chunks)} chunks")
+        return summaries
+    
+    async def _wait_for_request_slot(self, tokens: int):
+        """Wait until another Gemini request fits in the per-minute budgets.
+        
+        The budgets (settings.gemini_requests_per_minute and
+        settings.gemini_tokens_per_minute) are a sliding window over the
+        last 60 seconds, shared by every batch this summarizer runs.
+        
+        Args:
+            tokens: Estimated input tokens of the request
+        """
+        while True:
+            now = time.monotonic()
+            while self._recent_requests and now - self._recent_requests[0][0] >= 60:
+                self._recent_tokens -= self._recent_requests.popleft()[1]
+            
+            # A request larger than the whole token budget still goes out
+            # once the window is empty, instead of waiting forever
+            if len(self._recent_requests) < settings.gemini_requests_per_minute and (
+                not self._recent_requests
+                or self._recent_tokens + tokens <= settings.gemini_tokens_per_minute
+            ):
+                self._recent_requests.append((now, tokens))
+                self._recent_tokens += tokens
+                return
+            
+            await asyncio.sleep(60 - (now - self._recent_requests[0][0]))
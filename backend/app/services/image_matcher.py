@@ -2,14 +2,39 @@
 
 import logging
 import asyncio
-from typing import Optional, List, Dict, Any
+import dataclasses
+from typing import AbstractSet, Optional, List, Dict, Any
 from dataclasses import dataclass
 
 import httpx
+import msgspec
+import redis.asyncio as redis
+from cachetools import TTLCache
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Search results are reused for a day. Category search terms repeat for
+# every article in a category, so most searches after the first few are
+# served from cache instead of Unsplash.
+_SEARCH_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Parsed results by query, shared by every matcher in this process
+_search_cache: TTLCache = TTLCache(maxsize=512, ttl=_SEARCH_CACHE_TTL_SECONDS)
+
+# Words in an image's descriptions that earn it a health bonus (matched as
+# substrings, so 'care' also counts 'healthcare')
+_HEALTH_KEYWORDS = (
+    'health', 'medical', 'doctor', 'hospital', 'medicine',
+    'wellness', 'care', 'treatment', 'healthy', 'fitness'
+)
+
+# Common words left out of title search queries
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to',
+    'for', 'of', 'with', 'by', 'how', 'what', 'when', 'where', 'why'
+})
+
 
 @dataclass
 class ImageResult:
@@ -30,11 +55,28 @@ class ImageResult:
 class UnsplashImageMatcher:
     """Service for finding relevant images using Unsplash API."""
     
-    def __init__(self):
-        """Initialize Unsplash image matcher."""
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """Initialize Unsplash image matcher.
+        
+        Args:
+            http_client: Client to send Unsplash requests with; by default
+                the matcher creates its own. Either way it is kept open so
+                connections (and TLS sessions) are reused between searches.
+        """
         self.access_key = settings.unsplash_access_key
         self.base_url = "https://api.unsplash.com"
         self.per_page = 10  # Number of images to fetch per search
+        self.auth_headers = {'Authorization': f'Client-ID {self.access_key}'}
+        self.http_client = http_client or httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+        )
+        
+        # Second-level search cache shared across processes, when configured
+        self.redis = redis.from_url(settings.redis_url) if settings.redis_url else None
+        
+        # Uncached searches in flight, by query
+        self._pending_searches: Dict[str, asyncio.Future] = {}
         
         # Health-related search terms for different categories
         self.category_search_terms = {
@@ -88,24 +130,32 @@ class UnsplashImageMatcher:
             # Generate search queries
             search_queries = self._generate_search_queries(title, category, medical_tags)
             
-            # Search for images using multiple queries
-            best_image = None
-            best_score = 0.0
+            # Search for images using multiple queries, all at once
+            results = await asyncio.gather(
+                *(self._search_images(query) for query in search_queries),
+                return_exceptions=True
+            )
             
-            for query in search_queries:
-                images = await self._search_images(query)
-                if images:
-                    # Score images based on relevance
-                    scored_images = self._score_images(images, title, category, medical_tags)
-                    
-                    # Keep track of the best image
-                    for image in scored_images:
-                        if image.relevance_score > best_score:
-                            best_image = image
-                            best_score = image.relevance_score
+            # Images found by several queries are scored once
+            unique_images: Dict[str, ImageResult] = {}
+            for query, images in zip(search_queries, results):
+                if isinstance(images, Exception):
+                    logger.error(f"Error searching images for query '{query}': {images}")
+                    continue
+                for image in images:
+                    unique_images.setdefault(image.id, image)
+            
+            # Score images based on relevance; the sort is stable, so ties go
+            # to the image found first
+            scored_images = self._score_images(
+                list(unique_images.values()), title, category, medical_tags
+            )
+            best_image = None
+            if scored_images and scored_images[0].relevance_score > 0:
+                best_image = scored_images[0]
             
             if best_image:
-                logger.info(f"Found image: {best_image.id} with score {best_score:.2f}")
+                logger.info(f"Found image: {best_image.id} with score {best_image.relevance_score:.2f}")
                 return best_image
             else:
                 logger.warning(f"No suitable image found for article: {title}")
@@ -145,49 +195,84 @@ class UnsplashImageMatcher:
     def _extract_keywords_from_title(self, title: str) -> str:
         """Extract relevant keywords from article title."""
         # Remove common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 
-            'for', 'of', 'with', 'by', 'how', 'what', 'when', 'where', 'why'
-        }
-        
         words = title.lower().split()
-        keywords = [word for word in words if word not in stop_words and len(word) > 2]
+        keywords = [word for word in words if word not in _STOP_WORDS and len(word) > 2]
         
         # Join keywords for search
         return ' '.join(keywords[:4])  # Use top 4 keywords
     
     async def _search_images(self, query: str) -> List[ImageResult]:
-        """Search for images using Unsplash API."""
+        """Search for images, serving repeated queries from cache.
+        
+        Concurrent searches for the same uncached query (articles of one
+        category share their search terms) wait for a single request.
+        
+        Returns copies, since scoring sets ``relevance_score`` on each result.
+        """
+        images = _search_cache.get(query)
+        if images is None:
+            pending = self._pending_searches.get(query)
+            if pending is None:
+                pending = asyncio.ensure_future(self._search_images_cached_remote(query))
+                self._pending_searches[query] = pending
+                pending.add_done_callback(lambda _: self._pending_searches.pop(query, None))
+            # Shielded, so a cancelled caller doesn't cancel the others' request
+            images = await asyncio.shield(pending)
+            # Empty results may be a transient API error; don't pin them
+            if images:
+                _search_cache[query] = images
+        
+        return [dataclasses.replace(image) for image in images]
+    
+    async def _search_images_cached_remote(self, query: str) -> List[ImageResult]:
+        """Search Unsplash, going through the Redis cache when configured."""
+        if not self.redis:
+            return self._parse_image_results(await self._fetch_search_results(query))
+        
+        cache_key = f"unsplash:search:{query}"
         try:
-            async with httpx.AsyncClient() as client:
-                params = {
-                    'query': query,
-                    'per_page': self.per_page,
-                    'orientation': 'landscape',  # Prefer landscape images
-                    'content_filter': 'high',  # Filter out inappropriate content
-                    'order_by': 'relevant'
-                }
-                
-                headers = {
-                    'Authorization': f'Client-ID {self.access_key}'
-                }
-                
-                response = await client.get(
-                    f"{self.base_url}/search/photos",
-                    params=params,
-                    headers=headers,
-                    timeout=10.0
-                )
+            cached = await self.redis.get(cache_key)
+            if cached is not None:
+                return self._parse_image_results(msgspec.json.decode(cached))
+        except Exception as e:
+            logger.warning(f"Image search cache unavailable: {e}")
+        
+        results = await self._fetch_search_results(query)
+        if results:
+            try:
+                await self.redis.setex(cache_key, _SEARCH_CACHE_TTL_SECONDS, msgspec.json.encode(results))
+            except Exception as e:
+                logger.warning(f"Image search cache unavailable: {e}")
+        
+        return self._parse_image_results(results)
+    
+    async def _fetch_search_results(self, query: str) -> List[Dict[str, Any]]:
+        """Search for images using Unsplash API, returning the raw results."""
+        try:
+            params = {
+                'query': query,
+                'per_page': self.per_page,
+                'orientation': 'landscape',  # Prefer landscape images
+                'content_filter': 'high',  # Filter out inappropriate content
+                'order_by': 'relevant'
+            }
+            
+            response = await self.http_client.get(
+                f"{self.base_url}/search/photos",
+                params=params,
+                headers=self.auth_headers,
+                timeout=10.0
+            )
+            
+            if response.status_code == 200:
+                data = msgspec.json.decode(response.content)
+                results = data.get('results', [])
+                logger.debug(f"Found {len(results)} images for query: {query}")
+                return results
+            else:
+                logger.warning(f"Unsplash API error: {response.status_code} for query: {query}")
+                return []
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    images = self._parse_image_results(data.get('results', []))
-                    logger.debug(f"Found {len(images)} images for query: {query}")
-                    return images
-                else:
-                    logger.warning(f"Unsplash API error: {response.status_code} for query: {query}")
-                    return []
-                    
         except Exception as e:
             logger.error(f"Error searching images for query '{query}': {e}")
             return []
@@ -224,8 +309,9 @@ class UnsplashImageMatcher:
                      category: str, medical_tags: List[str]) -> List[ImageResult]:
         """Score images based on relevance to the health article."""
         
-        # Create a combined text for matching
+        # Create a combined text for matching, split once for every image
         search_text = f"{title} {category} {' '.join(medical_tags)}".lower()
+        search_words = set(search_text.split())
         
         for image in images:
             score = 0.0
@@ -233,12 +319,12 @@ class UnsplashImageMatcher:
             # Score based on description match
             if image.description:
                 desc_lower = image.description.lower()
-                score += self._calculate_text_match_score(search_text, desc_lower) * 0.4
+                score += self._calculate_text_match_score(search_words, desc_lower) * 0.4
             
             # Score based on alt description match
             if image.alt_description:
                 alt_lower = image.alt_description.lower()
-                score += self._calculate_text_match_score(search_text, alt_lower) * 0.3
+                score += self._calculate_text_match_score(search_words, alt_lower) * 0.3
             
             # Prefer images with good aspect ratios (not too narrow or wide)
             aspect_ratio = image.width / image.height if image.height > 0 else 1.0
@@ -255,13 +341,8 @@ class UnsplashImageMatcher:
                 score += 0.05
             
             # Bonus for health-related keywords in descriptions
-            health_keywords = [
-                'health', 'medical', 'doctor', 'hospital', 'medicine',
-                'wellness', 'care', 'treatment', 'healthy', 'fitness'
-            ]
-            
             combined_text = f"{image.description or ''} {image.alt_description or ''}".lower()
-            health_matches = sum(1 for keyword in health_keywords if keyword in combined_text)
+            health_matches = sum(1 for keyword in _HEALTH_KEYWORDS if keyword in combined_text)
             score += min(health_matches * 0.05, 0.2)  # Max 0.2 bonus
             
             image.relevance_score = min(score, 1.0)  # Cap at 1.0
@@ -270,12 +351,11 @@ class UnsplashImageMatcher:
         images.sort(key=lambda x: x.relevance_score, reverse=True)
         return images
     
-    def _calculate_text_match_score(self, search_text: str, target_text: str) -> float:
-        """Calculate how well target text matches search text."""
-        if not search_text or not target_text:
+    def _calculate_text_match_score(self, search_words: AbstractSet[str], target_text: str) -> float:
+        """Calculate how well target text matches the (split) search text."""
+        if not search_words or not target_text:
             return 0.0
         
-        search_words = set(search_text.split())
         target_words = set(target_text.split())
         
         # Calculate Jaccard similarity
@@ -297,24 +377,19 @@ class UnsplashImageMatcher:
             Download URL or None if failed
         """
         try:
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    'Authorization': f'Client-ID {self.access_key}'
-                }
-                
-                response = await client.get(
-                    f"{self.base_url}/photos/{image_id}/download",
-                    headers=headers,
-                    timeout=10.0
-                )
+            response = await self.http_client.get(
+                f"{self.base_url}/photos/{image_id}/download",
+                headers=self.auth_headers,
+                timeout=10.0
+            )
+            
+            if response.status_code == 200:
+                data = msgspec.json.decode(response.content)
+                return data.get('url')
+            else:
+                logger.warning(f"Failed to get download URL for image {image_id}: {response.status_code}")
+                return None
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get('url')
-                else:
-                    logger.warning(f"Failed to get download URL for image {image_id}: {response.status_code}")
-                    return None
-                    
         except Exception as e:
             logger.error(f"Error getting download URL for image {image_id}: {e}")
             return None
@@ -343,4 +418,10 @@ class UnsplashImageMatcher:
             f'Photo by <a href="{image.author_url}?utm_source=health_education_extractor&utm_medium=referral">'
             f'{image.author}</a> on '
             f'<a href="https://unsplash.com/?utm_source=health_education_extractor&utm_medium=referral">Unsplash</a>'
-        ) 
\ No newline at end of file
+        )
+    
+    async def close(self):
+        """Close the HTTP and cache connections held by the matcher."""
+        await self.http_client.aclose()
+        if self.redis:
+            await self.redis.aclose()
@@ -1,16 +1,53 @@
 """PDF parsing service using PyMuPDF."""
 
-import fitz  # PyMuPDF
+import os
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from functools import partial
+from typing import TYPE_CHECKING, AsyncIterator, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
+import ahocorasick
+
+from app.core.process_pool import get_process_pool
+
+if TYPE_CHECKING:
+    import fitz
+
 logger = logging.getLogger(__name__)
 
+# Pages handed to a worker process at a time; each task opens the PDF once
+_PAGES_PER_TASK = 8
+
+# Smaller PDFs are parsed in a thread: a worker task costs more than it saves
+_MIN_PAGES_FOR_PROCESS_POOL = 4
+
+# Keywords that indicate health education content (matched as substrings)
+_HEALTH_KEYWORDS = frozenset({
+    'health', 'medical', 'disease', 'condition', 'treatment', 'symptoms',
+    'diet', 'nutrition', 'exercise', 'medication', 'doctor', 'patient',
+    'blood pressure', 'diabetes', 'heart', 'kidney', 'hypertension',
+    'chronic', 'wellness', 'prevention', 'care', 'therapy', 'clinical', 'obesity'
+})
+
+# Specific conditions; mentioning one makes content relevant by itself
+_CONDITION_KEYWORDS = frozenset({'diabetes', 'hypertension', 'heart disease', 'kidney disease'})
+
+# Aho-Corasick automaton over both keyword sets: one pass over the text
+# finds every keyword (overlapping ones included) instead of one substring
+# search per keyword
+_KEYWORD_AUTOMATON = ahocorasick.Automaton()
+for _keyword in _HEALTH_KEYWORDS | _CONDITION_KEYWORDS:
+    _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+_KEYWORD_AUTOMATON.make_automaton()
+
 
 @dataclass
 class ExtractedPage:
     """Represents a page extracted from PDF."""
+    # No per-instance __dict__: a PDF can yield hundreds of these
+    __slots__ = ('page_number', 'text', 'word_count', 'has_images', 'images', 'tables')
+    
     page_number: int
     text: str
     word_count: int
@@ -22,6 +59,8 @@ class ExtractedPage:
 @dataclass
 class PDFContent:
     """Complete extracted PDF content."""
+    __slots__ = ('filename', 'total_pages', 'pages', 'metadata', 'total_word_count')
+    
     filename: str
     total_pages: int
     pages: List[ExtractedPage]
@@ -29,16 +68,31 @@ class PDFContent:
     total_word_count: int
 
 
+def _parse_pages_in_worker(min_word_count: int, detail_all_pages: bool, *args) -> List[ExtractedPage]:
+    """Process pool entry point for PDFParser._parse_pages."""
+    return PDFParser(min_word_count, detail_all_pages)._parse_pages(*args)
+
+
 class PDFParser:
     """PDF parsing service."""
     
-    def __init__(self, min_word_count: int = 10):
+    def __init__(self, min_word_count: int = 10, detail_all_pages: bool = False):
         """Initialize PDF parser.
         
         Args:
             min_word_count: Minimum word count to consider a page meaningful
+            detail_all_pages: Extract images and tables from every meaningful
+                page; by default only from pages whose text is relevant
+                (see is_content_relevant)
         """
         self.min_word_count = min_word_count
+        self.detail_all_pages = detail_all_pages
+        
+        # PyMuPDF is imported on first use rather than with the module:
+        # processes that import the pipeline without parsing PDFs (the API
+        # when Celery workers do the processing) don't load it
+        import fitz  # PyMuPDF
+        self._fitz = fitz
     
     async def parse_pdf(self, file_path: str) -> PDFContent:
         """Parse PDF file and extract content.
@@ -55,20 +109,98 @@ class PDFParser:
         try:
             logger.info(f"Starting PDF parsing: {file_path}")
             
-            # Open PDF document
-            doc = fitz.open(file_path)
-            
-            # Extract metadata
-            metadata = doc.metadata
-            total_pages = len(doc)
+            # Open PDF document, for the metadata and page count
+            with self._fitz.open(file_path) as doc:
+                metadata = doc.metadata
+                total_pages = len(doc)
             
             logger.info(f"PDF has {total_pages} pages")
             
-            # Extract content from each page
-            pages = []
-            total_word_count = 0
+            pages = [page async for page in self._iter_pages(file_path, total_pages)]
+            
+            total_word_count = sum(page.word_count for page in pages)
+            
+            pdf_content = PDFContent(
+                filename=os.path.basename(file_path),
+                total_pages=len(pages),
+                pages=pages,
+                metadata=metadata,
+                total_word_count=total_word_count
+            )
+            
+            logger.info(f"PDF parsing completed: {len(pages)} pages, {total_word_count} total words")
+            return pdf_content
+            
+        except Exception as e:
+            logger.error(f"Error parsing PDF {file_path}: {e}")
+            raise
+    
+    async def iter_pages(self, file_path: str) -> AsyncIterator[ExtractedPage]:
+        """Parse a PDF page by page, for callers that don't need it all at once.
+        
+        Args:
+            file_path: Path to PDF file
+            
+        Yields:
+            The meaningful pages (see parse_pdf), in page order
+        """
+        with self._fitz.open(file_path) as doc:
+            total_pages = len(doc)
+        
+        async for page in self._iter_pages(file_path, total_pages):
+            yield page
+    
+    async def _iter_pages(self, file_path: str, total_pages: int) -> AsyncIterator[ExtractedPage]:
+        """Extract the pages of a PDF off the event loop, yielding them in order.
+        
+        Pages are extracted in ranges of _PAGES_PER_TASK. With a process pool
+        and enough pages to spread, every range is submitted to the worker
+        processes up front and yielded as it completes in order; otherwise
+        the ranges are extracted one at a time in a thread, as they're
+        consumed.
+        """
+        loop = asyncio.get_running_loop()
+        pool = get_process_pool()
+        page_ranges = [
+            (start, min(start + _PAGES_PER_TASK, total_pages))
+            for start in range(0, total_pages, _PAGES_PER_TASK)
+        ]
+        
+        if pool is None or total_pages < _MIN_PAGES_FOR_PROCESS_POOL:
+            for start, stop in page_ranges:
+                for page in await loop.run_in_executor(None, self._parse_pages, file_path, start, stop):
+                    yield page
+            return
+        
+        parse_pages = partial(_parse_pages_in_worker, self.min_word_count, self.detail_all_pages)
+        tasks = [
+            loop.run_in_executor(pool, parse_pages, file_path, start, stop)
+            for start, stop in page_ranges
+        ]
+        try:
+            for task in tasks:
+                for page in await task:
+                    yield page
+        finally:
+            # Drop the ranges not yet started when the caller stops early
+            for task in tasks:
+                task.cancel()
+    
+    def _parse_pages(self, file_path: str, start: int, stop: int) -> List[ExtractedPage]:
+        """Extract the meaningful pages among pages start..stop-1 of a PDF.
+        
+        Args:
+            file_path: Path to PDF file
+            start: Index of the first page
+            stop: Index after the last page
             
-            for page_num in range(total_pages):
+        Returns:
+            ExtractedPage objects, in page order
+        """
+        pages = []
+        
+        with self._fitz.open(file_path) as doc:
+            for page_num in range(start, stop):
                 page = doc[page_num]
                 
                 # Extract text
@@ -80,11 +212,18 @@ class PDFParser:
                     logger.debug(f"Skipping page {page_num + 1} - insufficient text ({word_count} words)")
                     continue
                 
-                # Extract images
-                images = self._extract_images(page, page_num)
-                
-                # Extract tables (basic implementation)
-                tables = self._extract_tables(page, page_num)
+                # The page is kept either way; its images and tables are
+                # only worth extracting when the text looks relevant
+                if self.detail_all_pages or self.is_content_relevant(text):
+                    # Extract images
+                    images = self._extract_images(page, page_num)
+                    
+                    # Extract tables (basic implementation), from the text
+                    # already extracted rather than extracting it again
+                    tables = self._extract_tables(text.split('\n'), page_num)
+                else:
+                    images = []
+                    tables = []
                 
                 extracted_page = ExtractedPage(
                     page_number=page_num + 1,
@@ -96,28 +235,12 @@ class PDFParser:
                 )
                 
                 pages.append(extracted_page)
-                total_word_count += word_count
                 
                 logger.debug(f"Processed page {page_num + 1}: {word_count} words, {len(images)} images")
-            
-            doc.close()
-            
-            pdf_content = PDFContent(
-                filename=file_path.split('/')[-1],
-                total_pages=len(pages),
-                pages=pages,
-                metadata=metadata,
-                total_word_count=total_word_count
-            )
-            
-            logger.info(f"PDF parsing completed: {len(pages)} pages, {total_word_count} total words")
-            return pdf_content
-            
-        except Exception as e:
-            logger.error(f"Error parsing PDF {file_path}: {e}")
-            raise
+        
+        return pages
     
-    def _extract_images(self, page: fitz.Page, page_num: int) -> List[Dict[str, Any]]:
+    def _extract_images(self, page: 'fitz.Page', page_num: int) -> List[Dict[str, Any]]:
         """Extract images from a page.
         
         Args:
@@ -152,11 +275,11 @@ class PDFParser:
         
         return images
     
-    def _extract_tables(self, page: fitz.Page, page_num: int) -> List[Dict[str, Any]]:
+    def _extract_tables(self, lines: List[str], page_num: int) -> List[Dict[str, Any]]:
         """Extract table information from a page.
         
         Args:
-            page: PyMuPDF page object
+            lines: Lines of the page's extracted text
             page_num: Page number
             
         Returns:
@@ -171,14 +294,13 @@ class PDFParser:
             
             # For now, we'll just identify text that looks like tables
             # based on structure patterns
-            text = page.get_text()
-            lines = text.split('\n')
-            
-            potential_table_lines = []
-            for line in lines:
-                # Simple heuristic: lines with multiple tabs or spaces might be table rows
-                if line.count('\t') >= 2 or len(line.split()) >= 4:
-                    potential_table_lines.append(line.strip())
+            # Simple heuristic: lines with multiple tabs or spaces might be
+            # table rows (splitting at most 3 times is enough to tell whether
+            # a line has 4 or more words)
+            potential_table_lines = [
+                line.strip() for line in lines
+                if line.count('\t') >= 2 or len(line.split(maxsplit=3)) >= 4
+            ]
             
             if len(potential_table_lines) >= 3:  # At least 3 rows to consider it a table
                 table_info = {
@@ -205,20 +327,9 @@ class PDFParser:
         if not text:
             return ""
         
-        # Remove excessive whitespace
-        lines = [line.strip() for line in text.split('\n')]
-        
-        # Remove empty lines
-        lines = [line for line in lines if line]
-        
-        # Join with single spaces
-        cleaned = ' '.join(lines)
-        
-        # Remove multiple spaces
-        import re
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        
-        return cleaned.strip()
+        # Collapse every run of whitespace (line breaks included) to a
+        # single space; split() also drops leading and trailing whitespace
+        return ' '.join(text.split())
     
     def is_content_relevant(self, text: str) -> bool:
         """Check if text content is relevant for health education.
@@ -232,22 +343,14 @@ class PDFParser:
         if not text or len(text.split()) < self.min_word_count:
             return False
         
-        # Keywords that indicate health education content
-        health_keywords = [
-            'health', 'medical', 'disease', 'condition', 'treatment', 'symptoms',
-            'diet', 'nutrition', 'exercise', 'medication', 'doctor', 'patient',
-            'blood pressure', 'diabetes', 'heart', 'kidney', 'hypertension',
-            'chronic', 'wellness', 'prevention', 'care', 'therapy', 'clinical', 'obesity'
-        ]
-        
-        text_lower = text.lower()
-        
-        # Count how many health keywords appear in the text
-        keyword_count = sum(1 for keyword in health_keywords if keyword in text_lower)
-        
         # Consider content relevant if it has at least 2 health keywords
-        # or mentions specific conditions
-        condition_keywords = ['diabetes', 'hypertension', 'heart disease', 'kidney disease']
-        has_condition = any(condition in text_lower for condition in condition_keywords)
+        # or mentions specific conditions; stop scanning as soon as it does
+        health_keywords_found = set()
+        for _, keyword in _KEYWORD_AUTOMATON.iter(text.lower()):
+            if keyword in _CONDITION_KEYWORDS:
+                return True
+            health_keywords_found.add(keyword)
+            if len(health_keywords_found) >= 2:
+                return True
         
-        return keyword_count >= 2 or has_condition 
\ No newline at end of file
+        return False 
\ No newline at end of file
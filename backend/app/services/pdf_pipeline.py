@@ -0,0 +1,273 @@
+"""PDF processing pipeline: parse, chunk, summarize and store articles."""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
+
+from beanie import PydanticObjectId
+from beanie.operators import Set
+from pymongo.errors import BulkWriteError
+
+from app.models.health_article import HealthArticle, HealthArticleCreate
+from app.models.pdf_document import PDFDocument, PDFProcessingStatus
+from app.services.content_chunker import ContentChunker
+from app.services.duplicate_detector import DuplicateDetector
+from app.services.gemini_summarizer import GeminiSummarizer
+from app.services.image_matcher import UnsplashImageMatcher
+from app.services.pdf_parser import PDFParser
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of Unsplash lookups in flight per PDF
+_IMAGE_LOOKUP_CONCURRENCY = 8
+
+# New articles are inserted (and recorded on the PDF) in batches this size
+_ARTICLE_BATCH_SIZE = 10
+
+
+@lru_cache(maxsize=1)
+def get_pipeline_services() -> SimpleNamespace:
+    """Processing services shared by every PDF run in this process.
+    
+    Built once (Gemini model setup, vectorizer, HTTP/cache clients) instead
+    of per PDF. The services keep no per-PDF state.
+    """
+    return SimpleNamespace(
+        pdf_parser=PDFParser(),
+        chunker=ContentChunker(),
+        summarizer=GeminiSummarizer(),
+        image_matcher=UnsplashImageMatcher(),
+        duplicate_detector=DuplicateDetector()
+    )
+
+
+async def process_pdf_background(pdf_id: str):
+    """Background task to process PDF and generate articles."""
+    
+    logger.info(f"Starting background processing for PDF: {pdf_id}")
+    
+    try:
+        pdf_doc = await PDFDocument.get(pdf_id)
+        if not pdf_doc:
+            logger.error(f"PDF not found: {pdf_id}")
+            return
+        
+        services = get_pipeline_services()
+        pdf_parser = services.pdf_parser
+        chunker = services.chunker
+        summarizer = services.summarizer
+        image_matcher = services.image_matcher
+        duplicate_detector = services.duplicate_detector
+        
+        # Progress updates below are targeted $set writes of the changed
+        # fields rather than full-document saves
+        
+        # Update status to parsing
+        await pdf_doc.set({
+            PDFDocument.processing_status: PDFProcessingStatus.PARSING,
+            PDFDocument.processing_started_at: datetime.now(timezone.utc)
+        })
+        
+        # Step 1: Parse PDF content
+        logger.info(f"Step 1: Parsing PDF content for {pdf_id}")
+        pdf_content = await pdf_parser.parse_pdf(pdf_doc.file_path)
+        
+        # Step 2: Chunk content
+        logger.info(f"Step 2: Chunking content for {pdf_id}")
+        await pdf_doc.set({
+            PDFDocument.total_pages: pdf_content.total_pages,
+            PDFDocument.processing_status: PDFProcessingStatus.CHUNKING
+        })
+        
+        # Chunked off the event loop, one page at a time
+        chunks = []
+        async for page_chunks in chunker.stream_chunks(pdf_content, pdf_id):
+            chunks += page_chunks
+        
+        if not chunks:
+            logger.warning(f"No relevant chunks found for PDF {pdf_id}")
+            await pdf_doc.set({
+                PDFDocument.total_chunks: 0,
+                PDFDocument.chunk_ids: [],
+                PDFDocument.processing_status: PDFProcessingStatus.COMPLETED,
+                PDFDocument.processing_completed_at: datetime.now(timezone.utc)
+            })
+            return
+        
+        # Step 3: Generate articles with LLM
+        logger.info(f"Step 3: Generating articles for {pdf_id} ({len(chunks)} chunks)")
+        await pdf_doc.set({
+            PDFDocument.total_chunks: len(chunks),
+            PDFDocument.chunk_ids: [chunk.chunk_id for chunk in chunks],
+            PDFDocument.article_ids: [],
+            PDFDocument.total_articles_generated: 0,
+            PDFDocument.processing_status: PDFProcessingStatus.PROCESSING
+        })
+        
+        summarized_contents = await summarizer.batch_summarize_chunks(chunks)
+        
+        if not summarized_contents:
+            logger.warning(f"No articles generated for PDF {pdf_id}")
+            await pdf_doc.set({
+                PDFDocument.processing_status: PDFProcessingStatus.COMPLETED,
+                PDFDocument.processing_completed_at: datetime.now(timezone.utc)
+            })
+            return
+        
+        # Step 4: Process each summarized content. Duplicate checks run in
+        # order, each also against the articles accepted before it from this
+        # PDF. Image lookups run concurrently in the meantime, and accepted
+        # articles are written in batches with insert_many.
+        created_articles = []
+        image_semaphore = asyncio.Semaphore(_IMAGE_LOOKUP_CONCURRENCY)
+        batch: List[Tuple[HealthArticle, asyncio.Task]] = []
+        
+        for i, summarized_content in enumerate(summarized_contents):
+            try:
+                logger.info(f"Processing article {i+1}/{len(summarized_contents)}: {summarized_content.title}")
+                
+                # Check for duplicates (stored articles plus the unsaved batch)
+                duplicates = await duplicate_detector.check_for_duplicates(
+                    summarized_content,
+                    pending_articles=[article for article, _ in batch]
+                )
+                if duplicates:
+                    logger.warning(f"Skipping duplicate article: {summarized_content.title}")
+                    continue
+                
+                # Create health article
+                article_data = HealthArticleCreate(
+                    title=summarized_content.title,
+                    category=summarized_content.category,
+                    medical_condition_tags=summarized_content.medical_condition_tags,
+                    content=summarized_content.content,
+                    source_pdf_id=pdf_id,
+                    chunk_id=summarized_content.source_chunk_id
+                )
+                
+                # Id assigned up front so the article can be referenced
+                # before it is inserted
+                article = HealthArticle(**article_data.model_dump())
+                article.id = PydanticObjectId()
+                article.reading_level_score = summarized_content.reading_level_score
+                
+                # Find matching image
+                image_lookup = asyncio.create_task(
+                    _find_article_image(image_matcher, image_semaphore, summarized_content)
+                )
+                batch.append((article, image_lookup))
+                
+            except Exception as e:
+                logger.error(f"Error processing article {i+1}: {e}")
+                continue
+            
+            if len(batch) >= _ARTICLE_BATCH_SIZE:
+                created_articles.extend(await _store_articles(pdf_doc.id, batch))
+                batch = []
+        
+        if batch:
+            created_articles.extend(await _store_articles(pdf_doc.id, batch))
+        
+        # Add processing statistics
+        completed_at = datetime.now(timezone.utc)
+        processing_time_seconds = 0
+        if pdf_doc.processing_started_at:
+            # Ensure both datetimes are timezone-aware for subtraction
+            started_at = pdf_doc.processing_started_at
+            if started_at.tzinfo is None:
+                started_at = started_at.replace(tzinfo=timezone.utc)
+            processing_time_seconds = (completed_at - started_at).total_seconds()
+        
+        # Update PDF document with results
+        await pdf_doc.set({
+            PDFDocument.processing_status: PDFProcessingStatus.COMPLETED,
+            PDFDocument.processing_completed_at: completed_at,
+            PDFDocument.processing_stats: {
+                "total_chunks": len(chunks),
+                "articles_generated": len(created_articles),
+                "articles_skipped_duplicates": len(summarized_contents) - len(created_articles),
+                "processing_time_seconds": processing_time_seconds
+            }
+        })
+        
+        logger.info(f"PDF processing completed: {pdf_id} - Generated {len(created_articles)} articles")
+        
+    except Exception as e:
+        logger.error(f"Error processing PDF {pdf_id}: {e}")
+        
+        # Update PDF status to failed (no read needed first)
+        try:
+            await PDFDocument.find_one(
+                PDFDocument.id == PydanticObjectId(pdf_id)
+            ).update(Set({
+                PDFDocument.processing_status: PDFProcessingStatus.FAILED,
+                PDFDocument.error_message: str(e),
+                PDFDocument.processing_completed_at: datetime.now(timezone.utc)
+            }))
+        except Exception as save_error:
+            logger.error(f"Error updating PDF status: {save_error}")
+
+
+async def _store_articles(
+    pdf_doc_id: PydanticObjectId,
+    batch: List[Tuple[HealthArticle, asyncio.Task]]
+) -> List[str]:
+    """Insert a batch of new articles and record them on the PDF document.
+    
+    Waits for the batch's image lookups, writes every article with one
+    unordered insert_many (a failing document doesn't stop the rest), then
+    appends the stored ids to the PDF document so status polls see the
+    article count grow while the PDF is still processing.
+    
+    Returns:
+        Ids of the articles that were stored
+    """
+    articles = [article for article, _ in batch]
+    image_urls = await asyncio.gather(*(image_lookup for _, image_lookup in batch))
+    for article, image_url in zip(articles, image_urls):
+        article.image_url = image_url
+    
+    failed_indexes = set()
+    try:
+        await HealthArticle.insert_many(articles, ordered=False)
+    except BulkWriteError as e:
+        failed_indexes = {error["index"] for error in e.details.get("writeErrors", [])}
+        logger.error(f"Failed to insert {len(failed_indexes)} of {len(articles)} articles: {e}")
+    
+    created = []
+    for index, article in enumerate(articles):
+        if index not in failed_indexes:
+            created.append(str(article.id))
+            logger.info(f"Created article: {article.title} (ID: {article.id})")
+    
+    if created:
+        await PDFDocument.get_motor_collection().update_one(
+            {"_id": pdf_doc_id},
+            {
+                "$push": {"article_ids": {"$each": created}},
+                "$inc": {"total_articles_generated": len(created)}
+            }
+        )
+    
+    return created
+
+
+async def _find_article_image(
+    image_matcher, semaphore: asyncio.Semaphore, summarized_content
+) -> Optional[str]:
+    """Look up an image URL for a new article, or None if none was found."""
+    try:
+        async with semaphore:
+            image_result = await image_matcher.find_image_for_article(
+                summarized_content.title,
+                summarized_content.category,
+                summarized_content.medical_condition_tags
+            )
+        return image_result.url if image_result else None
+        
+    except Exception as e:
+        logger.error(f"Error finding image for article {summarized_content.title}: {e}")
+        return None
@@ -0,0 +1,52 @@
+"""Celery tasks for PDF processing."""
+
+import asyncio
+import logging
+from typing import Optional
+
+import uvloop
+from celery.exceptions import SoftTimeLimitExceeded
+
+from app.core.celery_app import celery_app
+from app.core.database import init_database
+from app.services.pdf_pipeline import process_pdf_background
+
+logger = logging.getLogger(__name__)
+
+# One event loop per worker process, created on its first task (after the
+# fork). The MongoDB pool and the pipeline services are bound to it and
+# reused by every task the process runs.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run(async_fn, *args):
+    """Run ``async_fn(*args)`` on this worker process's event loop."""
+    global _loop
+    
+    if _loop is None:
+        # Same event loop implementation the API workers run on
+        loop = uvloop.new_event_loop()
+        try:
+            loop.run_until_complete(init_database())
+        except Exception:
+            loop.close()
+            raise
+        _loop = loop
+    
+    return _loop.run_until_complete(async_fn(*args))
+
+
+@celery_app.task(bind=True, max_retries=3)
+def process_pdf_task(self, pdf_id: str):
+    """Process an uploaded PDF in a Celery worker."""
+    try:
+        _run(process_pdf_background, pdf_id)
+    except SoftTimeLimitExceeded:
+        # Retrying would only hit the limit again
+        logger.error(f"PDF task for {pdf_id} exceeded its time limit")
+        raise
+    except Exception as e:
+        # The pipeline records its own failures on the PDF document, so
+        # anything reaching here is infrastructure (e.g. MongoDB unreachable)
+        logger.error(f"PDF task failed for {pdf_id}: {e}")
+        raise self.retry(exc=e, countdown=30)
@@ -0,0 +1,41 @@
+"""Gunicorn configuration for serving the API with Uvicorn workers.
+
+Uvicorn workers pick up uvloop and httptools automatically when they are
+installed (both ship with ``uvicorn[standard]``; uvloop is also pinned in the
+requirements because the Celery tasks run on it directly).
+
+Each worker is a separate process with its own copy of every per-process
+limit and cache: the Gemini request/token budgets (see
+``gemini_requests_per_minute``), the MongoDB connection pools and their
+warm minimums, the pipeline services and duplicate-detection vectors, and
+the in-memory response caches (a write only invalidates them in the worker
+that handled it; the others catch up when their TTLs expire). Size those
+settings for ``workers`` processes when raising it.
+"""
+
+import os
+import sys
+
+# Gunicorn loads this file before the app, whose directory isn't
+# necessarily on the path yet
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.cpus import available_cpus
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Handlers are async and I/O bound on MongoDB, so one thread per worker and
+# a couple of workers cover a container's cores; the per-process limits
+# above make more workers cost more than they bring. Override with
+# WEB_CONCURRENCY when tuning.
+workers = int(os.environ.get("WEB_CONCURRENCY", min(2, available_cpus())))
+threads = 1
+
+# Exported so the workers can split the CPUs between them (see
+# app.core.process_pool)
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
@@ -10,4 +10,4 @@ from app.main import app
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 8080))
-    uvicorn.run(app, host="0.0.0.0", port=port) 
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=port, loop="uvloop", http="httptools") 
\ No newline at end of file
@@ -7,21 +7,26 @@ This script helps identify existing duplicates in the database and provides opti
 import asyncio
 import logging
 from typing import List, Dict, Tuple
-from collections import defaultdict
 import sys
 import os
 
 # Add the backend directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from beanie import PydanticObjectId
+
 from app.core.database import init_database, close_database
-from app.models.health_article import HealthArticle
+from app.models.health_article import DuplicateScanProjection, HealthArticle
 from app.services.duplicate_detector import DuplicateDetector
 from app.services.gemini_summarizer import SummarizedContent
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Articles checked per batch_check_duplicates call; bounds the size of the
+# (articles x existing articles) similarity matrix
+CHECK_BATCH_SIZE = 500
+
 
 class DuplicateCleanup:
     """Utility class for cleaning up duplicate articles."""
@@ -37,28 +42,38 @@ class DuplicateCleanup:
         """
         logger.info("Finding all duplicate articles...")
         
-        # Get all articles
-        articles = await HealthArticle.find().to_list()
+        # Get all articles (only the fields checked)
+        articles = await HealthArticle.find_all(
+            projection_model=DuplicateScanProjection
+        ).to_list()
         logger.info(f"Checking {len(articles)} articles for duplicates")
         
         duplicates_map = {}
         processed_pairs = set()
         
-        for i, article in enumerate(articles):
-            logger.info(f"Processing article {i+1}/{len(articles)}: {article.title}")
+        # Checked in batches: the existing articles are fetched once per
+        # batch and the contents scored with one matrix product
+        checked = []
+        for start in range(0, len(articles), CHECK_BATCH_SIZE):
+            batch = articles[start:start + CHECK_BATCH_SIZE]
+            logger.info(f"Processing articles {start+1}-{start+len(batch)}/{len(articles)}")
             
             # Convert to SummarizedContent for duplicate checking
-            summarized_content = SummarizedContent(
-                title=article.title,
-                category=article.category,
-                content=article.content,
-                medical_condition_tags=article.medical_condition_tags,
-                source_chunk_id=f"existing_{article.id}"
-            )
+            contents = [
+                SummarizedContent(
+                    title=article.title,
+                    category=article.category,
+                    content=article.content,
+                    medical_condition_tags=article.medical_condition_tags,
+                    source_chunk_id=f"existing_{article.id}"
+                )
+                for article in batch
+            ]
             
             # Check for duplicates
-            duplicates = await self.duplicate_detector.check_for_duplicates(summarized_content)
-            
+            checked += zip(batch, await self.duplicate_detector.batch_check_duplicates(contents))
+        
+        for article, duplicates in checked:
             if duplicates:
                 # Filter out self-matches and already processed pairs
                 filtered_duplicates = []
@@ -82,34 +97,48 @@ class DuplicateCleanup:
         """
         duplicates_map = await self.find_all_duplicates()
         
-        # Build graph of duplicates
-        graph = defaultdict(set)
+        # Union-find over the duplicate pairs: each article points towards
+        # its group's root (path halving keeps the chains short)
+        parent: Dict[str, str] = {}
+        
+        def find(article_id: str) -> str:
+            while parent[article_id] != article_id:
+                parent[article_id] = parent[parent[article_id]]
+                article_id = parent[article_id]
+            return article_id
+        
         for article_id, duplicates in duplicates_map.items():
+            parent.setdefault(article_id, article_id)
             for dup_id, _ in duplicates:
-                graph[article_id].add(dup_id)
-                graph[dup_id].add(article_id)
+                parent.setdefault(dup_id, dup_id)
+                parent[find(dup_id)] = find(article_id)
         
-        # Find connected components (duplicate groups)
-        visited = set()
-        duplicate_groups = []
+        # Collect the groups (connected components), in order of their
+        # first article
+        groups: Dict[str, List[str]] = {}
+        for article_id in parent:
+            groups.setdefault(find(article_id), []).append(article_id)
         
-        for article_id in graph:
-            if article_id not in visited:
-                group = []
-                stack = [article_id]
-                
-                while stack:
-                    current = stack.pop()
-                    if current not in visited:
-                        visited.add(current)
-                        group.append(current)
-                        stack.extend(graph[current] - visited)
-                
-                if len(group) > 1:
-                    duplicate_groups.append(group)
+        duplicate_groups = [group for group in groups.values() if len(group) > 1]
         
         return duplicate_groups
     
+    async def get_articles(self, article_ids: List[str]) -> Dict[str, HealthArticle]:
+        """Fetch articles by ID with a single query.
+        
+        Returns:
+            Dictionary mapping article_id to article, for the articles found
+        """
+        object_ids = []
+        for article_id in article_ids:
+            try:
+                object_ids.append(PydanticObjectId(article_id))
+            except Exception as e:
+                logger.error(f"Error retrieving article {article_id}: {e}")
+        
+        articles = await HealthArticle.find({"_id": {"$in": object_ids}}).to_list()
+        return {str(article.id): article for article in articles}
+    
     async def analyze_duplicates(self):
         """Analyze and report on duplicate articles."""
         logger.info("=== DUPLICATE ANALYSIS REPORT ===")
@@ -122,20 +151,17 @@ class DuplicateCleanup:
         
         logger.info(f"Found {len(duplicate_groups)} duplicate groups:")
         
+        # Get article details for every group at once
+        articles_by_id = await self.get_articles(
+            [article_id for group in duplicate_groups for article_id in group]
+        )
+        
         total_duplicates = 0
         for i, group in enumerate(duplicate_groups, 1):
             logger.info(f"\n--- Duplicate Group {i} ({len(group)} articles) ---")
             total_duplicates += len(group) - 1  # All but one are duplicates
             
-            # Get article details
-            articles = []
-            for article_id in group:
-                try:
-                    article = await HealthArticle.get(article_id)
-                    if article:
-                        articles.append(article)
-                except Exception as e:
-                    logger.error(f"Error retrieving article {article_id}: {e}")
+            articles = [articles_by_id[article_id] for article_id in group if article_id in articles_by_id]
             
             # Sort by creation date (keep oldest)
             articles.sort(key=lambda x: x.created_at if x.created_at else x.id)
@@ -147,11 +173,12 @@ class DuplicateCleanup:
                 logger.info(f"    Category: {article.category}")
                 logger.info(f"    Content preview: {article.content[:100]}...")
         
+        total_articles = await HealthArticle.count()
         logger.info(f"\n=== SUMMARY ===")
-        logger.info(f"Total articles: {await HealthArticle.count()}")
+        logger.info(f"Total articles: {total_articles}")
         logger.info(f"Duplicate groups: {len(duplicate_groups)}")
         logger.info(f"Articles to remove: {total_duplicates}")
-        logger.info(f"Articles to keep: {await HealthArticle.count() - total_duplicates}")
+        logger.info(f"Articles to keep: {total_articles - total_duplicates}")
     
     async def cleanup_duplicates(self, dry_run: bool = True):
         """Clean up duplicate articles by removing all but the oldest in each group.
@@ -167,20 +194,18 @@ class DuplicateCleanup:
             logger.info("✅ No duplicates to clean up!")
             return
         
-        deleted_count = 0
+        # Get article details for every group at once
+        articles_by_id = await self.get_articles(
+            [article_id for group in duplicate_groups for article_id in group]
+        )
+        
+        # Deleted together once every group has been logged
+        ids_to_delete = []
         
         for i, group in enumerate(duplicate_groups, 1):
             logger.info(f"\n--- Processing Group {i} ---")
             
-            # Get article details
-            articles = []
-            for article_id in group:
-                try:
-                    article = await HealthArticle.get(article_id)
-                    if article:
-                        articles.append(article)
-                except Exception as e:
-                    logger.error(f"Error retrieving article {article_id}: {e}")
+            articles = [articles_by_id[article_id] for article_id in group if article_id in articles_by_id]
             
             if len(articles) < 2:
                 continue
@@ -199,23 +224,20 @@ class DuplicateCleanup:
             
             for article in delete_articles:
                 logger.info(f"  ❌ DELETING: {article.id} - '{article.title}'")
-                
-                if not dry_run:
-                    try:
-                        await article.delete()
-                        deleted_count += 1
-                        logger.info(f"    ✅ Deleted successfully")
-                    except Exception as e:
-                        logger.error(f"    ❌ Error deleting: {e}")
-                else:
-                    deleted_count += 1
+                ids_to_delete.append(article.id)
         
         logger.info(f"\n=== CLEANUP SUMMARY ===")
         if dry_run:
-            logger.info(f"Would delete {deleted_count} duplicate articles")
+            logger.info(f"Would delete {len(ids_to_delete)} duplicate articles")
             logger.info("Run with --live to actually perform the cleanup")
         else:
-            logger.info(f"Successfully deleted {deleted_count} duplicate articles")
+            try:
+                result = await HealthArticle.get_motor_collection().delete_many(
+                    {"_id": {"$in": ids_to_delete}}
+                )
+                logger.info(f"Successfully deleted {result.deleted_count} duplicate articles")
+            except Exception as e:
+                logger.error(f"❌ Error deleting duplicates: {e}")
 
 
 async def main():
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Migration script to add a unique index on article titles in the app database.
+
+The app database belongs to the app, so the extractor never changes its
+schema on its own; this is for the app's owner to run once they've agreed
+to titles being unique there. With the index in place, the title upsert in
+AppDatabaseUploader.upload_article is also atomic across concurrent uploads.
+The index isn't created while duplicate titles exist; they're listed instead.
+"""
+
+import asyncio
+import logging
+import sys
+import os
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.config import settings
+from app.models.app_article import AppArticle
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+async def create_title_index():
+    """Create the unique title index unless duplicate titles exist."""
+    
+    client = AsyncIOMotorClient(
+        settings.app_mongodb_url,
+        tls=True,
+        tlsAllowInvalidCertificates=True,  # For development - allows self-signed certificates
+        compressors=settings.mongodb_compressors,
+        serverSelectionTimeoutMS=30000,
+        connectTimeoutMS=30000,
+        socketTimeoutMS=30000
+    )
+    collection = client[settings.app_mongodb_db_name][AppArticle.Settings.name]
+    
+    try:
+        await client.admin.command('ping')
+        logger.info("Connected to app database successfully")
+        
+        # Titles stored more than once would make the index build fail
+        duplicates = [
+            doc async for doc in collection.aggregate([
+                {"$group": {"_id": "$title", "count": {"$sum": 1}}},
+                {"$match": {"count": {"$gt": 1}}}
+            ])
+        ]
+        if duplicates:
+            logger.warning(f"Found {len(duplicates)} duplicate titles; resolve them before creating the index:")
+            for doc in duplicates:
+                logger.warning(f"  '{doc['_id']}': {doc['count']} articles")
+            return False
+        
+        name = await collection.create_index("title", unique=True)
+        logger.info(f"✓ Created unique index '{name}'")
+        return True
+        
+    finally:
+        client.close()
+
+async def main():
+    """Main function."""
+    try:
+        if not await create_title_index():
+            return 1
+    except Exception as e:
+        logger.error(f"Index creation failed: {e}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(main())
+    exit(exit_code)
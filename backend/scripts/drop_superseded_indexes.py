@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Migration script to drop the single-field indexes superseded by compound indexes.
+
+The models no longer declare these, but MongoDB keeps maintaining them on
+every write until they're dropped. Run once after deploying the compound
+indexes (the app creates those at startup). Indexes not listed here are
+left alone, including ones added outside the models.
+"""
+
+import asyncio
+import logging
+import sys
+import os
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from app.config import settings
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Collection -> indexes to drop
+SUPERSEDED_INDEXES = {
+    # Replaced by the (field, created_at desc) compound indexes
+    "health_articles": ["category_1", "processing_status_1", "source_pdf_id_1"],
+    # Replaced by (processing_status, uploaded_at desc); nothing queries
+    # the generated filename
+    "pdf_documents": ["filename_1", "processing_status_1"],
+}
+
+async def drop_superseded_indexes():
+    """Drop the superseded indexes that still exist."""
+    
+    client = AsyncIOMotorClient(
+        settings.mongodb_url,
+        tls=True,
+        tlsAllowInvalidCertificates=True,  # For development - allows self-signed certificates
+        compressors=settings.mongodb_compressors,
+        serverSelectionTimeoutMS=30000,
+        connectTimeoutMS=30000,
+        socketTimeoutMS=30000
+    )
+    db = client[settings.mongodb_db_name]
+    
+    try:
+        await client.admin.command('ping')
+        logger.info("Connected to MongoDB successfully")
+        
+        for collection_name, index_names in SUPERSEDED_INDEXES.items():
+            collection = db[collection_name]
+            existing = await collection.index_information()
+            for index_name in index_names:
+                if index_name not in existing:
+                    logger.info(f"{collection_name}.{index_name} not found, skipping")
+                    continue
+                await collection.drop_index(index_name)
+                logger.info(f"✓ Dropped {collection_name}.{index_name}")
+        
+    finally:
+        client.close()
+
+async def main():
+    """Main function."""
+    try:
+        await drop_superseded_indexes()
+        logger.info("Superseded indexes dropped successfully!")
+    except Exception as e:
+        logger.error(f"Dropping indexes failed: {e}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(main())
+    exit(exit_code)
@@ -29,6 +29,7 @@ async def migrate_categories():
         settings.mongodb_url,
         tls=True,
         tlsAllowInvalidCertificates=True,  # For development - allows self-signed certificates
+        compressors=settings.mongodb_compressors,
         serverSelectionTimeoutMS=30000,
         connectTimeoutMS=30000,
         socketTimeoutMS=30000
@@ -43,37 +44,47 @@ async def migrate_categories():
         
         logger.info("Starting category migration...")
         
-        total_updated = 0
+        old_categories = list(CATEGORY_MAPPING.keys())
+        
+        # Count articles per old category (without fetching them)
+        found = {}
+        async for doc in collection.aggregate([
+            {"$match": {"category": {"$in": old_categories}}},
+            {"$group": {"_id": "$category", "count": {"$sum": 1}}}
+        ]):
+            found[doc["_id"]] = doc["count"]
         
         for old_category, new_category in CATEGORY_MAPPING.items():
-            # Find articles with old category
-            cursor = collection.find({"category": old_category})
-            articles = await cursor.to_list(length=None)
-            
-            if articles:
-                logger.info(f"Found {len(articles)} articles with category '{old_category}'")
-                
-                # Update all articles with this old category
-                result = await collection.update_many(
-                    {"category": old_category},
-                    {"$set": {"category": new_category}}
-                )
-                
-                logger.info(f"Updated {result.modified_count} articles from '{old_category}' to '{new_category}'")
-                total_updated += result.modified_count
+            if old_category in found:
+                logger.info(f"Found {found[old_category]} articles with category '{old_category}' -> '{new_category}'")
             else:
                 logger.info(f"No articles found with category '{old_category}'")
         
+        total_updated = 0
+        if found:
+            # Rewrite every old category in one pass: a pipeline update that
+            # maps each article's category through CATEGORY_MAPPING
+            result = await collection.update_many(
+                {"category": {"$in": old_categories}},
+                [{"$set": {"category": {"$switch": {
+                    "branches": [
+                        {"case": {"$eq": ["$category", old_category]}, "then": new_category}
+                        for old_category, new_category in CATEGORY_MAPPING.items()
+                    ],
+                    "default": "$category"
+                }}}}]
+            )
+            total_updated = result.modified_count
+        
         logger.info(f"Migration completed. Total articles updated: {total_updated}")
         
         # Verify the migration
         logger.info("Verifying migration...")
-        for old_category in CATEGORY_MAPPING.keys():
-            count = await collection.count_documents({"category": old_category})
-            if count > 0:
-                logger.warning(f"Still found {count} articles with old category '{old_category}'")
-            else:
-                logger.info(f"✓ No articles found with old category '{old_category}'")
+        remaining = await collection.count_documents({"category": {"$in": old_categories}})
+        if remaining > 0:
+            logger.warning(f"Still found {remaining} articles with old categories")
+        else:
+            logger.info("✓ No articles found with old categories")
         
         # Show current category distribution
         logger.info("Current category distribution:")
@@ -0,0 +1,16 @@
+"""Shared test setup."""
+
+import os
+import sys
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Settings without defaults, so app.config loads without a .env
+os.environ.setdefault("GEMINI_API_KEY", "test")
+os.environ.setdefault("UNSPLASH_ACCESS_KEY", "test")
+os.environ.setdefault("UNSPLASH_SECRET_KEY", "test")
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("ADMIN_PASSWORD", "test")
+# Keep the duplicate detector's vector cache in memory
+os.environ.setdefault("DUPLICATE_CACHE_DIR", "")
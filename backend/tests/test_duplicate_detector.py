@@ -0,0 +1,98 @@
+"""Duplicate detector scores against a fit that includes the new text.
+
+Before the vector cache, every check fitted the vectorizer on the existing
+articles plus the new text; these tests pin the cached scoring to that.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.metrics.pairwise import cosine_similarity
+
+from app.services.duplicate_detector import DuplicateDetector
+
+_WORDS = np.array([f"term{i}" for i in range(3000)])
+_WORD_WEIGHTS = 1 / np.arange(1, len(_WORDS) + 1) ** 1.1
+_WORD_WEIGHTS /= _WORD_WEIGHTS.sum()
+
+
+def _text(rng, words=150, new_words=0):
+    """Zipf-distributed text, with new_words words no article uses."""
+    text = list(rng.choice(_WORDS, size=words, p=_WORD_WEIGHTS))
+    for i in rng.choice(words, size=new_words, replace=False):
+        text[i] = f"unseen{i}"
+    return " ".join(text)
+
+
+def _articles(rng, count):
+    return [
+        SimpleNamespace(id=str(i), title=f"article {i}", content=_text(rng), medical_condition_tags=[])
+        for i in range(count)
+    ]
+
+
+def _fit_with_query_scores(detector, new_text, articles):
+    """Scores as fitting the vectorizer on the articles plus new_text gives them."""
+    vectorizer = clone(detector.vectorizer)
+    texts = [detector._prepare_article_text(article) for article in articles]
+    vectors = vectorizer.fit_transform(texts + [new_text])
+    return cosine_similarity(vectors[-1], vectors[:-1]).ravel()
+
+
+def _cached_scores(detector, new_text, articles):
+    article_ids, scores = detector._score_content([new_text], articles)
+    assert article_ids == [str(article.id) for article in articles]
+    return scores[0]
+
+
+def test_small_corpus_scores_match_fit_with_query():
+    rng = np.random.default_rng(0)
+    articles = _articles(rng, 20)
+    detector = DuplicateDetector()
+    detector._update_vector_cache(articles)
+    
+    # A few articles don't cover the language yet: the check refits
+    for _ in range(3):
+        new_text = detector._clean_text(_text(rng))
+        np.testing.assert_allclose(
+            _cached_scores(detector, new_text, articles),
+            _fit_with_query_scores(detector, new_text, articles),
+            atol=1e-5
+        )
+
+
+def test_new_words_score_like_fit_with_query():
+    rng = np.random.default_rng(1)
+    articles = _articles(rng, 300)
+    detector = DuplicateDetector()
+    detector._update_vector_cache(articles)
+    
+    new_text = detector._clean_text(_text(rng, new_words=30))
+    assert not detector._vocabulary_covers([new_text])
+    np.testing.assert_allclose(
+        _cached_scores(detector, new_text, articles),
+        _fit_with_query_scores(detector, new_text, articles),
+        atol=1e-5
+    )
+
+
+def test_covered_text_reuses_fit_close_to_fit_with_query():
+    rng = np.random.default_rng(2)
+    articles = _articles(rng, 300)
+    detector = DuplicateDetector()
+    detector._update_vector_cache(articles)
+    vocabulary = detector.vectorizer.vocabulary_
+    
+    for article in articles[:5]:
+        # Near-duplicate of an article: its text with a few words swapped
+        words = detector._prepare_article_text(article).split()
+        for i in rng.choice(len(words), size=10, replace=False):
+            words[i] = rng.choice(_WORDS[:500])
+        new_text = " ".join(words)
+        
+        cached = _cached_scores(detector, new_text, articles)
+        expected = _fit_with_query_scores(detector, new_text, articles)
+        assert detector.vectorizer.vocabulary_ is vocabulary  # Not refitted
+        np.testing.assert_allclose(cached, expected, atol=0.03)
+        assert np.argmax(cached) == np.argmax(expected) == int(article.id)